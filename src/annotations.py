@@ -17,6 +17,8 @@ from PySide2.QtGui import QPainter, QPen, QColor, QBrush, QFont, QPainterPath
 import math
 from typing import Tuple, List, Optional
 
+from .ui_cache import cached_font
+
 # Import FAST for MeshVertex and MeshLine in Measure classes
 try:
     import fast
@@ -858,14 +860,18 @@ class AnnotationOverlay(QWidget):
     preview_updated = Signal(str, list)  # Emitted when preview changes (tool_type, points)
     preview_cleared = Signal()  # Emitted when preview is cleared
     
+    # Pen width plus antialiasing slack around preview shapes, in pixels
+    PREVIEW_MARGIN = 4
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents, True)  # Default transparent, enable only for annotation/W/L modes
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setMouseTracking(True)
         
-        self.annotations = []
-        self.measurements = []  # Store measurements separately
+        # Keyed by id (insertion ordered), so removal/lookup is a hash probe
+        self.annotations = {}  # annotation.id -> Annotation
+        self.measurements = {}  # measure.id -> Measure (stored separately)
         self.current_annotation = None
         self.current_measure = None  # Current measurement being drawn
         self.current_tool = None
@@ -882,6 +888,9 @@ class AnnotationOverlay(QWidget):
         
         # Coordinate converter for image-to-widget transformation
         self._coord_converter = None
+        
+        # Widget area the preview covered at the last mouse-move repaint
+        self._preview_rect = QRect()
     
     def set_coord_converter(self, converter):
         """Set the coordinate converter for image-to-widget transformation."""
@@ -921,13 +930,13 @@ class AnnotationOverlay(QWidget):
         painter.setRenderHint(QPainter.TextAntialiasing)
         
         # ===== DRAW COMPLETED ANNOTATIONS =====
-        for annotation in self.annotations:
+        for annotation in self.annotations.values():
             if not annotation.visible:
                 continue
             self._draw_annotation_with_transform(painter, annotation)
         
         # ===== DRAW COMPLETED MEASUREMENTS =====
-        for measure in self.measurements:
+        for measure in self.measurements.values():
             if not measure.visible or not measure.completed:
                 continue
             self._draw_measure_with_transform(painter, measure)
@@ -936,7 +945,7 @@ class AnnotationOverlay(QWidget):
         self._draw_preview_with_transform(painter)
         
         # ===== DRAW MEASUREMENT TEXT LABELS =====
-        for measure in self.measurements:
+        for measure in self.measurements.values():
             if not measure.visible or not measure.completed:
                 continue
             self._draw_measure_label(painter, measure)
@@ -1050,6 +1059,34 @@ class AnnotationOverlay(QWidget):
                 path.closeSubpath()
                 painter.drawPath(path)
     
+    def _preview_bounds(self):
+        """Widget-space bounding rect of the shape being drawn (empty if none)."""
+        points = []
+        if self.is_drawing and self.current_annotation is not None:
+            annotation = self.current_annotation
+            points.extend(annotation.get_corners() if hasattr(annotation, 'get_corners') else annotation.points)
+        if self.is_drawing and self.current_measure is not None:
+            points.extend(self.current_measure.points)
+        if self._multi_points:
+            points.extend(self._multi_points)
+            if self._current_mouse_pos:
+                points.append(self._current_mouse_pos)
+        if not points:
+            return QRect()
+        
+        transformed = [self._transform_point(p[0], p[1]) for p in points]
+        xs = [p[0] for p in transformed]
+        ys = [p[1] for p in transformed]
+        margin = self.PREVIEW_MARGIN
+        return QRect(QPoint(int(min(xs)) - margin, int(min(ys)) - margin),
+                     QPoint(int(max(xs)) + margin, int(max(ys)) + margin))
+    
+    def _update_preview(self):
+        """Repaint only the area the preview covered before and covers now."""
+        rect = self._preview_bounds()
+        self.update(rect.united(self._preview_rect))
+        self._preview_rect = rect
+    
     def _draw_preview_with_transform(self, painter):
         """Draw preview for current drawing operation with coordinate transformation."""
         if not self.current_tool:
@@ -1128,7 +1165,7 @@ class AnnotationOverlay(QWidget):
         qcolor = QColor(int(color[0] * 255), int(color[1] * 255), int(color[2] * 255))
         
         # Draw text with background for readability
-        font = QFont("Arial", 12, QFont.Bold)
+        font = cached_font("Arial", 12, QFont.Bold)
         painter.setFont(font)
         
         # Calculate text rect
@@ -1266,7 +1303,7 @@ class AnnotationOverlay(QWidget):
                     measure.add_point(pt[0], pt[1])
                 measure.complete()
                 
-                self.measurements.append(measure)
+                self.measurements[measure.id] = measure
                 self.measure_added.emit(measure)
                 self._multi_points = []
                 self.preview_cleared.emit()
@@ -1295,7 +1332,7 @@ class AnnotationOverlay(QWidget):
                 annotation.add_point(pt[0], pt[1])
             annotation.complete()
             
-            self.annotations.append(annotation)
+            self.annotations[annotation.id] = annotation
             self.annotation_added.emit(annotation)
             self._multi_points = []
             self._current_mouse_pos = None
@@ -1314,7 +1351,7 @@ class AnnotationOverlay(QWidget):
                 measure.add_point(pt[0], pt[1])
             measure.complete()
             
-            self.measurements.append(measure)
+            self.measurements[measure.id] = measure
             self.measure_added.emit(measure)
             self._multi_points = []
             self._current_mouse_pos = None
@@ -1329,7 +1366,7 @@ class AnnotationOverlay(QWidget):
                 measure.add_point(pt[0], pt[1])
             measure.complete()
             
-            self.measurements.append(measure)
+            self.measurements[measure.id] = measure
             self.measure_added.emit(measure)
             self._multi_points = []
             self._current_mouse_pos = None
@@ -1364,14 +1401,14 @@ class AnnotationOverlay(QWidget):
             if tool in ('angle', 'area', 'perimeter') and len(self._multi_points) >= 1:
                 preview_points = list(self._multi_points) + [(img_x, img_y)]
                 self.preview_updated.emit(tool, preview_points)
-                self.update()
+                self._update_preview()
                 return
             
             # Drag tools: distance, ellipse
             if tool in ('distance', 'ellipse') and self.is_drawing and self.current_measure:
                 self.current_measure.update_last_point(img_x, img_y)
                 self.preview_updated.emit(tool, list(self.current_measure.points))
-                self.update()
+                self._update_preview()
                 return
         
         # ===== ANNOTATION TOOLS =====
@@ -1380,7 +1417,7 @@ class AnnotationOverlay(QWidget):
             # Emit preview with current points + mouse position
             preview_points = list(self._multi_points) + [(img_x, img_y)]
             self.preview_updated.emit('polygon', preview_points)
-            self.update()
+            self._update_preview()
             return
         
         if not self.is_drawing or not self.current_annotation:
@@ -1391,7 +1428,7 @@ class AnnotationOverlay(QWidget):
         # Emit preview update for FAST rendering
         self.preview_updated.emit(self.current_tool, list(self.current_annotation.points))
         
-        self.update()
+        self._update_preview()
     
     def mouseReleaseEvent(self, event):
         """Complete the annotation, measurement, or W/L adjustment."""
@@ -1415,7 +1452,7 @@ class AnnotationOverlay(QWidget):
             if tool in ('distance', 'ellipse') and self.is_drawing and self.current_measure:
                 self.is_drawing = False
                 self.current_measure.complete()
-                self.measurements.append(self.current_measure)
+                self.measurements[self.current_measure.id] = self.current_measure
                 self.measure_added.emit(self.current_measure)
                 self.current_measure = None
                 self.preview_cleared.emit()
@@ -1434,7 +1471,7 @@ class AnnotationOverlay(QWidget):
         
         if self.current_annotation:
             self.current_annotation.complete()
-            self.annotations.append(self.current_annotation)
+            self.annotations[self.current_annotation.id] = self.current_annotation
             self.annotation_added.emit(self.current_annotation)
             self.current_annotation = None
             # Clear preview in FAST
@@ -1449,8 +1486,7 @@ class AnnotationOverlay(QWidget):
     
     def remove_annotation(self, annotation):
         """Remove a specific annotation."""
-        if annotation in self.annotations:
-            self.annotations.remove(annotation)
+        if self.annotations.pop(annotation.id, None) is not None:
             self.update()
 
 
@@ -1499,7 +1535,7 @@ class LayerItemWidget(QWidget):
         # Column 1: Visibility toggle (24px)
         self.visibility_btn = QPushButton("\ue0be")  # eye icon
         self.visibility_btn.setFixedSize(24, 24)
-        self.visibility_btn.setFont(QFont("lucide", 12))
+        self.visibility_btn.setFont(cached_font("lucide", 12))
         self.visibility_btn.setStyleSheet("""
             QPushButton {
                 background-color: transparent;
@@ -1525,7 +1561,7 @@ class LayerItemWidget(QWidget):
         icon = icons.get(shape_type, '\ue27d')
         
         self.icon_label = QLabel(icon)
-        self.icon_label.setFont(QFont("lucide", 12))
+        self.icon_label.setFont(cached_font("lucide", 12))
         self.icon_label.setStyleSheet("color: #00ffff;")
         self.icon_label.setFixedWidth(24)
         self.icon_label.setAlignment(Qt.AlignCenter)
@@ -1571,7 +1607,7 @@ class LayerItemWidget(QWidget):
         # Column 6: Delete button (24px)
         self.delete_btn = QPushButton("\ue18d")  # trash-2 icon
         self.delete_btn.setFixedSize(24, 24)
-        self.delete_btn.setFont(QFont("lucide", 12))
+        self.delete_btn.setFont(cached_font("lucide", 12))
         self.delete_btn.setStyleSheet("""
             QPushButton {
                 background-color: transparent;
@@ -1721,7 +1757,7 @@ class LayerPanelWidget(QWidget):
         # Header: Global visibility toggle
         self.global_visibility_btn = QPushButton("\ue0be")  # eye icon
         self.global_visibility_btn.setFixedSize(24, 20)
-        self.global_visibility_btn.setFont(QFont("lucide", 10))
+        self.global_visibility_btn.setFont(cached_font("lucide", 10))
         self.global_visibility_btn.setStyleSheet("""
             QPushButton {
                 background-color: transparent;
@@ -1738,7 +1774,7 @@ class LayerPanelWidget(QWidget):
         
         # Header: Shape icon column
         icon_header = QLabel("\ue4fe")  # blocks icon
-        icon_header.setFont(QFont("lucide", 10))
+        icon_header.setFont(cached_font("lucide", 10))
         icon_header.setStyleSheet("color: #666666;")
         icon_header.setFixedWidth(24)
         icon_header.setAlignment(Qt.AlignCenter)
@@ -1768,7 +1804,7 @@ class LayerPanelWidget(QWidget):
         # Header: Clear all button
         self.clear_all_btn = QPushButton("\ue18d")  # trash-2 icon
         self.clear_all_btn.setFixedSize(24, 20)
-        self.clear_all_btn.setFont(QFont("lucide", 10))
+        self.clear_all_btn.setFont(cached_font("lucide", 10))
         self.clear_all_btn.setStyleSheet("""
             QPushButton {
                 background-color: transparent;
@@ -1822,12 +1858,12 @@ class LayerPanelWidget(QWidget):
         scroll_area.setWidget(self.items_container)
         main_layout.addWidget(scroll_area, 1)
         
-        self.annotations = []
-        self.item_widgets = {}
+        self.annotations = {}  # annotation.id -> Annotation
+        self.item_widgets = {}  # annotation.id -> LayerItemWidget
     
     def add_annotation(self, annotation):
         """Add an annotation to the list."""
-        self.annotations.append(annotation)
+        self.annotations[annotation.id] = annotation
         
         # Create custom item widget
         item_widget = LayerItemWidget(annotation)
@@ -1837,17 +1873,16 @@ class LayerPanelWidget(QWidget):
         
         # Insert before the stretch
         self.items_layout.insertWidget(self.items_layout.count() - 1, item_widget)
-        self.item_widgets[annotation] = item_widget
+        self.item_widgets[annotation.id] = item_widget
         
         self._update_count()
     
     def remove_annotation(self, annotation):
         """Remove an annotation from the list."""
-        if annotation in self.annotations:
-            self.annotations.remove(annotation)
+        self.annotations.pop(annotation.id, None)
         
-        if annotation in self.item_widgets:
-            widget = self.item_widgets.pop(annotation)
+        widget = self.item_widgets.pop(annotation.id, None)
+        if widget is not None:
             self.items_layout.removeWidget(widget)
             widget.deleteLater()
         
@@ -1855,7 +1890,7 @@ class LayerPanelWidget(QWidget):
     
     def clear_all(self):
         """Clear all annotations."""
-        for annotation in self.annotations[:]:
+        for annotation in list(self.annotations.values()):
             self.annotation_deleted.emit(annotation)
         
         self.annotations.clear()
@@ -1908,7 +1943,8 @@ class LayerPanelWidget(QWidget):
         """)
         
         # Toggle all item widgets
-        for annotation, widget in self.item_widgets.items():
+        for annotation_id, widget in self.item_widgets.items():
+            annotation = self.annotations[annotation_id]
             widget.is_visible = self.all_visible
             widget.visibility_btn.setText("\ue0be" if self.all_visible else "\ue0bf")
             
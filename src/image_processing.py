@@ -11,6 +11,13 @@ import numpy as np
 from typing import Dict, Optional, Tuple, Callable
 from enum import Enum
 
+# OpenCV is optional: used for SIMD color conversion when installed
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
 
 class ColormapType(Enum):
     """Available colormap types."""
@@ -626,6 +633,114 @@ FILTER_DISPLAY_NAMES = {
 }
 
 
+# ============================================================
+# Per-frame conversion helpers (shared by the processors below)
+# ============================================================
+
+def _get_buffer(buffer: Optional[np.ndarray], shape, dtype=np.uint8) -> np.ndarray:
+    """Return buffer if it matches shape/dtype, otherwise allocate a new one."""
+    if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+        return np.empty(shape, dtype=dtype)
+    return buffer
+
+
+def rgb_to_gray_u8(rgb: np.ndarray, out: Optional[np.ndarray] = None,
+                   scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert RGB (last axis) to uint8 BT.601 luma: (77 R + 150 G + 29 B) >> 8.
+    
+    Works on a single image or a whole volume. All arithmetic is done in
+    uint16 with out= buffers, so there is no float64 promotion and no
+    hidden temporaries.
+    
+    Args:
+        rgb: uint8 array of shape (..., 3)
+        out: Optional uint8 output buffer of shape rgb.shape[:-1]
+        scratch: Optional uint16 buffer of shape (2,) + rgb.shape[:-1]
+        
+    Returns:
+        Grayscale uint8 array (out if it was usable)
+    
+    Uses OpenCV when available, otherwise the integer numpy path.
+    """
+    shape = rgb.shape[:-1]
+    
+    # OpenCV's cvtColor is a vectorized BT.601 conversion writing uint8 directly
+    if CV2_AVAILABLE and rgb.dtype == np.uint8 and rgb.ndim in (3, 4):
+        out = _get_buffer(out, shape)
+        if rgb.ndim == 3:
+            cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY, dst=out)
+        else:
+            for i in range(rgb.shape[0]):
+                cv2.cvtColor(rgb[i], cv2.COLOR_RGB2GRAY, dst=out[i])
+        return out
+    
+    scratch = _get_buffer(scratch, (2,) + shape, np.uint16)
+    acc, tmp = scratch[0], scratch[1]
+    np.multiply(rgb[..., 0], 77, out=acc, dtype=np.uint16)
+    np.multiply(rgb[..., 1], 150, out=tmp, dtype=np.uint16)
+    np.add(acc, tmp, out=acc)
+    np.multiply(rgb[..., 2], 29, out=tmp, dtype=np.uint16)
+    np.add(acc, tmp, out=acc)
+    np.right_shift(acc, 8, out=acc)
+    out = _get_buffer(out, shape)
+    np.copyto(out, acc, casting='unsafe')
+    return out
+
+
+# Photometric interpretations whose first sample already is full-range
+# BT.601 luma, i.e. exactly what YBR -> RGB -> gray would recompute
+YBR_FULL_PHOTOMETRICS = frozenset({'YBR_FULL', 'YBR_FULL_422'})
+
+
+def ybr_full_to_gray_u8(ybr: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Grayscale from YBR_FULL / YBR_FULL_422 pixels (last axis Y, Cb, Cr).
+    
+    Fuses YBR -> RGB and RGB -> gray into one strided copy of the Y
+    channel: no RGB intermediate and no arithmetic. Matches the two-step
+    path to within integer rounding.
+    
+    Args:
+        ybr: uint8 array of shape (..., 3)
+        out: Optional uint8 output buffer of shape ybr.shape[:-1]
+    """
+    out = _get_buffer(out, ybr.shape[:-1])
+    np.copyto(out, ybr[..., 0], casting='unsafe')
+    return out
+
+
+def _clip_cast_u8(src: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Clip to [0, 255] and cast to uint8 in a single pass."""
+    out = _get_buffer(out, src.shape)
+    np.clip(src, 0, 255, out=out, casting='unsafe')
+    return out
+
+
+# In-plane rotations (about the z axis) for the 90° steps of the viewer's
+# rotate tool, as 4x4 homogeneous matrices for fast.Transform
+ROTATION_MATRICES = {
+    0: np.eye(4, dtype=np.float32),
+    90: np.array([[0, -1, 0, 0], [1, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], dtype=np.float32),
+    180: np.array([[-1, 0, 0, 0], [0, -1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], dtype=np.float32),
+    270: np.array([[0, 1, 0, 0], [-1, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], dtype=np.float32),
+}
+
+
+def rotation_about_center(angle, size, spacing):
+    """
+    ROTATION_MATRICES[angle] pivoted about the centre of an image of
+    `size` pixels and `spacing` (in the image's own physical coordinates).
+    """
+    center_x = float(size[0]) * float(spacing[0]) / 2
+    center_y = float(size[1]) * float(spacing[1]) / 2
+    to_center = np.eye(4, dtype=np.float32)
+    to_center[:2, 3] = (center_x, center_y)
+    from_center = np.eye(4, dtype=np.float32)
+    from_center[:2, 3] = (-center_x, -center_y)
+    return to_center @ ROTATION_MATRICES[angle] @ from_center
+
+
 # ============================================================
 # FAST PythonProcessObject for Frame Tapping (grayscale only)
 # ============================================================
@@ -651,8 +766,15 @@ def create_frame_tap_processor():
             self._lock = threading.Lock()
             self._latest_frame = None
             self._latest_info = None
+            self._info_key = None  # (size, spacing) the cached info was built for
             self._frame_id = 0
             self._enabled = True
+            self._first_frame_callback = None
+            self._rotation = 0
+            # Rotated transform for the last input geometry:
+            # (rotation, size, spacing, input matrix) -> (fast.Transform, matrix)
+            self._rotation_key = None
+            self._rotation_transform = None
 
         def setEnabled(self, enabled: bool):
             if enabled != self._enabled:
@@ -662,6 +784,38 @@ def create_frame_tap_processor():
         def isEnabled(self) -> bool:
             return self._enabled
 
+        def setFirstFrameCallback(self, callback: Optional[Callable[[], None]]):
+            """
+            Call callback once, right after the next frame has been passed
+            downstream. Runs on the computation thread, so GUI code should
+            hand it a queued Qt signal emit.
+            """
+            self._first_frame_callback = callback
+
+        def setRotation(self, angle: int):
+            """
+            Rotate output images in-plane by angle (0, 90, 180 or 270 degrees)
+            about the image centre.
+            
+            The rotation is composed with each image's own transform and
+            attached to the output image, so the renderer applies it on the
+            GPU; pixels are not touched. Input images are never modified.
+            Raises RuntimeError if this FAST build cannot create the transform.
+            """
+            angle %= 360
+            if angle == self._rotation:
+                return
+            try:
+                fast.Transform.create(ROTATION_MATRICES[angle])
+            except (AttributeError, TypeError) as e:
+                raise RuntimeError(f"Image transforms not supported: {e}")
+            self._rotation = angle
+            self._rotation_key = None
+            self.setModified(True)
+
+        def getRotation(self) -> int:
+            return self._rotation
+
         def getLatestFrame(self, copy: bool = True):
             """
             Return (frame, frame_id). Frame is 2D uint8 grayscale.
@@ -675,25 +829,69 @@ def create_frame_tap_processor():
         def getLatestImageInfo(self):
             """
             Return latest image info dict with size, spacing, transform_matrix.
+            
+            The dict is shared and replaced (never mutated) when the image
+            geometry changes, so callers must treat it as read-only.
             """
             with self._lock:
-                info = self._latest_info.copy() if self._latest_info else None
-                return info
+                return self._latest_info
 
         def execute(self):
             input_image = self.getInputData(0)
             if input_image is None:
                 return
 
-            input_array = np.asarray(input_image)
+            rotated = self._rotated_transform(input_image) if self._rotation else None
+            output_image = self._process(input_image, rotated[1] if rotated else None)
+            if rotated is not None:
+                if output_image is input_image:
+                    # Upstream images may be cached and re-sent: transform a copy
+                    output_image = fast.Image.createFromArray(np.asarray(input_image))
+                # Built from pixels only; keep the geometry the pivot was computed for
+                output_image.setSpacing(input_image.getSpacing())
+                output_image.setTransform(rotated[0])
+            self.addOutputData(0, output_image)
 
+            callback = self._first_frame_callback
+            if callback is not None:
+                self._first_frame_callback = None
+                callback()
+
+        def _rotated_transform(self, image):
+            """
+            Return (fast.Transform, matrix) of image's own transform followed
+            by the rotation about its centre; rebuilt only when that changes.
+            """
+            size = image.getSize()
+            spacing = image.getSpacing()
+            transform = image.getTransform()
+            if transform is not None:
+                base = np.asarray(transform.getMatrix(), dtype=np.float32)
+            else:
+                base = np.eye(4, dtype=np.float32)
+            key = (self._rotation, tuple(size), tuple(spacing), base.tobytes())
+            if key != self._rotation_key:
+                matrix = base @ rotation_about_center(self._rotation, size, spacing)
+                self._rotation_transform = (fast.Transform.create(matrix), matrix)
+                self._rotation_key = key
+            return self._rotation_transform
+
+        def _process(self, input_image, rotation_matrix=None):
+            """
+            Capture the frame for the UI and return the image to pass on.
+            rotation_matrix, if given, is the transform the output will carry.
+            """
             if not self._enabled:
-                output_image = fast.Image.createFromArray(input_array)
-                self.addOutputData(0, output_image)
-                return
+                return input_image
+
+            input_array = np.asarray(input_image)
 
+            # Single-channel inputs are used as views; a copy is only made
+            # when the view is not C-contiguous (or needs a dtype cast)
+            untouched = True
             if input_array.ndim == 3 and input_array.shape[2] == 3:
-                gray = np.mean(input_array, axis=2).astype(np.uint8)
+                gray = rgb_to_gray_u8(input_array)
+                untouched = False
             elif input_array.ndim == 3 and input_array.shape[2] == 1:
                 gray = input_array[:, :, 0]
             elif input_array.ndim == 2:
@@ -702,28 +900,45 @@ def create_frame_tap_processor():
                 gray = input_array
 
             if gray.dtype != np.uint8:
-                gray = np.clip(gray, 0, 255).astype(np.uint8)
+                gray = _clip_cast_u8(gray)
+                untouched = False
+            elif not gray.flags.c_contiguous:
+                gray = np.ascontiguousarray(gray)
 
-            with self._lock:
-                self._latest_frame = np.ascontiguousarray(gray)
-                try:
-                    size = input_image.getSize()
-                    spacing = input_image.getSpacing()
-                    transform = input_image.getTransform()
-                    transform_matrix = transform.getMatrix() if transform else None
-                except Exception:
-                    size = None
-                    spacing = None
-                    transform_matrix = None
-                self._latest_info = {
+            # Geometry rarely changes within a stream: only marshal the
+            # transform and rebuild the info dict when size/spacing differ
+            try:
+                size = input_image.getSize()
+                spacing = input_image.getSpacing()
+                info_key = (tuple(size), tuple(spacing), self._rotation)
+            except Exception:
+                size = spacing = info_key = None
+            info = self._latest_info
+            if info is None or info_key is None or info_key != self._info_key:
+                transform_matrix = rotation_matrix
+                if transform_matrix is None:
+                    try:
+                        transform = input_image.getTransform()
+                        transform_matrix = transform.getMatrix() if transform else None
+                    except Exception:
+                        transform_matrix = None
+                info = {
                     "size": size,
                     "spacing": spacing,
                     "transform_matrix": transform_matrix,
                 }
+
+            with self._lock:
+                self._latest_frame = gray
+                self._latest_info = info
+                self._info_key = info_key
                 self._frame_id += 1
 
-            output_image = fast.Image.createFromArray(gray)
-            self.addOutputData(0, output_image)
+            # Pixels untouched (already grayscale uint8): forward the input as-is
+            if untouched:
+                return input_image
+
+            return fast.Image.createFromArray(gray)
 
     return FrameTapProcessor
 
@@ -761,14 +976,27 @@ def create_colormap_processor():
             # Initialize colormap manager and LUT
             self._colormap_manager = ColormapManager()
             self._current_colormap = ColormapType.GRAYSCALE
-            self._lut = self._colormap_manager.get_colormap(ColormapType.GRAYSCALE)
+            self._lut = self._load_lut(ColormapType.GRAYSCALE)
             self._enabled = True
             
+            # Reused grayscale buffers (only feed the LUT lookup)
+            self._gray_buffer = None
+            self._gray_scratch = None
+            # Reused RGB output buffer (createFromArray copies the pixels)
+            self._rgb_buffer = None
+        
+        def _load_lut(self, colormap_type: ColormapType) -> np.ndarray:
+            """Fetch a LUT as a C-contiguous (256, 3) uint8 table."""
+            lut = np.ascontiguousarray(
+                self._colormap_manager.get_colormap(colormap_type), dtype=np.uint8)
+            assert lut.shape == (256, 3)
+            return lut
+            
         def setColormap(self, colormap_type: ColormapType):
             """Set the colormap to use for conversion."""
             if colormap_type != self._current_colormap:
                 self._current_colormap = colormap_type
-                self._lut = self._colormap_manager.get_colormap(colormap_type)
+                self._lut = self._load_lut(colormap_type)
                 self.setModified(True)
         
         def getColormap(self) -> ColormapType:
@@ -793,20 +1021,22 @@ def create_colormap_processor():
             if input_image is None:
                 return
             
-            # Get numpy array from FAST image
-            input_array = np.asarray(input_image)
-            
             # Check if grayscale passthrough (no conversion needed)
             if not self._enabled or self._current_colormap == ColormapType.GRAYSCALE:
-                # Pass through unchanged
-                output_image = fast.Image.createFromArray(input_array)
-                self.addOutputData(0, output_image)
+                # Pass through unchanged (no pixel copy)
+                self.addOutputData(0, input_image)
                 return
             
+            # Get numpy array from FAST image (only once pixels are needed)
+            input_array = np.asarray(input_image)
+            
             # Handle different input shapes
             if input_array.ndim == 3 and input_array.shape[2] == 3:
                 # Already RGB, convert to grayscale first
-                gray = np.mean(input_array, axis=2).astype(np.uint8)
+                self._gray_scratch = _get_buffer(
+                    self._gray_scratch, (2,) + input_array.shape[:2], np.uint16)
+                gray = self._gray_buffer = rgb_to_gray_u8(
+                    input_array, self._gray_buffer, self._gray_scratch)
             elif input_array.ndim == 3 and input_array.shape[2] == 1:
                 # Single channel 3D array, squeeze to 2D
                 gray = input_array[:, :, 0]
@@ -815,19 +1045,17 @@ def create_colormap_processor():
                 gray = input_array
             else:
                 # Unsupported format, pass through
-                output_image = fast.Image.createFromArray(input_array)
-                self.addOutputData(0, output_image)
+                self.addOutputData(0, input_image)
                 return
             
             # Ensure uint8 for LUT indexing
             if gray.dtype != np.uint8:
-                gray = np.clip(gray, 0, 255).astype(np.uint8)
+                gray = self._gray_buffer = _clip_cast_u8(gray, self._gray_buffer)
             
-            # Apply LUT (vectorized operation - very fast)
-            rgb = self._lut[gray]  # Shape: (H, W, 3)
-            
-            # Ensure contiguous array
-            rgb = np.ascontiguousarray(rgb)
+            # Apply LUT (vectorized operation - very fast) into the pooled
+            # C-contiguous (H, W, 3) buffer
+            rgb = self._rgb_buffer = _get_buffer(self._rgb_buffer, gray.shape + (3,))
+            np.take(self._lut, gray, axis=0, out=rgb, mode='clip')
             
             # Create FAST image from RGB array
             output_image = fast.Image.createFromArray(rgb)
@@ -914,27 +1142,21 @@ def create_filter_processor():
             if input_image is None:
                 return
             
-            # Get numpy array from FAST image
-            input_array = np.asarray(input_image)
-            
             # Check if filter passthrough (no processing needed)
             if not self._enabled or self._current_filter == FilterType.NONE:
-                # Pass through unchanged
-                output_image = fast.Image.createFromArray(input_array)
-                self.addOutputData(0, output_image)
+                # Pass through unchanged (no pixel copy)
+                self.addOutputData(0, input_image)
                 return
             
-            # Handle RGB images - convert to grayscale for filtering
+            # Get numpy array from FAST image (only once pixels are needed)
+            input_array = np.asarray(input_image)
+            
+            # Handle RGB images - filter each channel independently
             is_rgb = input_array.ndim == 3 and input_array.shape[2] == 3
             if is_rgb:
-                # Filter on luminance channel, then apply to all channels
-                gray = np.mean(input_array, axis=2).astype(np.uint8)
-                filtered = self._filter_processor.apply_filter(gray)
-                # Scale RGB by filter result / original gray ratio
-                with np.errstate(divide='ignore', invalid='ignore'):
-                    ratio = np.where(gray > 0, filtered.astype(np.float32) / gray.astype(np.float32), 1.0)
-                    ratio = np.clip(ratio, 0, 2)  # Limit ratio to prevent overflow
-                result = np.clip(input_array * ratio[:, :, np.newaxis], 0, 255).astype(np.uint8)
+                result = np.empty(input_array.shape, dtype=np.uint8)
+                for c in range(3):
+                    result[:, :, c] = self._filter_processor.apply_filter(input_array[:, :, c])
             else:
                 # Grayscale image - filter directly
                 result = self._filter_processor.apply_filter(input_array)
@@ -1,16 +1,22 @@
 """
 Async loaders module for ultrasound imaging software.
 
-Provides background loading of DICOM and video files without blocking the UI.
+Provides background loading of DICOM, video and other playback files
+without blocking the UI.
 """
 
-from .dicom_loader import DicomLoadWorker, DicomLoadResult
+from .dicom_loader import DicomLoadWorker, DicomLoadResult, read_dicom_header, forget_dicom_header
 from .video_loader import VideoLoadWorker
+from .pipeline_loader import PipelineLoadWorker, PipelineLoadResult
 from .progress_dialog import LoadProgressDialog
 
 __all__ = [
     'DicomLoadWorker',
     'DicomLoadResult', 
+    'read_dicom_header',
+    'forget_dicom_header',
     'VideoLoadWorker',
+    'PipelineLoadWorker',
+    'PipelineLoadResult',
     'LoadProgressDialog',
 ]
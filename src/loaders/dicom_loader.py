@@ -4,14 +4,111 @@ Async DICOM loader using QThread.
 Provides non-blocking loading of DICOM files with progress reporting.
 """
 
+import multiprocessing
 import os
-import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, as_completed,
+    TimeoutError as FuturesTimeoutError,
+)
+from multiprocessing import shared_memory
 import numpy as np
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
+import fast
+import pydicom
+from pydicom.encaps import generate_pixel_data_frame
+from pydicom.pixel_data_handlers.util import convert_color_space
 from PySide2.QtCore import QThread, Signal
 
+from ..image_processing import YBR_FULL_PHOTOMETRICS, rgb_to_gray_u8, ybr_full_to_gray_u8
+from ..pipelines import NumpyImageSource, classify_transfer_syntax, decode_dicom_frame
+from ..pixel_decode import decode_pixels
+
+
+# Tags read during the metadata stage; everything else is skipped by pydicom.
+# Includes the study browser's hierarchy attributes so one header read serves both.
+METADATA_TAGS = [
+    'PatientName', 'PatientID', 'StudyDate', 'StudyDescription',
+    'SeriesNumber', 'SeriesDescription', 'Modality', 'Manufacturer',
+    'InstitutionName', 'NumberOfFrames', 'Columns', 'Rows', 'PixelSpacing',
+    'SequenceOfUltrasoundRegions', 'PhotometricInterpretation',
+    'FrameTime', 'RecommendedDisplayFrameRate', 'TransferSyntaxUID',
+]
+
+
+# Header datasets of recently read files, so re-selecting a file (or one
+# whose header was prefetched by the study browser) skips the parse
+HEADER_CACHE_LIMIT = 256
+_header_cache = OrderedDict()  # filepath -> ((mtime_ns, size), Dataset)
+_header_cache_lock = threading.Lock()
+
+
+def read_dicom_header(filepath: str):
+    """
+    Return the header dataset (METADATA_TAGS only, no pixel data) of a
+    DICOM file. Cached per path; a changed file on disk is re-read.
+    Safe to call from worker threads.
+    """
+    st = os.stat(filepath)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _header_cache_lock:
+        entry = _header_cache.get(filepath)
+        if entry is not None and entry[0] == stamp:
+            _header_cache.move_to_end(filepath)
+            return entry[1]
+    
+    ds = pydicom.dcmread(
+        filepath,
+        stop_before_pixels=True,
+        force=True,
+        specific_tags=METADATA_TAGS,
+    )
+    with _header_cache_lock:
+        _header_cache[filepath] = (stamp, ds)
+        _header_cache.move_to_end(filepath)
+        while len(_header_cache) > HEADER_CACHE_LIMIT:
+            _header_cache.popitem(last=False)
+    return ds
+
+
+def forget_dicom_header(filepath: str):
+    """Drop the cached header of filepath (e.g. after the file was deleted)."""
+    with _header_cache_lock:
+        _header_cache.pop(filepath, None)
+
+
+# Process pool for pixel decoding (created on first use)
+_decode_pool = None
+
+
+def _get_decode_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared decode pool, creating it on first use.
+    
+    Workers are spawned, not forked: by now Qt, FAST's computation thread
+    and the frame decode threads are running, and a forked child could
+    inherit a lock one of them held and deadlock on it.
+    """
+    global _decode_pool
+    if _decode_pool is None:
+        _decode_pool = ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return _decode_pool
+
+
+def _release_decoded_pixels(future):
+    """Free the shared memory of a decode result nobody will collect."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    shm = shared_memory.SharedMemory(name=future.result()[0])
+    shm.close()
+    shm.unlink()
+
 
 @dataclass
 class DicomLoadResult:
@@ -51,6 +148,7 @@ class DicomLoadWorker(QThread):
         self.filepath = filepath
         self.loop = loop
         self._cancelled = False
+        self._ds_meta = None  # Header dataset cached by the metadata stage
     
     def cancel(self):
         """Request cancellation of the loading operation."""
@@ -77,10 +175,6 @@ class DicomLoadWorker(QThread):
         Returns:
             DicomLoadResult with streamer and metadata
         """
-        import fast
-        import pydicom
-        from pydicom.pixel_data_handlers.util import convert_color_space
-        
         result = DicomLoadResult(
             success=False,
             filepath=self.filepath
@@ -94,7 +188,8 @@ class DicomLoadWorker(QThread):
             return result
         
         try:
-            ds = pydicom.dcmread(self.filepath, stop_before_pixels=True, force=True)
+            ds = read_dicom_header(self.filepath)
+            self._ds_meta = ds
             
             # Extract metadata
             result.metadata = {
@@ -171,12 +266,17 @@ class DicomLoadWorker(QThread):
             return result
         
         try:
-            # Read full DICOM with pixel data
-            ds = pydicom.dcmread(self.filepath, force=True)
-            
-            if not hasattr(ds, 'PixelData'):
-                result.error_message = "DICOM 檔案沒有像素資料"
-                return result
+            # The cached header carries every tag used below. The full
+            # dataset is only parsed when pixels are accessed in this
+            # thread; the subprocess decode reads the file itself.
+            header = self._ds_meta
+            num_frames = int(header.get('NumberOfFrames', 1) or 1)
+            ds = None
+            if not is_compressed or num_frames > 1:
+                ds = self._read_pixel_dataset()
+                if ds is None:
+                    result.error_message = "DICOM 檔案沒有像素資料"
+                    return result
             
             self.progress.emit(30)
             
@@ -185,7 +285,30 @@ class DicomLoadWorker(QThread):
             
             # Stage 4: Decompress pixel array
             self.stage_changed.emit("讀取像素陣列...")
-            arr = ds.pixel_array
+            arr = None
+            if not is_compressed:
+                arr = self._map_uncompressed_pixels(ds, num_frames)
+            elif num_frames > 1:
+                try:
+                    arr = self._decode_frames_parallel(ds, num_frames)
+                except Exception as e:
+                    print(f"Parallel frame decode failed: {e}, falling back to pixel_array")
+                    arr = None
+                if self._cancelled:
+                    return result
+            if arr is None:
+                try:
+                    arr = self._decode_in_subprocess()
+                except Exception as e:
+                    print(f"Subprocess decode failed: {e}, decoding in loader thread")
+                    if ds is None:
+                        ds = self._read_pixel_dataset()
+                    if ds is None:
+                        result.error_message = "DICOM 檔案沒有像素資料"
+                        return result
+                    arr = ds.pixel_array
+                if arr is None:
+                    return result
             
             self.progress.emit(50)
             
@@ -193,8 +316,11 @@ class DicomLoadWorker(QThread):
                 return result
             
             # Handle color space conversion
-            photometric = ds.get('PhotometricInterpretation', 'MONOCHROME2')
-            if 'YBR' in photometric:
+            photometric = header.get('PhotometricInterpretation', 'MONOCHROME2')
+            is_rgb = (arr.ndim == 4 and arr.shape[3] == 3) or (arr.ndim == 3 and arr.shape[2] == 3)
+            # YBR_FULL luma is taken straight from Y; no RGB intermediate
+            fused_ybr = is_rgb and photometric in YBR_FULL_PHOTOMETRICS
+            if 'YBR' in photometric and not fused_ybr:
                 self.stage_changed.emit("轉換色彩空間...")
                 arr = convert_color_space(arr, photometric, 'RGB')
             
@@ -203,21 +329,23 @@ class DicomLoadWorker(QThread):
             if self._cancelled:
                 return result
             
-            # Convert to grayscale if needed
-            if arr.ndim == 4 and arr.shape[3] == 3:
+            # Convert to grayscale if needed (written directly as uint8)
+            if fused_ybr:
                 self.stage_changed.emit("轉換為灰階...")
-                arr = np.mean(arr, axis=3).astype(np.uint8)
-            elif arr.ndim == 3 and arr.shape[2] == 3:
+                arr = ybr_full_to_gray_u8(arr)
+            elif is_rgb:
                 self.stage_changed.emit("轉換為灰階...")
-                arr = np.mean(arr, axis=2).astype(np.uint8)
+                arr = rgb_to_gray_u8(arr)
+            elif arr.dtype != np.uint8:
+                arr = arr.astype(np.uint8)
             
             # Ensure proper shape
-            if ds.get('NumberOfFrames', 1) == 1:
+            if header.get('NumberOfFrames', 1) == 1:
                 if arr.ndim == 2:
                     arr = arr[np.newaxis, ...]
             
-            if arr.dtype != np.uint8:
-                arr = arr.astype(np.uint8)
+            # Single contiguous volume (no-op when already in that layout)
+            arr = np.ascontiguousarray(arr)
             
             result.num_frames = arr.shape[0]
             
@@ -226,66 +354,25 @@ class DicomLoadWorker(QThread):
             if self._cancelled:
                 return result
             
-            # Stage 5: Save to temporary MHD files
-            self.stage_changed.emit("寫入暫存檔案...")
-            temp_dir = tempfile.mkdtemp(prefix="fast_ultrasound_")
-            result.temp_dir = temp_dir
-            
-            total_frames = arr.shape[0]
-            for i in range(total_frames):
-                if self._cancelled:
-                    return result
-                
-                frame = arr[i]
-                raw_path = os.path.join(temp_dir, f"frame_{i}.raw")
-                mhd_path = os.path.join(temp_dir, f"frame_{i}.mhd")
-                
-                # Write raw data
-                frame.astype(np.uint8).tofile(raw_path)
-                
-                # Write MHD header
-                h, w = frame.shape
-                with open(mhd_path, 'w') as f:
-                    f.write(f"ObjectType = Image\n")
-                    f.write(f"NDims = 2\n")
-                    f.write(f"DimSize = {w} {h}\n")
-                    f.write(f"ElementType = MET_UCHAR\n")
-                    f.write(f"ElementDataFile = frame_{i}.raw\n")
-                
-                # Update progress (60-90%)
-                progress = 60 + int(30 * (i + 1) / total_frames)
-                self.progress.emit(progress)
-            
-            file_pattern = os.path.join(temp_dir, "frame_#.mhd")
-            
-            self.progress.emit(90)
-            
-            if self._cancelled:
-                return result
-            
-            # Stage 6: Create ImageFileStreamer
+            # Stage 5: Create in-memory streamer (no temp files)
             self.stage_changed.emit("建立串流管道...")
+            self.progress.emit(80)
             
             # Get framerate
             framerate = 30
             try:
-                fr = ds.get('FrameTime', None)
+                fr = header.get('FrameTime', None)
                 if fr:
                     framerate = int(1000 / float(fr))
                 else:
-                    fr = ds.get('RecommendedDisplayFrameRate', 30)
+                    fr = header.get('RecommendedDisplayFrameRate', 30)
                     framerate = int(fr) if fr else 30
-            except:
+            except (TypeError, ValueError, ZeroDivisionError):
                 pass
             
             result.framerate = framerate
             
-            streamer = fast.ImageFileStreamer.create(
-                file_pattern,
-                loop=self.loop,
-                framerate=framerate,
-                useTimestamps=False
-            )
+            streamer = NumpyImageSource.create(arr, framerate=framerate, loop=self.loop)
             
             result.streamer = streamer
             result.success = True
@@ -298,12 +385,122 @@ class DicomLoadWorker(QThread):
         
         return result
     
+    def _map_uncompressed_pixels(self, ds, num_frames: int) -> Optional[np.ndarray]:
+        """
+        Memory-map 8-bit monochrome PixelData straight from the DICOM file.
+        
+        Avoids holding the whole cine in RAM: pages are read from the source
+        file on demand while the frames are written out.
+        
+        Returns:
+            Read-only (N, H, W) uint8 memmap, or None if the layout is not
+            a plain 8-bit single-sample volume
+        """
+        if int(ds.get('BitsAllocated', 0)) != 8 or int(ds.get('SamplesPerPixel', 1)) != 1:
+            return None
+        
+        elem = ds.get_item('PixelData')
+        offset = getattr(elem, 'value_tell', None)
+        if offset is None:
+            return None
+        
+        rows, cols = int(ds.Rows), int(ds.Columns)
+        if elem.length < num_frames * rows * cols:
+            return None
+        
+        return np.memmap(
+            self.filepath,
+            dtype=np.uint8,
+            mode='r',
+            offset=offset,
+            shape=(num_frames, rows, cols),
+        )
+    
+    def _decode_frames_parallel(self, ds, num_frames: int) -> Optional[np.ndarray]:
+        """
+        Decode an encapsulated multi-frame PixelData one frame per task.
+        
+        The JPEG / JPEG 2000 codecs release the GIL, so frames decode in
+        parallel across cores. Progress is reported from 30% to 50%.
+        
+        Returns:
+            Array shaped (N, H, W[, C]), or None if cancelled
+        """
+        encoded_frames = list(generate_pixel_data_frame(ds.PixelData, num_frames))
+        
+        def decode(index):
+            if self._cancelled:
+                return index, None
+            return index, decode_dicom_frame(ds, encoded_frames[index])
+        
+        arr = None
+        total = len(encoded_frames)
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            futures = [pool.submit(decode, i) for i in range(total)]
+            for done, future in enumerate(as_completed(futures), start=1):
+                index, frame = future.result()
+                if frame is None:
+                    for pending in futures:
+                        pending.cancel()
+                    return None
+                if arr is None:
+                    arr = np.empty((total,) + frame.shape, dtype=frame.dtype)
+                arr[index] = frame
+                self.progress.emit(30 + int(20 * done / total))
+        
+        return arr
+    
+    def _read_pixel_dataset(self):
+        """
+        Read the full dataset with PixelData deferred (only pulled in when
+        it has to be decoded in memory). Returns None without PixelData.
+        """
+        ds = pydicom.dcmread(self.filepath, force=True, defer_size='1 MB')
+        if 'PixelData' not in ds:
+            return None
+        return ds
+    
+    def _decode_in_subprocess(self) -> Optional[np.ndarray]:
+        """
+        Decode the full pixel array in the shared process pool.
+        
+        Keeps pure-Python decoders from holding this process's GIL. The
+        future is polled so cancellation stays responsive; progress creeps
+        from 30% towards 50% while waiting.
+        
+        Returns:
+            Decoded array, or None if cancelled
+        """
+        future = _get_decode_pool().submit(decode_pixels, self.filepath)
+        
+        progress = 30
+        while True:
+            try:
+                name, shape, dtype = future.result(timeout=0.1)
+                break
+            except FuturesTimeoutError:
+                if self._cancelled:
+                    if not future.cancel():
+                        future.add_done_callback(_release_decoded_pixels)
+                    return None
+                if progress < 49:
+                    progress += 1
+                    self.progress.emit(progress)
+        
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        return arr
+    
     def _is_dicom_compressed(self):
         """Check if DICOM file uses compressed transfer syntax."""
-        import pydicom
-        
         try:
-            ds = pydicom.dcmread(self.filepath, stop_before_pixels=True, force=True)
+            ds = self._ds_meta
+            if ds is None:
+                ds = read_dicom_header(self.filepath)
             
             ts_uid = None
             if hasattr(ds, 'file_meta') and hasattr(ds.file_meta, 'TransferSyntaxUID'):
@@ -312,27 +509,7 @@ class DicomLoadWorker(QThread):
             if ts_uid is None:
                 return True, None, "Unknown"
             
-            uncompressed = {
-                '1.2.840.10008.1.2': 'Implicit VR Little Endian',
-                '1.2.840.10008.1.2.1': 'Explicit VR Little Endian',
-                '1.2.840.10008.1.2.2': 'Explicit VR Big Endian',
-            }
-            
-            if ts_uid in uncompressed:
-                return False, ts_uid, uncompressed[ts_uid]
-            
-            compressed_names = {
-                '1.2.840.10008.1.2.5': 'RLE Lossless',
-                '1.2.840.10008.1.2.4.50': 'JPEG Baseline',
-                '1.2.840.10008.1.2.4.51': 'JPEG Extended',
-                '1.2.840.10008.1.2.4.70': 'JPEG Lossless',
-                '1.2.840.10008.1.2.4.80': 'JPEG-LS Lossless',
-                '1.2.840.10008.1.2.4.81': 'JPEG-LS Near-lossless',
-                '1.2.840.10008.1.2.4.90': 'JPEG 2000 Lossless',
-                '1.2.840.10008.1.2.4.91': 'JPEG 2000',
-            }
-            name = compressed_names.get(ts_uid, f'Compressed ({ts_uid})')
-            return True, ts_uid, name
+            return classify_transfer_syntax(ts_uid)
             
         except Exception as e:
             return True, None, "Unknown"
@@ -0,0 +1,77 @@
+"""
+Async playback pipeline loader using QThread.
+
+Builds the streamer for files that are neither DICOM nor video
+(image sequences, .mhd, ...) off the GUI thread. Only attaching the
+result to a viewport (renderers, view) is left to the GUI thread.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from PySide2.QtCore import QThread, Signal
+
+from ..pipelines import create_playback_pipeline
+
+
+@dataclass
+class PipelineLoadResult:
+    """Result object from playback pipeline construction."""
+    success: bool
+    filepath: str
+    streamer: Any = None  # FAST streamer (with any conversion kernels attached)
+    error_message: str = ""
+
+
+class PipelineLoadWorker(QThread):
+    """
+    Background worker running create_playback_pipeline.
+    
+    Signals:
+        finished_loading(PipelineLoadResult): Construction complete with result
+        error_occurred(str): Error message if construction raised
+    """
+    
+    finished_loading = Signal(object)  # PipelineLoadResult
+    error_occurred = Signal(str)
+    
+    def __init__(self, filepath: str, loop: bool = True, force_grayscale: bool = False, parent=None):
+        super().__init__(parent)
+        self.filepath = filepath
+        self.loop = loop
+        self.force_grayscale = force_grayscale
+        self._cancelled = False
+    
+    def cancel(self):
+        """Request cancellation; a streamer built after this is discarded."""
+        self._cancelled = True
+    
+    def is_cancelled(self) -> bool:
+        """Check if cancellation was requested."""
+        return self._cancelled
+    
+    def run(self):
+        """Execute the pipeline construction in background thread."""
+        try:
+            result = self._build_pipeline()
+            if not self._cancelled:
+                self.finished_loading.emit(result)
+        except Exception as e:
+            if not self._cancelled:
+                self.error_occurred.emit(str(e))
+    
+    def _build_pipeline(self) -> PipelineLoadResult:
+        """Create the streamer (no GL work happens here)."""
+        result = PipelineLoadResult(success=False, filepath=self.filepath)
+        streamer = create_playback_pipeline(
+            self.filepath,
+            loop=self.loop,
+            force_grayscale=self.force_grayscale,
+        )
+        if streamer is None:
+            result.error_message = "Failed to load file"
+            return result
+        
+        result.streamer = streamer
+        result.success = True
+        return result
@@ -5,11 +5,29 @@ Provides non-blocking loading of video files (AVI, MP4, etc.) with progress repo
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
+import fast
 from PySide2.QtCore import QThread, Signal
 
+from ..pipelines import VIDEO_EXTENSIONS
+
+
+# Thread pool for MovieStreamer construction.
+# The worker polls the future, so a cancel returns at once and an
+# abandoned streamer is simply dropped when its construction finishes.
+_create_pool = None
+
+
+def _get_create_pool() -> ThreadPoolExecutor:
+    """Return the shared streamer creation pool, creating it on first use."""
+    global _create_pool
+    if _create_pool is None:
+        _create_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="movie-streamer")
+    return _create_pool
+
 
 @dataclass
 class VideoLoadResult:
@@ -41,7 +59,7 @@ class VideoLoadWorker(QThread):
     error_occurred = Signal(str)
     
     # Supported video extensions
-    VIDEO_EXTENSIONS = ['.avi', '.mp4', '.mov', '.mkv', '.wmv', '.webm']
+    VIDEO_EXTENSIONS = VIDEO_EXTENSIONS
     
     def __init__(self, filepath: str, loop: bool = True, grayscale: bool = True, parent=None):
         super().__init__(parent)
@@ -81,21 +99,15 @@ class VideoLoadWorker(QThread):
         Returns:
             VideoLoadResult with streamer
         """
-        import fast
-        
         result = VideoLoadResult(
             success=False,
             filepath=self.filepath
         )
         
-        # Stage 1: Validate file
+        # Stage 1: Validate file (existence is checked by MovieStreamer itself)
         self.stage_changed.emit("驗證影片檔案...")
         self.progress.emit(10)
         
-        if not os.path.exists(self.filepath):
-            result.error_message = "檔案不存在"
-            return result
-        
         if self._cancelled:
             return result
         
@@ -103,18 +115,35 @@ class VideoLoadWorker(QThread):
         self.stage_changed.emit("建立影片串流器...")
         self.progress.emit(50)
         
+        if self._cancelled:
+            return result
+        
         try:
-            streamer = fast.MovieStreamer.create(
+            future = _get_create_pool().submit(
+                fast.MovieStreamer.create,
                 self.filepath,
                 grayscale=self.grayscale,
                 loop=self.loop
             )
+            while True:
+                try:
+                    streamer = future.result(timeout=0.05)
+                    break
+                except FuturesTimeoutError:
+                    if self._cancelled:
+                        future.cancel()
+                        return result
             
             result.streamer = streamer
             result.success = True
             self.progress.emit(100)
             
+        except (FileNotFoundError, OSError):
+            result.error_message = "檔案不存在"
         except Exception as e:
-            result.error_message = f"無法載入影片: {e}"
+            if not os.path.exists(self.filepath):
+                result.error_message = "檔案不存在"
+            else:
+                result.error_message = f"無法載入影片: {e}"
         
         return result
@@ -1,157 +1,610 @@
 import fast
 import os
-
-import fast
-import os
+import threading
+import time
+import traceback
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import pydicom
 import numpy as np
+from pydicom.dataset import Dataset
+from pydicom.encaps import encapsulate, generate_pixel_data_frame
+from pydicom.pixel_data_handlers.util import convert_color_space
+
+from .image_processing import YBR_FULL_PHOTOMETRICS, rgb_to_gray_u8, ybr_full_to_gray_u8
+
+def _produce_frames(source_ref, stop_event):
+    """
+    Producer loop for NumpyImageSource: mark the source modified once per
+    frame interval, so FAST re-executes it only when a new frame is due.
+    Holds only a weak reference, so a discarded source ends the thread.
+    """
+    while True:
+        source = source_ref()
+        if source is None:
+            return
+        interval = 1.0 / max(source.framerate, 1)
+        del source
+        if stop_event.wait(interval):
+            return
+        source = source_ref()
+        if source is None:
+            return
+        source.setModified(True)
+        del source
+
+
+# FAST Images kept for replay by all NumpyImageSources together. The numpy
+# volume stays resident as well, so this budget is what caching duplicates
+# (host bytes; FAST may add device copies on top)
+IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+_image_cache_bytes = 0
+_image_cache_lock = threading.Lock()
+
+
+def _reserve_image_cache(nbytes):
+    """Claim nbytes of the shared image cache budget. Returns False if it does not fit."""
+    global _image_cache_bytes
+    with _image_cache_lock:
+        if _image_cache_bytes + nbytes > IMAGE_CACHE_BYTES:
+            return False
+        _image_cache_bytes += nbytes
+        return True
+
+
+def _release_image_cache(nbytes):
+    """Return nbytes to the shared image cache budget."""
+    global _image_cache_bytes
+    with _image_cache_lock:
+        _image_cache_bytes -= nbytes
+
 
 class NumpyImageSource(fast.PythonProcessObject):
     """
     Streams frames from a numpy array (Frames, H, W).
-    Uses timer-based updates for animation.
+    Frames are picked from a wall clock, so execute() never blocks:
+    the frame shown is whichever one is due at the current time.
+    
+    Mirrors the playback controls of FAST's random access streamers
+    (pause, seek, looping, frame count) so the viewer can drive it the
+    same way as DICOMMultiFrameStreamer / ImageFileStreamer.
+    
+    While playing, a background producer thread marks the object modified
+    at the frame rate; execute() itself never re-flags itself.
     """
-    def __init__(self, data, framerate=30):
+    def __init__(self, data, framerate=30, loop=True):
         super().__init__()
         self.createOutputPort(0)
+        # Make the volume C-contiguous once, so every frame is a contiguous
+        # view that createFromArray can copy from directly
+        if data is not None and not data.flags['C_CONTIGUOUS']:
+            data = np.ascontiguousarray(data)
         self.data = data
         self.frame_idx = 0
         self.framerate = framerate
-        self.last_time = 0
-        
-    def execute(self):
-        import time
-        current_time = time.time()
+        self._loop = loop
+        self._paused = False
+        self._current_frame = 0
+        # Playback clock: (start time, frame shown at start time)
+        self._clock_start = None
+        self._clock_frame = 0
+        # Last emitted image, re-sent while the same frame is still due
+        self._last_image = None
+        self._last_image_idx = -1
+        # FAST images kept per frame index when the whole cine fits in the
+        # shared IMAGE_CACHE_BYTES budget, so looping playback allocates and
+        # uploads each frame only once
+        self._image_cache = {}
+        self._cache_images = None  # Decided from the first frame's size
+        # Frame-rate producer thread, running only while playing
+        self._producer = None
+        self._producer_stop = threading.Event()
+    
+    def getNrOfFrames(self):
+        return self.data.shape[0]
+    
+    def _get_frame(self, index):
+        """Return frame `index` as a C-contiguous 2D (or H, W, C) array."""
+        return self.data[index]
+    
+    def getCurrentFrameIndex(self):
+        return self._current_frame
+    
+    def setCurrentFrameIndex(self, index):
+        self.frame_idx = max(0, min(int(index), self.getNrOfFrames() - 1))
+        self._clock_start = None
+        self.setModified(True)
+    
+    def setPause(self, paused):
+        self._paused = paused
+        if paused:
+            self._stop_producer()
+        else:
+            self._clock_start = None
+            self.setModified(True)
+    
+    def getPause(self):
+        return self._paused
+    
+    def setLooping(self, loop):
+        self._loop = loop
+    
+    def setFramerate(self, framerate):
+        self.framerate = framerate
+        self._clock_start = None
+    
+    def _advance_clock(self):
+        """Move frame_idx to the frame due now. Returns False at end of a non-looping stream."""
+        now = time.perf_counter()
+        if self._clock_start is None:
+            self._clock_start = now
+            self._clock_frame = self.frame_idx
+            return True
         
-        # Control framerate
-        if self.last_time > 0:
-            elapsed = current_time - self.last_time
-            target_interval = 1.0 / self.framerate
-            if elapsed < target_interval:
-                time.sleep(target_interval - elapsed)
+        index = self._clock_frame + int((now - self._clock_start) * self.framerate)
+        nr_frames = self.getNrOfFrames()
+        if index >= nr_frames:
+            if not self._loop:
+                self.frame_idx = nr_frames - 1
+                return False
+            index %= nr_frames
+        self.frame_idx = index
+        return True
         
-        self.last_time = time.time()
+    def execute(self):
+        running = True
+        if not self._paused:
+            running = self._advance_clock()
         
-        frame_data = self.data[self.frame_idx]
-        frame_data = np.ascontiguousarray(frame_data)
+        if self.frame_idx != self._last_image_idx:
+            try:
+                image = self._image_cache.get(self.frame_idx)
+                if image is None:
+                    frame_data = self._get_frame(self.frame_idx)
+                    image = fast.Image.createFromArray(frame_data)
+                    if self._cache_images is None:
+                        total_bytes = frame_data.nbytes * self.getNrOfFrames()
+                        self._cache_images = _reserve_image_cache(total_bytes)
+                        if self._cache_images:
+                            weakref.finalize(self, _release_image_cache, total_bytes)
+                    if self._cache_images:
+                        self._image_cache[self.frame_idx] = image
+                    if self.frame_idx == 0:
+                        print(f"FAST Image Created: {image.getWidth()}x{image.getHeight()}, Channels: {image.getNrOfChannels()}, Type: {image.getDataType()}")
+                self._last_image = image
+                self._last_image_idx = self.frame_idx
+            except Exception as e:
+                print(f"Error creating FAST image at frame {self.frame_idx}: {e}")
+        if self._last_image is not None:
+            self.addOutputData(0, self._last_image)
         
-        try:
-            image = fast.Image.createFromArray(frame_data)
-            if self.frame_idx == 0:
-                print(f"FAST Image Created: {image.getWidth()}x{image.getHeight()}, Channels: {image.getNrOfChannels()}, Type: {image.getDataType()}")
-            self.addOutputData(0, image)
-        except Exception as e:
-            print(f"Error creating FAST image at frame {self.frame_idx}: {e}")
-            
-        # Loop through frames
-        self.frame_idx = (self.frame_idx + 1) % self.data.shape[0]
-        
-        # Mark as modified to trigger re-execution
-        self.setModified(True)
+        self._current_frame = self.frame_idx
+        if self._paused or not running:
+            self._stop_producer()
+        else:
+            self._start_producer()
+    
+    def _start_producer(self):
+        """Start the frame-rate producer thread if it is not running."""
+        if self._producer is not None and self._producer.is_alive():
+            return
+        self._producer_stop = threading.Event()
+        self._producer = threading.Thread(
+            target=_produce_frames,
+            args=(weakref.ref(self), self._producer_stop),
+            name="numpy-image-source",
+            daemon=True,
+        )
+        self._producer.start()
+    
+    def _stop_producer(self):
+        self._producer_stop.set()
+        self._producer = None
+    
+    def stop(self):
+        """Stop producing frames (playback can be resumed with setPause(False))."""
+        self._stop_producer()
 
 
 # Alias for compatibility
 NumpyStreamer = NumpyImageSource
 
-def save_frames_as_mhd(arr, temp_dir):
+# Image Pixel module attributes needed to decode a single encapsulated frame
+PIXEL_MODULE_TAGS = (
+    'Rows', 'Columns', 'SamplesPerPixel', 'PhotometricInterpretation',
+    'PlanarConfiguration', 'BitsAllocated', 'BitsStored', 'HighBit',
+    'PixelRepresentation',
+)
+
+
+def decode_dicom_frame(ds, encoded_frame):
+    """
+    Decode one encapsulated frame of a compressed multi-frame dataset.
+    
+    Builds a single-frame dataset sharing the file meta and Image Pixel
+    attributes of `ds`, so whichever pixel data handler is installed
+    (pylibjpeg, GDCM, Pillow) can decode it.
+    """
+    frame_ds = Dataset()
+    frame_ds.file_meta = ds.file_meta
+    frame_ds.is_little_endian = True
+    frame_ds.is_implicit_VR = False
+    for keyword in PIXEL_MODULE_TAGS:
+        if keyword in ds:
+            setattr(frame_ds, keyword, ds[keyword].value)
+    frame_ds.NumberOfFrames = 1
+    frame_ds.PixelData = encapsulate([encoded_frame])
+    frame_ds['PixelData'].is_undefined_length = True
+    return frame_ds.pixel_array
+
+
+_frame_decode_pool = None
+
+
+def _get_frame_decode_pool():
+    """Return the shared frame decode pool, creating it on first use."""
+    global _frame_decode_pool
+    if _frame_decode_pool is None:
+        _frame_decode_pool = ThreadPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 2) // 2),
+            thread_name_prefix="dicom-decode",
+        )
+    return _frame_decode_pool
+
+
+class DicomFrameStreamer(NumpyImageSource):
     """
-    Save numpy array frames as MHD files for FAST ImageFileStreamer.
-    Returns the file pattern path.
+    Streams a compressed multi-frame DICOM, decoding frames on demand.
+    
+    Only the compressed bitstreams are held in memory, so peak memory is
+    a handful of decoded frames instead of the whole cine and the first
+    frame is shown without waiting for the rest to decode. Frames around
+    the current one are decoded ahead of time on a shared thread pool and
+    kept in a small decoded-frame cache, so seeks and scrubbing land on an
+    already decoded frame. When the cache is full, the frames farthest
+    from the current position are evicted first.
+    
+    The prefetch window starts at a few frames on either side and grows in
+    the direction of travel while successive frames keep moving that way.
     """
-    import tempfile
-    import shutil
+    # Decoded frames kept around the current position
+    DECODED_CACHE_BYTES = 128 * 1024 * 1024
+    # Frames prefetched behind / initially ahead, and the most ever ahead
+    PREFETCH_MIN = 2
+    PREFETCH_MAX = 100
+    
+    def __init__(self, ds, framerate=30, loop=True, grayscale=True):
+        super().__init__(None, framerate=framerate, loop=loop)
+        self.ds = ds
+        self._grayscale = grayscale
+        self._photometric = ds.get('PhotometricInterpretation', 'MONOCHROME2')
+        nr_frames = int(ds.get('NumberOfFrames', 1) or 1)
+        self._encoded_frames = list(generate_pixel_data_frame(ds.PixelData, nr_frames))
+        # Start ahead by at least one frame per decode worker
+        self._min_ahead = max(self.PREFETCH_MIN, (os.cpu_count() or 2) // 2)
+        self._ahead = self._min_ahead
+        self._direction = 1
+        self._last_index = None
+        self._frame_bytes = 0
+        self._pending = {}  # frame index -> Future of the decoded frame
+        self._decoded = {}  # frame index -> decoded frame
+        self._decoded_bytes = 0
+        # Decoded frames are bounded by DECODED_CACHE_BYTES alone
+        self._cache_images = False
+    
+    def getNrOfFrames(self):
+        return len(self._encoded_frames)
     
-    # Create temp directory if not exists
-    os.makedirs(temp_dir, exist_ok=True)
+    def _decode_frame(self, index):
+        frame = decode_dicom_frame(self.ds, self._encoded_frames[index])
+        is_rgb = frame.ndim == 3 and frame.shape[2] == 3
+        if is_rgb and self._grayscale and self._photometric in YBR_FULL_PHOTOMETRICS:
+            return ybr_full_to_gray_u8(frame)
+        if 'YBR' in self._photometric:
+            frame = convert_color_space(frame, self._photometric, 'RGB')
+        if is_rgb and self._grayscale:
+            frame = rgb_to_gray_u8(frame)
+        elif frame.dtype != np.uint8:
+            frame = frame.astype(np.uint8)
+        return np.ascontiguousarray(frame)
     
-    print(f"Saving {arr.shape[0]} frames to temporary MHD files...")
+    def _track_direction(self, index):
+        """Update the direction of travel and grow or reset the prefetch depth."""
+        last, self._last_index = self._last_index, index
+        if last is None or index == last:
+            return
+        step = index - last
+        nr_frames = self.getNrOfFrames()
+        if self._loop:
+            # Looping from the last frame back to 0 is still moving forward
+            if step < -nr_frames // 2:
+                step += nr_frames
+            elif step > nr_frames // 2:
+                step -= nr_frames
+        direction = 1 if step > 0 else -1
+        if direction == self._direction and abs(step) <= self._ahead:
+            self._ahead = min(self._ahead * 2, self._max_ahead())
+        else:
+            # Reversal or jump: prefetch a little on both sides again
+            self._direction = direction
+            self._ahead = self._min_ahead
+    
+    def _max_ahead(self):
+        """Deepest prefetch that still fits in half the decoded-frame budget."""
+        if not self._frame_bytes:
+            return self._min_ahead
+        fits = self.DECODED_CACHE_BYTES // (2 * self._frame_bytes)
+        return max(self._min_ahead, min(self.PREFETCH_MAX, fits))
+    
+    def _prefetch_window(self, index):
+        """Frame indices to have decoded, most urgent first."""
+        d = self._direction
+        window = [index + d * k for k in range(self._ahead + 1)]
+        window += [index - d * k for k in range(1, self.PREFETCH_MIN + 1)]
+        nr_frames = self.getNrOfFrames()
+        if self._loop:
+            window = [i % nr_frames for i in window]
+        else:
+            window = [i for i in window if 0 <= i < nr_frames]
+        return list(dict.fromkeys(window))
     
-    for i in range(arr.shape[0]):
-        frame = arr[i]
-        # Save as raw data
-        raw_path = os.path.join(temp_dir, f"frame_{i}.raw")
-        mhd_path = os.path.join(temp_dir, f"frame_{i}.mhd")
+    def _distance(self, index):
+        """Frames between `index` and the current position (wrapping when looping)."""
+        distance = abs(index - (self._last_index or 0))
+        if self._loop:
+            distance = min(distance, self.getNrOfFrames() - distance)
+        return distance
+    
+    def _store_decoded(self, index, frame):
+        """Add a decoded frame to the cache, evicting the frames farthest away."""
+        if index in self._decoded:
+            return
+        self._frame_bytes = frame.nbytes
+        self._decoded[index] = frame
+        self._decoded_bytes += frame.nbytes
+        if self._decoded_bytes <= self.DECODED_CACHE_BYTES:
+            return
+        # Evict down to 3/4 of the budget in one pass, so the distance sort
+        # runs once per batch of new frames rather than on every insert
+        target = self.DECODED_CACHE_BYTES * 3 // 4
+        for i in sorted(self._decoded, key=self._distance, reverse=True):
+            if self._decoded_bytes <= target or i == self._last_index:
+                break
+            self._decoded_bytes -= self._decoded.pop(i).nbytes
+    
+    def _get_frame(self, index):
+        self._track_direction(index)
+        window = self._prefetch_window(index)
         
-        # Write raw data
-        frame.astype(np.uint8).tofile(raw_path)
+        pool = _get_frame_decode_pool()
+        for i in window:
+            if i not in self._decoded and i not in self._pending:
+                self._pending[i] = pool.submit(self._decode_frame, i)
         
-        # Write MHD header
-        h, w = frame.shape
-        with open(mhd_path, 'w') as f:
-            f.write(f"ObjectType = Image\n")
-            f.write(f"NDims = 2\n")
-            f.write(f"DimSize = {w} {h}\n")
-            f.write(f"ElementType = MET_UCHAR\n")
-            f.write(f"ElementDataFile = frame_{i}.raw\n")
-    
-    print(f"Saved {arr.shape[0]} frames to {temp_dir}")
-    return os.path.join(temp_dir, "frame_#.mhd")
+        frame = self._decoded.get(index)
+        if frame is None:
+            frame = self._pending.pop(index).result()
+            self._store_decoded(index, frame)
+        
+        # Keep finished prefetches, drop ones that fell out of the window
+        for i, future in list(self._pending.items()):
+            if future.done():
+                del self._pending[i]
+                if not future.cancelled() and future.exception() is None:
+                    self._store_decoded(i, future.result())
+            elif i not in window:
+                self._pending.pop(i).cancel()
+        return frame
 
 
-def is_dicom_compressed(filepath):
+def transfer_syntax_info(ds):
     """
-    Check if a DICOM file uses compressed transfer syntax.
+    Classify the transfer syntax of an already-read dataset.
     Returns (is_compressed, transfer_syntax_uid, transfer_syntax_name)
     """
     try:
-        # Read only metadata, not pixel data (faster)
-        ds = pydicom.dcmread(filepath, stop_before_pixels=True, force=True)
-        
         # Get Transfer Syntax UID
         ts_uid = str(ds.file_meta.TransferSyntaxUID) if hasattr(ds, 'file_meta') and hasattr(ds.file_meta, 'TransferSyntaxUID') else None
         
         if ts_uid is None:
             return True, None, "Unknown (assuming compressed)"
         
-        # Uncompressed Transfer Syntaxes
-        uncompressed_syntaxes = {
-            '1.2.840.10008.1.2': 'Implicit VR Little Endian',
-            '1.2.840.10008.1.2.1': 'Explicit VR Little Endian', 
-            '1.2.840.10008.1.2.2': 'Explicit VR Big Endian',
-        }
-        
-        if ts_uid in uncompressed_syntaxes:
-            return False, ts_uid, uncompressed_syntaxes[ts_uid]
-        else:
-            # Look up common compressed formats
-            compressed_names = {
-                '1.2.840.10008.1.2.5': 'RLE Lossless',
-                '1.2.840.10008.1.2.4.50': 'JPEG Baseline',
-                '1.2.840.10008.1.2.4.51': 'JPEG Extended',
-                '1.2.840.10008.1.2.4.70': 'JPEG Lossless',
-                '1.2.840.10008.1.2.4.80': 'JPEG-LS Lossless',
-                '1.2.840.10008.1.2.4.81': 'JPEG-LS Near-lossless',
-                '1.2.840.10008.1.2.4.90': 'JPEG 2000 Lossless',
-                '1.2.840.10008.1.2.4.91': 'JPEG 2000',
-            }
-            name = compressed_names.get(ts_uid, f'Compressed ({ts_uid})')
-            return True, ts_uid, name
+        return classify_transfer_syntax(ts_uid)
             
     except Exception as e:
         print(f"Warning: Could not determine transfer syntax: {e}")
         return True, None, "Unknown (assuming compressed)"
 
 
-def create_playback_pipeline(filepath, loop=True):
+# Uncompressed Transfer Syntaxes
+UNCOMPRESSED_SYNTAXES = {
+    '1.2.840.10008.1.2': 'Implicit VR Little Endian',
+    '1.2.840.10008.1.2.1': 'Explicit VR Little Endian', 
+    '1.2.840.10008.1.2.2': 'Explicit VR Big Endian',
+}
+
+# Common compressed formats
+COMPRESSED_SYNTAX_NAMES = {
+    '1.2.840.10008.1.2.5': 'RLE Lossless',
+    '1.2.840.10008.1.2.4.50': 'JPEG Baseline',
+    '1.2.840.10008.1.2.4.51': 'JPEG Extended',
+    '1.2.840.10008.1.2.4.70': 'JPEG Lossless',
+    '1.2.840.10008.1.2.4.80': 'JPEG-LS Lossless',
+    '1.2.840.10008.1.2.4.81': 'JPEG-LS Near-lossless',
+    '1.2.840.10008.1.2.4.90': 'JPEG 2000 Lossless',
+    '1.2.840.10008.1.2.4.91': 'JPEG 2000',
+}
+
+
+def classify_transfer_syntax(ts_uid):
+    """
+    Classify a Transfer Syntax UID.
+    Returns (is_compressed, transfer_syntax_uid, transfer_syntax_name)
+    """
+    if ts_uid in UNCOMPRESSED_SYNTAXES:
+        return False, ts_uid, UNCOMPRESSED_SYNTAXES[ts_uid]
+    name = COMPRESSED_SYNTAX_NAMES.get(ts_uid, f'Compressed ({ts_uid})')
+    return True, ts_uid, name
+
+
+# DICOM pixel data kept for quick re-open, within one byte budget:
+# (filepath, mtime_ns, size, grayscale) -> (source, framerate, nbytes), where
+# source is the decoded uint8 frames array, or for a compressed cine the
+# dataset whose encoded frames DicomFrameStreamer decodes lazily
+DECODED_CACHE_BYTES = 256 * 1024 * 1024
+_decoded_cache = OrderedDict()
+_decoded_cache_bytes = 0
+# Pipelines are built on PipelineLoadWorker threads
+_decoded_cache_lock = threading.Lock()
+
+
+def _decoded_cache_key(filepath):
+    """Cache key that changes whenever the file on disk changes."""
+    st = os.stat(filepath)
+    return (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+
+
+def _decoded_cache_get(key):
+    """Return the cached (source, framerate) for key, or None."""
+    with _decoded_cache_lock:
+        entry = _decoded_cache.get(key)
+        if entry is None:
+            return None
+        _decoded_cache.move_to_end(key)
+        return entry[0], entry[1]
+
+
+def _decoded_cache_put(key, source, framerate, nbytes):
+    """Store pixel data, evicting the least recently used entries over budget."""
+    global _decoded_cache_bytes
+    if nbytes > DECODED_CACHE_BYTES:
+        return
+    with _decoded_cache_lock:
+        old = _decoded_cache.pop(key, None)
+        if old is not None:
+            _decoded_cache_bytes -= old[2]
+        _decoded_cache[key] = (source, framerate, nbytes)
+        _decoded_cache_bytes += nbytes
+        while _decoded_cache_bytes > DECODED_CACHE_BYTES:
+            _, (_, _, evicted) = _decoded_cache.popitem(last=False)
+            _decoded_cache_bytes -= evicted
+
+
+def bmode_kernels(shape, dtype, photometric, grayscale=True):
+    """
+    Decide once how to turn a decoded pixel array of `shape`/`dtype` into
+    (Frames, H, W) uint8 B-mode frames, and return the ordered list of
+    array -> array steps to apply.
+    
+    Grayscale conversion and dtype casts write straight into the final
+    (Frames, H, W) buffer; a single 2D frame becomes a view of it.
+    With grayscale=False, RGB data is kept as (Frames, H, W, 3) uint8.
+    """
+    is_rgb = len(shape) >= 3 and shape[-1] == 3
+    if is_rgb and not grayscale:
+        return _rgb_kernels(shape, dtype, photometric)
+    
+    gray_shape = tuple(shape[:-1]) if is_rgb else tuple(shape)
+    target_shape = (1,) + gray_shape if len(gray_shape) == 2 else gray_shape
+    
+    kernels = []
+    if is_rgb and photometric in YBR_FULL_PHOTOMETRICS:
+        # Fused YBR -> gray: the Y channel already is the luma
+        def ybr_to_gray(a):
+            out = np.empty(target_shape, dtype=np.uint8)
+            ybr_full_to_gray_u8(a, out=out.reshape(gray_shape))
+            return out
+        kernels.append(ybr_to_gray)
+        return kernels
+    
+    if 'YBR' in photometric:
+        kernels.append(lambda a: convert_color_space(a, photometric, 'RGB'))
+    
+    if is_rgb:
+        # B-mode display uses integer BT.601 luma
+        def to_gray(a):
+            out = np.empty(target_shape, dtype=np.uint8)
+            rgb_to_gray_u8(a, out=out.reshape(gray_shape))
+            return out
+        kernels.append(to_gray)
+    elif dtype != np.uint8:
+        def to_uint8(a):
+            out = np.empty(target_shape, dtype=np.uint8)
+            np.copyto(out.reshape(gray_shape), a, casting='unsafe')
+            return out
+        kernels.append(to_uint8)
+    elif target_shape != gray_shape:
+        kernels.append(lambda a: a.reshape(target_shape))
+    return kernels
+
+
+def _rgb_kernels(shape, dtype, photometric):
+    """bmode_kernels() for RGB data that is played back in color."""
+    target_shape = (1,) + tuple(shape) if len(shape) == 3 else tuple(shape)
+    
+    kernels = []
+    if 'YBR' in photometric:
+        kernels.append(lambda a: convert_color_space(a, photometric, 'RGB'))
+    if dtype != np.uint8:
+        def to_uint8(a):
+            out = np.empty(target_shape, dtype=np.uint8)
+            np.copyto(out.reshape(shape), a, casting='unsafe')
+            return out
+        kernels.append(to_uint8)
+    elif target_shape != tuple(shape):
+        kernels.append(lambda a: a.reshape(target_shape))
+    return kernels
+
+
+# Container formats handed to fast.MovieStreamer (shared with VideoLoadWorker)
+VIDEO_EXTENSIONS = frozenset({'.avi', '.mp4', '.mov', '.mkv', '.wmv', '.webm'})
+
+
+def create_playback_pipeline(filepath, loop=True, force_grayscale=False):
     """
     Creates a pipeline to play back a file.
     Smart switching: uses DICOMMultiFrameStreamer for uncompressed DICOM,
-    falls back to pydicom + ImageFileStreamer for compressed DICOM.
+    falls back to pydicom + in-memory NumpyImageSource for compressed DICOM.
+    
+    Color sources are played back as RGB unless force_grayscale is set
+    (ImageRenderer draws RGB directly; graying is a display choice).
     """
     is_dicom = filepath.lower().endswith('.dcm')
     
     if not is_dicom:
         # Use native FAST importer for non-DICOM (images/videos)
-        video_extensions = ['.avi', '.mp4', '.mov', '.mkv', '.wmv']
-        if any(filepath.lower().endswith(ext) for ext in video_extensions):
-            return fast.MovieStreamer.create(filepath, grayscale=True, loop=loop)
+        if os.path.splitext(filepath)[1].lower() in VIDEO_EXTENSIONS:
+            return fast.MovieStreamer.create(filepath, grayscale=force_grayscale, loop=loop)
         else:
             return fast.ImageFileImporter.create(filepath)
     
     # --- DICOM file handling ---
     
+    # Re-opening a file decoded earlier in this session skips pydicom
+    try:
+        cache_key = _decoded_cache_key(filepath) + (force_grayscale,)
+    except OSError:
+        cache_key = None
+    cached = _decoded_cache_get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        source, framerate = cached
+        print(f"Using cached pixel data for {filepath}")
+        if isinstance(source, Dataset):
+            return DicomFrameStreamer.create(source, framerate=framerate, loop=loop,
+                                             grayscale=force_grayscale)
+        return NumpyImageSource.create(source, framerate=framerate, loop=loop)
+    
+    # Single header parse: PixelData is deferred and only read from disk
+    # if the pydicom fallback actually decodes it
+    try:
+        ds = pydicom.dcmread(filepath, force=True, defer_size='1 MB')
+    except Exception as e:
+        print(f"Error reading DICOM: {e}")
+        return None
+    
     # Check if compressed
-    is_compressed, ts_uid, ts_name = is_dicom_compressed(filepath)
+    is_compressed, ts_uid, ts_name = transfer_syntax_info(ds)
     print(f"DICOM Transfer Syntax: {ts_name}")
     
     if not is_compressed:
@@ -161,7 +614,7 @@ def create_playback_pipeline(filepath, loop=True):
             streamer = fast.DICOMMultiFrameStreamer.create(
                 filepath,
                 loop=loop,
-                grayscale=True,
+                grayscale=force_grayscale,
                 cropToROI=False,
             )
             print("DICOMMultiFrameStreamer created successfully")
@@ -172,52 +625,12 @@ def create_playback_pipeline(filepath, loop=True):
     else:
         print("Compressed DICOM detected, using pydicom method...")
     
-    # Fallback: Use pydicom + save to MHD + ImageFileStreamer
+    # Fallback: Use pydicom + NumpyImageSource
     try:
-        from pydicom.pixel_data_handlers.util import convert_color_space
-        import tempfile
-        
         print(f"Loading DICOM with pydicom: {filepath}")
-        ds = pydicom.dcmread(filepath, force=True)
         
-        if not hasattr(ds, 'PixelData'):
+        if 'PixelData' not in ds:
             raise ValueError("DICOM file has no Pixel Data")
-
-        arr = ds.pixel_array
-        print(f"Loaded DICOM. Shape: {arr.shape}, Dtype: {arr.dtype}")
-        print(f"Min: {np.min(arr)}, Max: {np.max(arr)}")
-        
-        # Handle Color Space (YBR -> RGB)
-        photometric = ds.get('PhotometricInterpretation', 'MONOCHROME2')
-        if 'YBR' in photometric:
-            print(f"Converting {photometric} to RGB...")
-            arr = convert_color_space(arr, photometric, 'RGB')
-        
-        # Convert to grayscale for B-mode display
-        if arr.ndim == 4 and arr.shape[3] == 3:
-            print("Converting RGB to Grayscale...")
-            arr = np.mean(arr, axis=3).astype(np.uint8)
-        elif arr.ndim == 3 and arr.shape[2] == 3:
-            print("Converting RGB to Grayscale...")
-            arr = np.mean(arr, axis=2).astype(np.uint8)
-            
-        # Ensure proper shape (Frames, H, W)
-        if ds.get('NumberOfFrames', 1) == 1:
-            if arr.ndim == 2:
-                arr = arr[np.newaxis, ...]
-        
-        if arr.dtype != np.uint8:
-            arr = arr.astype(np.uint8)
-            
-        print(f"Final array shape: {arr.shape}, Dtype: {arr.dtype}")
-        print(f"Final Min: {np.min(arr)}, Max: {np.max(arr)}")
-        
-        # Save frames to temporary MHD files
-        temp_dir = tempfile.mkdtemp(prefix="fast_ultrasound_")
-        file_pattern = save_frames_as_mhd(arr, temp_dir)
-        
-        # Use FAST's native ImageFileStreamer
-        print(f"Creating ImageFileStreamer with pattern: {file_pattern}")
         
         # Get framerate from DICOM if available
         framerate = 30
@@ -228,23 +641,41 @@ def create_playback_pipeline(filepath, loop=True):
             else:
                 fr = ds.get('RecommendedDisplayFrameRate', 30)
                 framerate = int(fr) if fr else 30
-        except:
+        except (TypeError, ValueError, ZeroDivisionError):
             pass
         
         print(f"Using framerate: {framerate} fps")
         
-        streamer = fast.ImageFileStreamer.create(
-            file_pattern,
-            loop=loop,
-            framerate=framerate,
-            useTimestamps=False  # Faster seeking
-        )
-        print("ImageFileStreamer created successfully")
+        # Compressed cine: decode frames lazily while streaming
+        if is_compressed and int(ds.get('NumberOfFrames', 1) or 1) > 1:
+            streamer = DicomFrameStreamer.create(ds, framerate=framerate, loop=loop,
+                                                 grayscale=force_grayscale)
+            print("DicomFrameStreamer created successfully")
+            if cache_key is not None:
+                # Only the encoded frames are kept; re-open skips the file read
+                _decoded_cache_put(cache_key, ds, framerate, len(ds.PixelData))
+            return streamer
+
+        arr = ds.pixel_array
+        print(f"Loaded DICOM. Shape: {arr.shape}, Dtype: {arr.dtype}")
+        
+        # Pick the normalization steps once from shape/dtype, then run them
+        photometric = ds.get('PhotometricInterpretation', 'MONOCHROME2')
+        for kernel in bmode_kernels(arr.shape, arr.dtype, photometric, grayscale=force_grayscale):
+            arr = kernel(arr)
+            
+        print(f"Final array shape: {arr.shape}, Dtype: {arr.dtype}")
+        
+        if cache_key is not None:
+            _decoded_cache_put(cache_key, arr, framerate, arr.nbytes)
+        
+        # Stream frames straight from the decoded array (no temp files)
+        streamer = NumpyImageSource.create(arr, framerate=framerate, loop=loop)
+        print("NumpyImageSource created successfully")
         return streamer
         
     except Exception as e:
         print(f"Error loading DICOM: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -0,0 +1,34 @@
+"""
+DICOM pixel decoding for the loader's decode process pool.
+
+Runs in spawned worker processes, so it only imports numpy and pydicom;
+pulling in FAST or Qt here would load them again in every worker.
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import pydicom
+
+
+def decode_pixels(filepath: str):
+    """
+    Decode PixelData in a worker process.
+    
+    The decoded array is handed back through shared memory instead of
+    being pickled; the caller owns (and must unlink) the block.
+    
+    Returns:
+        (shared memory name, shape, dtype string)
+    """
+    arr = pydicom.dcmread(filepath, force=True).pixel_array
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    try:
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    except BaseException:
+        # Nobody will receive the name, so the block must not outlive us
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return shm.name, arr.shape, arr.dtype.str
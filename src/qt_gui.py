@@ -14,6 +14,9 @@ Requirements:
 import platform
 import os
 import sys
+import time
+from types import SimpleNamespace
+from functools import partial
 import numpy as np
 
 # Suppress Qt font warning messages
@@ -26,16 +29,16 @@ if platform.system() != 'Windows':
 import fast  # Must import FAST before rest of PySide2
 
 from PySide2.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QSplitter, QListWidget, QListWidgetItem, QToolBar, QToolButton,
-    QStatusBar, QSlider, QLabel, QPushButton, QFileDialog, QMessageBox,
+    QStatusBar, QSlider, QLabel, QPushButton, QFileDialog,
     QFrame, QSizePolicy, QAction, QActionGroup, QStyle, QMenu,
     QDialog, QScrollArea, QComboBox, QGroupBox, QCheckBox,
     QGraphicsOpacityEffect, QTreeView, QStyledItemDelegate, QAbstractItemView,
     QTabWidget, QTextEdit
 )
 from PySide2.QtOpenGL import QGLWidget
-from PySide2.QtCore import Qt, Slot, QSize, QTimer, QModelIndex
+from PySide2.QtCore import Qt, Signal, Slot, QSize, QTimer, QModelIndex, QThreadPool, QSignalBlocker
 from PySide2.QtGui import (
     QIcon, QFont, QPalette, QColor, QKeySequence, QImage, QPixmap, QPainter,
     QStandardItemModel, QStandardItem
@@ -50,9 +53,218 @@ from .image_processing import (
     COLORMAP_DISPLAY_NAMES, FILTER_DISPLAY_NAMES,
     create_colormap_processor, create_filter_processor, create_frame_tap_processor
 )
-from .loaders import DicomLoadWorker, DicomLoadResult, VideoLoadWorker, LoadProgressDialog
-from .viewport import Viewport, ViewportManager, LayoutButtonWidget
-from .study_browser import FileListWidget, ThumbnailCache
+from .loaders import (
+    DicomLoadWorker, DicomLoadResult, VideoLoadWorker, PipelineLoadWorker, LoadProgressDialog
+)
+from .viewport import Viewport, ViewportManager, LayoutButtonWidget, VIEWPORT_QSS
+from .study_browser import FileListWidget, ThumbnailCache, DicomScanWorker, FILE_PANEL_QSS
+from .ui_cache import glyph_icon, clear_glyph_icons, cached_font
+
+
+# ============================================================
+# Stylesheets (combined into one application stylesheet, parsed once)
+# ============================================================
+
+_TOOLBAR_ICON_SIZE = QSize(20, 20)
+
+_TOOLBAR_QSS = """
+    QToolBar#toolbar {
+        background-color: #3c3c3c;
+        border: none;
+        padding: 3px;
+        spacing: 3px;
+    }
+    #toolbar QToolButton {
+        background-color: transparent;
+        border: 1px solid transparent;
+        border-bottom: 3px solid transparent;
+        border-radius: 4px;
+        padding: 4px;
+        padding-left: 10px;
+        padding-right: 7px;
+        color: #cccccc;
+    }
+    #toolbar QToolButton:hover {
+        background-color: #4a4a4a;
+        border: 1px solid #505050;
+        border-bottom: 3px solid #0078d4;
+        color: #ffffff;
+    }
+    #toolbar QToolButton:checked {
+        background-color: #0078d4;
+        border: 1px solid #0078d4;
+        border-bottom: 3px solid #005a9e;
+        color: #ffffff;
+    }
+    #toolbar QToolButton:pressed {
+        background-color: #005a9e;
+    }
+    /* Menu Button Specific Style (for Split Buttons) */
+    #toolbar QToolButton[is_dropdown="true"] {
+        padding-right: 20px; /* Make space for the menu button */
+        padding-left: 10px;
+    }
+    #toolbar QToolButton::menu-button {
+        border-left: 1px solid #505050;
+        width: 20px;
+        /* Optional: nice background for the arrow area */
+        border-top-right-radius: 4px;
+        border-bottom-right-radius: 4px;
+        margin-bottom: 3px; /* Prevent covering bottom border */
+    }
+    #toolbar QToolButton::menu-button:hover {
+        background-color: #505050;
+    }
+    #toolbar QToolButton::menu-indicator {
+        image: none; /* We use the default arrow or none if managed by style, strictly relying on default arrow here for now or add explicit one if resizing needed */
+        width: 10px;
+        height: 10px;
+        subcontrol-position: center center;
+        subcontrol-origin: padding;
+    }
+    /* Explicit fallback if needed, but usually qt draws it. 
+       Let's try standard styling first. If image: none is set, it disappears!
+       So removing 'image: none' from previous menuButton targeting if it conflicts,
+       but let's keep the specific #menuButton one separate. */
+    
+    /* The specific #menuButton (Gear icon) is NOT a split button, it is InstantPopup */
+    #toolbar QToolButton#menuButton {
+        border-left: 1px solid #505050;
+        padding-left: 8px;
+    }
+    #toolbar QToolButton#menuButton::menu-indicator {
+        image: none;
+    }
+    #toolbar QWidget#toolbarSpacer {
+        background-color: transparent;
+    }
+
+    /* Unified QMenu Style for All Dropdowns */
+    #toolbar QMenu {
+        background-color: #2d2d30;
+        color: #ffffff;
+        border: 1px solid #505050;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    #toolbar QMenu::item {
+        padding: 6px 20px;
+        border-radius: 2px;
+    }
+    #toolbar QMenu::item:hover,
+    #toolbar QMenu::item:selected {
+        background-color: #0078d4;
+        color: #ffffff;
+    }
+    #toolbar QMenu::separator {
+        height: 1px;
+        background-color: #505050;
+        margin: 4px 0;
+    }
+"""
+
+_PLAYBACK_QSS = """
+    #playbackBar,
+    #playbackBar QWidget {
+        background-color: #2d2d30;
+    }
+    #playbackBar QLabel {
+        color: #ffffff;
+        font-size: 12px;
+    }
+    #playbackBar QLabel#timeLabel,
+    #playbackBar QLabel#monoLabel {
+        font-family: 'SF Mono', Consolas, Monaco, 'Courier New', monospace;
+    }
+    #playbackBar QLabel#timeLabel {
+        color: #aaaaaa;
+    }
+    #playbackBar QLabel#separator {
+        color: #505050;
+    }
+    #playbackBar QSlider::groove:horizontal {
+        height: 6px;
+        background: #505050;
+        border-radius: 3px;
+    }
+    #playbackBar QSlider::handle:horizontal {
+        width: 14px;
+        height: 14px;
+        margin: -4px 0;
+        background: #0078d4;
+        border-radius: 7px;
+    }
+    #playbackBar QSlider::handle:horizontal:hover {
+        background: #1a8cff;
+    }
+    #playbackBar QSlider::sub-page:horizontal {
+        background: #0078d4;
+        border-radius: 3px;
+    }
+    #playbackBar QPushButton#navBtn {
+        background-color: #3c3c3c;
+        color: #cccccc;
+        border: 1px solid #505050;
+        border-bottom: 3px solid #505050;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 14px;
+        min-width: 32px;
+    }
+    #playbackBar QPushButton#navBtn:hover {
+        background-color: #4a4a4a;
+        color: #ffffff;
+        border-color: #606060;
+        border-bottom: 3px solid #0078d4;
+    }
+    #playbackBar QPushButton#navBtn:pressed {
+        background-color: #0078d4;
+        border-bottom: 3px solid #005a9e;
+        color: #ffffff;
+    }
+    #playbackBar QPushButton#navBtn:checked {
+        background-color: #0078d4;
+        border-color: #0078d4;
+        border-bottom: 3px solid #005a9e;
+        color: #ffffff;
+    }
+"""
+
+_WINDOW_QSS = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    QWidget {
+        background-color: #252526;
+        color: #ffffff;
+    }
+    QSplitter::handle {
+        background-color: #3e3e42;
+        width: 2px;
+    }
+    QStatusBar {
+        background-color: #007acc;
+        color: white;
+    }
+    QLabel#statusBanner {
+        color: #ffffff;
+        padding: 6px 10px;
+        font-size: 12px;
+    }
+    QLabel#statusBanner[level="error"] {
+        background-color: #a1260d;
+    }
+    QLabel#statusBanner[level="warning"] {
+        background-color: #8a6d00;
+    }
+    QLabel#statusBanner[level="info"] {
+        background-color: #005a9e;
+    }
+"""
+
+# Window defaults first: the panel rules are scoped by object name, so they
+# win over the bare QWidget rule by specificity
+_GLOBAL_QSS = _WINDOW_QSS + _TOOLBAR_QSS + _PLAYBACK_QSS + FILE_PANEL_QSS + VIEWPORT_QSS
 
 
 class ToolbarWidget(QToolBar):
@@ -64,99 +276,8 @@ class ToolbarWidget(QToolBar):
     
     def setup_ui(self):
         self.setMovable(False)
-        self.setIconSize(QSize(20, 20))
-        self.setStyleSheet("""
-            QToolBar {
-                background-color: #3c3c3c;
-                border: none;
-                padding: 3px;
-                spacing: 3px;
-            }
-            QToolButton {
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-bottom: 3px solid transparent;
-                border-radius: 4px;
-                padding: 4px;
-                padding-left: 10px;
-                padding-right: 7px;
-                color: #cccccc;
-            }
-            QToolButton:hover {
-                background-color: #4a4a4a;
-                border: 1px solid #505050;
-                border-bottom: 3px solid #0078d4;
-                color: #ffffff;
-            }
-            QToolButton:checked {
-                background-color: #0078d4;
-                border: 1px solid #0078d4;
-                border-bottom: 3px solid #005a9e;
-                color: #ffffff;
-            }
-            QToolButton:pressed {
-                background-color: #005a9e;
-            }
-            /* Menu Button Specific Style (for Split Buttons) */
-            QToolButton[is_dropdown="true"] {
-                padding-right: 20px; /* Make space for the menu button */
-                padding-left: 10px;
-            }
-            QToolButton::menu-button {
-                border-left: 1px solid #505050;
-                width: 20px;
-                /* Optional: nice background for the arrow area */
-                border-top-right-radius: 4px;
-                border-bottom-right-radius: 4px;
-                margin-bottom: 3px; /* Prevent covering bottom border */
-            }
-            QToolButton::menu-button:hover {
-                background-color: #505050;
-            }
-            QToolButton::menu-indicator {
-                image: none; /* We use the default arrow or none if managed by style, strictly relying on default arrow here for now or add explicit one if resizing needed */
-                width: 10px;
-                height: 10px;
-                subcontrol-position: center center;
-                subcontrol-origin: padding;
-            }
-            /* Explicit fallback if needed, but usually qt draws it. 
-               Let's try standard styling first. If image: none is set, it disappears!
-               So removing 'image: none' from previous menuButton targeting if it conflicts,
-               but let's keep the specific #menuButton one separate. */
-            
-            /* The specific #menuButton (Gear icon) is NOT a split button, it is InstantPopup */
-            QToolButton#menuButton {
-                border-left: 1px solid #505050;
-                padding-left: 8px;
-            }
-            QToolButton#menuButton::menu-indicator {
-                image: none;
-            }
-
-            /* Unified QMenu Style for All Dropdowns */
-            QMenu {
-                background-color: #2d2d30;
-                color: #ffffff;
-                border: 1px solid #505050;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 20px;
-                border-radius: 2px;
-            }
-            QMenu::item:hover,
-            QMenu::item:selected {
-                background-color: #0078d4;
-                color: #ffffff;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #505050;
-                margin: 4px 0;
-            }
-        """)
+        self.setIconSize(_TOOLBAR_ICON_SIZE)
+        self.setObjectName("toolbar")  # Styled by _TOOLBAR_QSS
         
         # 1. Rotate
         self.rotate_action = QToolButton(self)
@@ -279,8 +400,11 @@ class ToolbarWidget(QToolBar):
         colormap_icons = {'grayscale': '⬜', 'hot': '🔥', 'cool': '❄️', 'bone': '🦴', 'viridis': '🌈', 'plasma': '💜', 'inferno': '🌋'}
         for cmap in ColormapType:
             display_name = COLORMAP_DISPLAY_NAMES.get(cmap, cmap.value)
-            icon = colormap_icons.get(cmap.value, '')
-            action = self.colormap_menu.addAction(f"{icon} {display_name}")
+            glyph = colormap_icons.get(cmap.value)
+            if glyph:
+                action = self.colormap_menu.addAction(glyph_icon(glyph), display_name)
+            else:
+                action = self.colormap_menu.addAction(display_name)
             action.setCheckable(True)
             action.setData(cmap)
             self.colormap_group.addAction(action)
@@ -349,7 +473,7 @@ class ToolbarWidget(QToolBar):
         # 9. Spacer
         spacer = QWidget()
         spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        spacer.setStyleSheet("background-color: transparent;")
+        spacer.setObjectName("toolbarSpacer")
         self.addWidget(spacer)
         
         # 10. Menu (Gear Icon) - Consolidated Settings
@@ -452,7 +576,7 @@ class FilterStrengthDialog(QDialog):
         
         # Title
         title = QLabel("Adjust Filter Strength")
-        title.setFont(QFont("Helvetica Neue", 14, QFont.Bold))
+        title.setFont(cached_font("Helvetica Neue", 14, QFont.Bold))
         title.setStyleSheet("color: #ffffff;")
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
@@ -480,7 +604,7 @@ class FilterStrengthDialog(QDialog):
         # Value label
         self.value_label = QLabel(f"{int(self._strength * 100)}%")
         self.value_label.setAlignment(Qt.AlignCenter)
-        self.value_label.setFont(QFont("SF Mono", 16, QFont.Bold))
+        self.value_label.setFont(cached_font("SF Mono", 16, QFont.Bold))
         self.value_label.setStyleSheet("color: #0078d4;")
         layout.addWidget(self.value_label)
         
@@ -558,6 +682,14 @@ class HelpDialog(QDialog):
                 background: #3e3e42;
             }
             QLabel { color: #cccccc; }
+            QLabel#shortcutHeader { color: #ffffff; margin-top: 5px; }
+            QFrame#shortcutRule { background-color: #3e3e42; }
+            QLabel#shortcutKey {
+                color: #0078d4;
+                font-family: 'SF Mono', Consolas, Monaco, 'Courier New', monospace;
+                font-weight: bold;
+                font-size: 12px;
+            }
         """)
         
         layout = QVBoxLayout(self)
@@ -610,20 +742,20 @@ class HelpDialog(QDialog):
         layout.setSpacing(20)
         
         title = QLabel("Welcome to SonoView Pro")
-        title.setFont(QFont("Helvetica Neue", 20, QFont.Bold))
+        title.setFont(cached_font("Helvetica Neue", 20, QFont.Bold))
         title.setStyleSheet("color: #ffffff;")
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         subtitle = QLabel("Professional Ultrasound Imaging Software\nStreamlined for efficiency and precision.")
-        subtitle.setFont(QFont("Helvetica Neue", 12))
+        subtitle.setFont(cached_font("Helvetica Neue", 12))
         subtitle.setStyleSheet("color: #aaaaaa;")
         subtitle.setAlignment(Qt.AlignCenter)
         layout.addWidget(subtitle)
         
         # Icon placeholder
         icon = QLabel("🔷")
-        icon.setFont(QFont("lucide", 48)) 
+        icon.setFont(cached_font("lucide", 48)) 
         icon.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon)
         
@@ -641,9 +773,13 @@ class HelpDialog(QDialog):
         scroll.setStyleSheet("background-color: transparent;")
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
+        # One grid for all rows: key / description columns, headers span both
         content = QWidget()
-        content_layout = QVBoxLayout(content)
-        content_layout.setSpacing(15)
+        content_layout = QGridLayout(content)
+        content_layout.setHorizontalSpacing(10)
+        content_layout.setVerticalSpacing(6)
+        content_layout.setColumnMinimumWidth(0, 130)
+        content_layout.setColumnStretch(1, 1)
         
         # Translated shortcuts for consistency with previous version
         shortcuts = {
@@ -686,40 +822,29 @@ class HelpDialog(QDialog):
             ],
         }
         
+        row = 0
         for category, items in shortcuts.items():
             header = QLabel(f"【{category}】")
-            header.setFont(QFont("Helvetica Neue", 11, QFont.Bold))
-            header.setStyleSheet("color: #ffffff; margin-top: 5px;")
-            content_layout.addWidget(header)
+            header.setObjectName("shortcutHeader")
+            header.setFont(cached_font("Helvetica Neue", 11, QFont.Bold))
+            content_layout.addWidget(header, row, 0, 1, 2)
             
             line = QFrame()
+            line.setObjectName("shortcutRule")
             line.setFrameShape(QFrame.HLine)
-            line.setStyleSheet("background-color: #3e3e42;")
             line.setFixedHeight(1)
-            content_layout.addWidget(line)
+            content_layout.addWidget(line, row + 1, 0, 1, 2)
+            row += 2
             
             for key, desc in items:
-                item_widget = QWidget()
-                item_layout = QHBoxLayout(item_widget)
-                item_layout.setContentsMargins(10, 2, 10, 2)
-                
                 key_label = QLabel(key)
-                key_label.setFixedWidth(120)
-                key_label.setStyleSheet("""
-                    color: #0078d4;
-                    font-family: 'SF Mono', Consolas, Monaco, 'Courier New', monospace;
-                    font-weight: bold;
-                    font-size: 12px;
-                """)
-                item_layout.addWidget(key_label)
-                
-                desc_label = QLabel(desc)
-                desc_label.setStyleSheet("color: #cccccc;")
-                item_layout.addWidget(desc_label)
-                item_layout.addStretch()
-                content_layout.addWidget(item_widget)
-                
-        content_layout.addStretch()
+                key_label.setObjectName("shortcutKey")
+                key_label.setContentsMargins(10, 0, 0, 0)
+                content_layout.addWidget(key_label, row, 0)
+                content_layout.addWidget(QLabel(desc), row, 1)
+                row += 1
+        
+        content_layout.setRowStretch(row, 1)
         scroll.setWidget(content)
         layout.addWidget(scroll)
         return tab
@@ -763,7 +888,7 @@ class HelpDialog(QDialog):
         layout.setSpacing(15)
         
         name = QLabel("SonoView Pro")
-        name.setFont(QFont("Helvetica Neue", 20, QFont.Bold))
+        name.setFont(cached_font("Helvetica Neue", 20, QFont.Bold))
         name.setStyleSheet("color: #0078d4;")
         layout.addWidget(name)
         
@@ -784,19 +909,27 @@ class HelpDialog(QDialog):
         layout.addStretch()
         return tab
 
-    def keyPressEvent(self, event):
-        if event.key() == Qt.Key_Escape:
-            self.close()
-        else:
-            super().keyPressEvent(event)
-
 
 class PlaybackControlWidget(QWidget):
     """Bottom playback control bar with enhanced navigation."""
     
+    # Lucide glyphs of the navigation buttons
+    NAV_GLYPHS = {
+        'first_btn': "\ue162",    # skip-back
+        'rewind_btn': "\ue14a",   # rewind
+        'forward_btn': "\ue0c1",  # fast-forward
+        'last_btn': "\ue163",     # skip-forward
+        'loop_btn': "\ue149",     # repeat
+    }
+    PLAY_GLYPH = "\ue13f"
+    PAUSE_GLYPH = "\ue131"
+    NAV_ICON_SIZE = 18
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.frame_rate = 30  # Default frame rate for time calculation
+        self._playing = False
+        self._last_time_key = None  # (current, total) whole seconds on the time label
         self.setup_ui()
         
     def setup_ui(self):
@@ -804,115 +937,51 @@ class PlaybackControlWidget(QWidget):
         layout.setContentsMargins(10, 5, 10, 5)
         layout.setSpacing(4)
         
-        # Common button style with enhanced hover effect
-        nav_btn_style = """
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #cccccc;
-                border: 1px solid #505050;
-                border-bottom: 3px solid #505050;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 14px;
-                min-width: 32px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-                color: #ffffff;
-                border-color: #606060;
-                border-bottom: 3px solid #0078d4;
-            }
-            QPushButton:pressed {
-                background-color: #0078d4;
-                border-bottom: 3px solid #005a9e;
-                color: #ffffff;
-            }
-            QPushButton:checked {
-                background-color: #0078d4;
-                border-color: #0078d4;
-                border-bottom: 3px solid #005a9e;
-                color: #ffffff;
-            }
-        """
-        
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d30;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 12px;
-            }
-            QSlider::groove:horizontal {
-                height: 6px;
-                background: #505050;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                width: 14px;
-                height: 14px;
-                margin: -4px 0;
-                background: #0078d4;
-                border-radius: 7px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #1a8cff;
-            }
-            QSlider::sub-page:horizontal {
-                background: #0078d4;
-                border-radius: 3px;
-            }
-        """)
+        self.setObjectName("playbackBar")  # Styled by _PLAYBACK_QSS
         
         # === Navigation Buttons ===
         # First frame button
-        self.first_btn = QPushButton("")  # skip-back
+        self.first_btn = QPushButton()
         self.first_btn.setFixedWidth(36)
         self.first_btn.setToolTip("First frame (Home)")
-        self.first_btn.setStyleSheet(nav_btn_style)
-        self.first_btn.setFont(QFont("lucide", 14))
+        self.first_btn.setObjectName("navBtn")
         layout.addWidget(self.first_btn)
         
         # Rewind button (-5 frames)
-        self.rewind_btn = QPushButton("")  # rewind
+        self.rewind_btn = QPushButton()
         self.rewind_btn.setFixedWidth(36)
         self.rewind_btn.setToolTip("Rewind 5 frames")
-        self.rewind_btn.setStyleSheet(nav_btn_style)
-        self.rewind_btn.setFont(QFont("lucide", 14))
+        self.rewind_btn.setObjectName("navBtn")
         layout.addWidget(self.rewind_btn)
         
         # Play/Pause button
-        self.play_btn = QPushButton("")  # play
+        self.play_btn = QPushButton()
         self.play_btn.setFixedWidth(40)
         self.play_btn.setToolTip("Play/Pause (Space)")
-        self.play_btn.setStyleSheet(nav_btn_style)
-        self.play_btn.setFont(QFont("lucide", 14))
+        self.play_btn.setObjectName("navBtn")
         layout.addWidget(self.play_btn)
         
         # Forward button (+5 frames)
-        self.forward_btn = QPushButton("")  # fast-forward
+        self.forward_btn = QPushButton()
         self.forward_btn.setFixedWidth(36)
         self.forward_btn.setToolTip("Forward 5 frames")
-        self.forward_btn.setStyleSheet(nav_btn_style)
-        self.forward_btn.setFont(QFont("lucide", 14))
+        self.forward_btn.setObjectName("navBtn")
         layout.addWidget(self.forward_btn)
         
         # Last frame button
-        self.last_btn = QPushButton("")  # skip-forward
+        self.last_btn = QPushButton()
         self.last_btn.setFixedWidth(36)
         self.last_btn.setToolTip("Last frame (End)")
-        self.last_btn.setStyleSheet(nav_btn_style)
-        self.last_btn.setFont(QFont("lucide", 14))
+        self.last_btn.setObjectName("navBtn")
         layout.addWidget(self.last_btn)
         
         # Loop toggle button
-        self.loop_btn = QPushButton("")  # repeat
+        self.loop_btn = QPushButton()
         self.loop_btn.setFixedWidth(36)
         self.loop_btn.setCheckable(True)
         self.loop_btn.setChecked(True)  # Default: loop enabled
         self.loop_btn.setToolTip("Loop playback (L)")
-        self.loop_btn.setStyleSheet(nav_btn_style)
-        self.loop_btn.setFont(QFont("lucide", 14))
+        self.loop_btn.setObjectName("navBtn")
         layout.addWidget(self.loop_btn)
         
         # Spacing
@@ -933,56 +1002,104 @@ class PlaybackControlWidget(QWidget):
         self.time_label = QLabel("00:00 / 00:00")
         self.time_label.setFixedWidth(90)
         self.time_label.setToolTip("Current time / Total time")
-        self.time_label.setStyleSheet("color: #aaaaaa; font-family: 'SF Mono', Consolas, Monaco, 'Courier New', monospace;")
+        self.time_label.setObjectName("timeLabel")
         layout.addWidget(self.time_label)
         
         # Separator
         sep1 = QLabel("|")
-        sep1.setStyleSheet("color: #505050;")
+        sep1.setObjectName("separator")
         layout.addWidget(sep1)
         
         # Frame info
         self.frame_label = QLabel("Frame: 0 / 0")
         self.frame_label.setFixedWidth(110)
         self.frame_label.setToolTip("Current frame / Total frames")
-        self.frame_label.setStyleSheet("font-family: 'SF Mono', Consolas, Monaco, 'Courier New', monospace;")
+        self.frame_label.setObjectName("monoLabel")
         layout.addWidget(self.frame_label)
         
         # Separator
         sep2 = QLabel("|")
-        sep2.setStyleSheet("color: #505050;")
+        sep2.setObjectName("separator")
         layout.addWidget(sep2)
         
         # Window/Level info
         self.wl_label = QLabel("W: 255  L: 127")
         self.wl_label.setFixedWidth(100)
         self.wl_label.setToolTip("Window / Level")
-        self.wl_label.setStyleSheet("font-family: 'SF Mono', Consolas, Monaco, 'Courier New', monospace;")
+        self.wl_label.setObjectName("monoLabel")
         layout.addWidget(self.wl_label)
+        
+        self.refresh_icons()
+    
+    def refresh_icons(self):
+        """(Re)apply the navigation glyph icons, e.g. once the icon font is registered."""
+        for name, glyph in self.NAV_GLYPHS.items():
+            button = getattr(self, name)
+            button.setIconSize(QSize(self.NAV_ICON_SIZE, self.NAV_ICON_SIZE))
+            button.setIcon(self._nav_icon(glyph))
+        self.set_playing(self._playing)
+    
+    def set_playing(self, playing):
+        """Show the pause glyph while playing, the play glyph otherwise."""
+        self._playing = playing
+        self.play_btn.setIcon(self._nav_icon(self.PAUSE_GLYPH if playing else self.PLAY_GLYPH))
+    
+    def _nav_icon(self, glyph):
+        # Lucide glyphs baked into cached pixmaps; white while a toggle is on
+        return glyph_icon(glyph, self.NAV_ICON_SIZE, "lucide", "#cccccc", "#ffffff")
     
     def update_time_display(self, current_frame, total_frames):
         """Update time label based on frame number and frame rate."""
         if total_frames <= 0:
-            self.time_label.setText("00:00 / 00:00")
-            return
-        
-        current_sec = current_frame / self.frame_rate
-        total_sec = total_frames / self.frame_rate
+            current_sec = total_sec = None
+        else:
+            current_sec = int(current_frame / self.frame_rate)
+            total_sec = int(total_frames / self.frame_rate)
         
-        current_str = f"{int(current_sec // 60):02d}:{int(current_sec % 60):02d}"
-        total_str = f"{int(total_sec // 60):02d}:{int(total_sec % 60):02d}"
+        # The label only shows whole seconds: skip frames within the same second
+        time_key = (current_sec, total_sec)
+        if time_key == self._last_time_key:
+            return
+        self._last_time_key = time_key
         
-        self.time_label.setText(f"{current_str} / {total_str}")
+        if current_sec is None:
+            self.time_label.setText("00:00 / 00:00")
+            return
+        self.time_label.setText(
+            f"{current_sec // 60:02d}:{current_sec % 60:02d} / {total_sec // 60:02d}:{total_sec % 60:02d}"
+        )
 
 
 class UltrasoundViewerWindow(QMainWindow):
     """Main application window."""
     
+    # Emitted from the computation thread by the frame tap; delivered queued
+    first_frame_ready = Signal()
+    
+    # Give up waiting for a first frame after this long and center anyway
+    CENTER_TIMEOUT_MS = 2000
+    # Backoff bounds when polling for the first frame without a frame tap
+    CENTER_POLL_MIN_MS = 10
+    CENTER_POLL_MAX_MS = 500
+    
+    # W/L drag limits
+    WL_WINDOW_MIN, WL_WINDOW_MAX = 1, 1000
+    WL_LEVEL_MIN, WL_LEVEL_MAX = 0, 500
+    
+    # Frame info refresh period while playing
+    FRAME_INFO_INTERVAL_MS = 100
+    
+    # Most single-frame steps per second (held arrow keys auto-repeat faster)
+    STEP_RATE = 30
+    
     def __init__(self):
         super().__init__()
         self.fast_view = None
         self.fast_widget = None
         self.computation_thread = None
+        self._fast_released = False  # Set once closeEvent has cleaned up FAST
+        self._screenshot_dialog = None  # Created on first screenshot, then reused
+        self._help_dialog = None  # Created on first help request, then reused
         self.current_streamer = None
         self.renderer = None
         self.is_playing = True
@@ -994,8 +1111,6 @@ class UltrasoundViewerWindow(QMainWindow):
         self.current_tool = 'none'
         self.current_annotation_tool = None
         self.current_measure_tool = None  # Current measurement tool type
-        self.annotations = []  # List of all annotations
-        self.measurements = []  # List of all measurements
         
         # FAST Annotation Manager (will be initialized after fast_view is created)
         self.fast_annotation_manager = None
@@ -1003,6 +1118,10 @@ class UltrasoundViewerWindow(QMainWindow):
         # Async loading state
         self._load_worker = None
         self._load_progress_dialog = None
+        self._scan_worker = None  # Current folder scan
+        self._scan_workers = set()  # All scans still running
+        self._scan_first_file = None
+        self._scan_found = 0
         
         # Window/Level state
         self.intensity_level = 127.0
@@ -1040,7 +1159,48 @@ class UltrasoundViewerWindow(QMainWindow):
         # Timer for updating frame info
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.update_frame_info)
-        self.update_timer.start(100)  # Update every 100ms
+        # Runs only while a stream plays (see _start_update_timer)
+        
+        # Camera centering on a new stream's first frame (see _center_on_first_frame)
+        self._center_interval = 0  # Current poll backoff (ms)
+        self._center_elapsed = 0
+        self._center_by_callback = False
+        self._center_timer = QTimer(self)
+        self._center_timer.setSingleShot(True)
+        self._center_timer.timeout.connect(self._check_and_center)
+        self.first_frame_ready.connect(self._on_first_frame_ready, Qt.QueuedConnection)
+        
+        # (frame, total) last shown by update_frame_info, rounded W/L last shown
+        self._last_frame_key = None
+        self._last_wl_key = None
+        
+        # W/L drag deltas are accumulated and applied at most once per ~frame
+        self._pending_dw = 0.0
+        self._pending_dl = 0.0
+        self._wl_flush_timer = QTimer(self)
+        self._wl_flush_timer.setSingleShot(True)
+        self._wl_flush_timer.setInterval(16)
+        self._wl_flush_timer.timeout.connect(self._flush_wl)
+        
+        # Slider drags seek only to the last value of each ~20 ms burst
+        self._pending_seek = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(20)
+        self._seek_timer.timeout.connect(self._apply_pending_seek)
+        self._last_step_ts = 0.0  # time.monotonic() of the last prev/next frame step
+        
+        # One-shot refresh after a paused seek; restarting it coalesces slider drags
+        self._frame_info_timer = QTimer(self)
+        self._frame_info_timer.setSingleShot(True)
+        self._frame_info_timer.setInterval(100)
+        self._frame_info_timer.timeout.connect(self.update_frame_info)
+        
+        # Coalesces overlay repaints requested by layer panel bursts (e.g. hide all)
+        self._overlay_update_timer = QTimer(self)
+        self._overlay_update_timer.setSingleShot(True)
+        self._overlay_update_timer.setInterval(0)
+        self._overlay_update_timer.timeout.connect(self._do_overlay_update)
 
         # Timer for LUT overlay updates
         self.lut_overlay_timer = QTimer(self)
@@ -1083,6 +1243,17 @@ class UltrasoundViewerWindow(QMainWindow):
         self.toolbar = ToolbarWidget()
         right_layout.addWidget(self.toolbar)
         
+        # Inline message banner (load errors etc.), instead of modal message boxes
+        self._banner = QLabel()
+        self._banner.setObjectName("statusBanner")
+        self._banner.setWordWrap(True)
+        self._banner.setVisible(False)
+        right_layout.addWidget(self._banner)
+        self._banner_timer = QTimer(self)
+        self._banner_timer.setSingleShot(True)
+        self._banner_timer.setInterval(4000)
+        self._banner_timer.timeout.connect(self._banner.hide)
+        
         # ViewportManager (replaces single FAST view)
         self.viewport_manager = ViewportManager()
         self.viewport_manager.active_viewport_changed.connect(self._on_active_viewport_changed)
@@ -1097,7 +1268,6 @@ class UltrasoundViewerWindow(QMainWindow):
         
         # Layer panel (right side)
         self.layer_panel = LayerPanelWidget()
-        self.layer_panel.setStyleSheet("background-color: #252526;")
         splitter.addWidget(self.layer_panel)
         
         # Now sync viewport references (after layer_panel is created)
@@ -1113,15 +1283,37 @@ class UltrasoundViewerWindow(QMainWindow):
         
         # Status bar
         self.status_bar = QStatusBar()
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: #007acc;
-                color: white;
-            }
-        """)
         self.status_bar.showMessage("Ready")
         self.setStatusBar(self.status_bar)
     
+    @property
+    def current_streamer(self):
+        return self._current_streamer
+    
+    @current_streamer.setter
+    def current_streamer(self, streamer):
+        # Probe the optional playback methods once per streamer rather than
+        # with hasattr() in every playback callback; absent ones are None
+        self._current_streamer = streamer
+        self._streamer_caps = SimpleNamespace(
+            set_pause=getattr(streamer, 'setPause', None),
+            set_frame=getattr(streamer, 'setCurrentFrameIndex', None),
+            get_frame=getattr(streamer, 'getCurrentFrameIndex', None),
+            n_frames=getattr(streamer, 'getNrOfFrames', None),
+            set_looping=getattr(streamer, 'setLooping', None),
+        )
+    
+    def _show_banner(self, message, level="error"):
+        """Show a message in the inline banner; it hides itself after a few seconds."""
+        self._banner.setText(message)
+        if self._banner.property("level") != level:
+            # Re-polish so the [level=...] stylesheet rule is picked up
+            self._banner.setProperty("level", level)
+            self._banner.style().unpolish(self._banner)
+            self._banner.style().polish(self._banner)
+        self._banner.setVisible(True)
+        self._banner_timer.start()
+    
     def _sync_viewport_references(self):
         """Sync references from active viewport for backward compatibility."""
         vp = self.viewport_manager.get_active_viewport()
@@ -1135,7 +1327,7 @@ class UltrasoundViewerWindow(QMainWindow):
             self.lut_overlay_processor = vp.lut_overlay_processor
             self.renderer = vp.renderer  # Required for W/L adjustment
             
-            # Setup annotation overlay connections
+            # Setup annotation overlay connections (built lazily, see _ensure_overlay)
             if self.annotation_overlay:
                 self.annotation_overlay.installEventFilter(self)
                 if self.fast_annotation_manager:
@@ -1150,8 +1342,8 @@ class UltrasoundViewerWindow(QMainWindow):
                     self.annotation_overlay.wl_changed.disconnect()
                     self.annotation_overlay.preview_updated.disconnect()
                     self.annotation_overlay.preview_cleared.disconnect()
-                except:
-                    pass
+                except RuntimeError:
+                    pass  # Nothing connected yet
                 
                 self.annotation_overlay.annotation_added.connect(self.layer_panel.add_annotation)
                 self.annotation_overlay.annotation_added.connect(self.on_annotation_added)
@@ -1160,6 +1352,18 @@ class UltrasoundViewerWindow(QMainWindow):
                 self.annotation_overlay.preview_updated.connect(self.on_preview_updated)
                 self.annotation_overlay.preview_cleared.connect(self.on_preview_cleared)
     
+    def _ensure_overlay(self):
+        """Create the active viewport's annotation overlay if needed and wire it up."""
+        vp = self.viewport_manager.get_active_viewport()
+        if vp and vp.annotation_overlay is None and vp.ensure_annotation_overlay():
+            self._sync_viewport_references()
+        return self.annotation_overlay
+    
+    def _overlay_tool(self):
+        """Tool the active viewport's overlay is set to (None without an overlay)."""
+        overlay = self.annotation_overlay
+        return overlay.current_tool if overlay else None
+    
     def _on_active_viewport_changed(self, viewport: Viewport):
         """Handle active viewport change."""
         self._sync_viewport_references()
@@ -1167,6 +1371,10 @@ class UltrasoundViewerWindow(QMainWindow):
         # Update current file reference
         self.current_file = viewport.current_file
         self.current_streamer = viewport.current_streamer
+        if self.current_streamer is None:
+            self._stop_update_timer()  # Empty viewport: no frame info to poll
+        else:
+            self._start_update_timer()
         
         # Update status bar
         if viewport.current_file:
@@ -1206,19 +1414,9 @@ class UltrasoundViewerWindow(QMainWindow):
     
     def apply_dark_theme(self):
         """Apply dark theme to the application."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QWidget {
-                background-color: #252526;
-                color: #ffffff;
-            }
-            QSplitter::handle {
-                background-color: #3e3e42;
-                width: 2px;
-            }
-        """)
+        # One stylesheet for the whole app: a single parse and style pass
+        # instead of one per panel
+        QApplication.instance().setStyleSheet(_GLOBAL_QSS)
     
     def connect_signals(self):
         """Connect widget signals to slots."""
@@ -1261,15 +1459,8 @@ class UltrasoundViewerWindow(QMainWindow):
         self.playback.frame_slider.sliderReleased.connect(self.on_slider_released)
         self.playback.frame_slider.valueChanged.connect(self.on_frame_slider_changed)
         
-        # Annotation overlay <-> Layer panel
-        if self.annotation_overlay:
-            self.annotation_overlay.annotation_added.connect(self.layer_panel.add_annotation)
-            self.annotation_overlay.annotation_added.connect(self.on_annotation_added)
-            self.annotation_overlay.measure_added.connect(self.on_measure_added)
-            self.annotation_overlay.wl_changed.connect(self.on_wl_changed)
-            # Connect preview signals for FAST annotation sync
-            self.annotation_overlay.preview_updated.connect(self.on_preview_updated)
-            self.annotation_overlay.preview_cleared.connect(self.on_preview_cleared)
+        # Layer panel -> annotation overlay (overlay signals are wired in
+        # _sync_viewport_references once the overlay exists)
         self.layer_panel.annotation_deleted.connect(self.on_annotation_deleted)
         self.layer_panel.visibility_changed.connect(self.on_annotation_visibility_changed)
         self.layer_panel.class_type_changed.connect(self.on_annotation_class_changed)
@@ -1315,32 +1506,61 @@ class UltrasoundViewerWindow(QMainWindow):
             self.load_folder(folder_path)
     
     def load_folder(self, folder_path):
-        """Load all DICOM files from a folder."""
-        import glob
-        
-        # Find all DICOM files recursively
-        dcm_files = glob.glob(os.path.join(folder_path, "**", "*.dcm"), recursive=True)
-        dcm_files.sort()
-        
-        if not dcm_files:
-            QMessageBox.information(self, "No Files Found", "No DICOM files found in the selected folder.")
+        """Load all DICOM files from a folder (scanned in the background)."""
+        if self._scan_worker is not None:
+            self._scan_worker.cancel()
+        
+        worker = DicomScanWorker(folder_path)
+        worker.signals.files_found.connect(partial(self._on_folder_files_found, worker))
+        worker.signals.finished.connect(partial(self._on_folder_scan_finished, worker))
+        # Scans (including cancelled ones) stay referenced until they finish
+        self._scan_workers.add(worker)
+        self._scan_worker = worker
+        self._scan_first_file = None
+        self._scan_found = 0
+        
+        self.status_bar.showMessage(f"Scanning {folder_path}...")
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_folder_files_found(self, worker, filepaths):
+        """Add a batch of scanned files to the list."""
+        if worker is not self._scan_worker:
+            return  # Batch from a superseded scan
+        self.file_panel.add_files(filepaths)
+        
+        first = min(filepaths)
+        if self._scan_first_file is None or first < self._scan_first_file:
+            self._scan_first_file = first
+        self._scan_found += len(filepaths)
+        self.status_bar.showMessage(f"Found {self._scan_found} DICOM files...")
+    
+    def _on_folder_scan_finished(self, worker, count):
+        """Report the scan result and load the first file."""
+        self._scan_workers.discard(worker)
+        if worker is not self._scan_worker:
             return
+        self._scan_worker = None
         
-        self.status_bar.showMessage(f"Found {len(dcm_files)} DICOM files")
+        if not count:
+            self._show_banner("No DICOM files found in the selected folder.", level="info")
+            return
         
-        # Add all files to list
-        for filepath in dcm_files:
-            self.file_panel.add_file(filepath)
+        self.status_bar.showMessage(f"Found {count} DICOM files")
         
-        # Load the first file
-        if dcm_files:
-            self.load_file(dcm_files[0])
+        # Load the first file (unless it is already the active one)
+        if self._scan_first_file and self._scan_first_file != self.current_file:
+            self.load_file(self._scan_first_file)
     
     def load_file(self, filepath):
         """Load an ultrasound file using async loading."""
+        # Re-selecting the active file would tear down and rebuild its pipeline
+        if filepath == self.current_file and self.current_streamer is not None:
+            self.status_bar.showMessage(f"Already loaded: {os.path.basename(filepath)}")
+            return
+        
         # Check if already loading
         if self._load_worker and self._load_worker.isRunning():
-            QMessageBox.warning(self, "載入中", "請等待目前檔案載入完成")
+            self._show_banner("請等待目前檔案載入完成", level="warning")
             return
         
         self.status_bar.showMessage(f"Loading: {filepath}")
@@ -1354,8 +1574,8 @@ class UltrasoundViewerWindow(QMainWindow):
         elif is_video:
             self._start_video_loading(filepath)
         else:
-            # Fall back to sync loading for other file types
-            self._load_file_sync(filepath)
+            # Other file types go through the generic playback pipeline
+            self._start_pipeline_loading(filepath)
     
     def _start_dicom_loading(self, filepath):
         """Start async DICOM loading with progress dialog."""
@@ -1403,7 +1623,7 @@ class UltrasoundViewerWindow(QMainWindow):
         self.toolbar.setEnabled(True)
         
         if not result.success:
-            QMessageBox.critical(self, "載入失敗", result.error_message)
+            self._show_banner(f"載入失敗: {result.error_message}")
             self.status_bar.showMessage("載入失敗")
             return
         
@@ -1415,7 +1635,7 @@ class UltrasoundViewerWindow(QMainWindow):
         self.toolbar.setEnabled(True)
         
         if not result.success:
-            QMessageBox.critical(self, "載入失敗", result.error_message)
+            self._show_banner(f"載入失敗: {result.error_message}")
             self.status_bar.showMessage("載入失敗")
             return
         
@@ -1430,7 +1650,8 @@ class UltrasoundViewerWindow(QMainWindow):
             self.current_file = viewport.current_file
             
             self.is_playing = True
-            self.playback.play_btn.setText("\ue131")  # pause icon
+            self._start_update_timer()
+            self.playback.set_playing(True)
         
         self.file_panel.add_file(result.filepath)
         self.file_panel.select_file(result.filepath)
@@ -1444,7 +1665,7 @@ class UltrasoundViewerWindow(QMainWindow):
             self._load_progress_dialog = None
         
         self.toolbar.setEnabled(True)
-        QMessageBox.critical(self, "載入錯誤", error_message)
+        self._show_banner(f"載入錯誤: {error_message}")
         self.status_bar.showMessage("載入錯誤")
     
     def _on_load_cancelled(self):
@@ -1461,7 +1682,10 @@ class UltrasoundViewerWindow(QMainWindow):
         self.status_bar.showMessage("載入已取消")
     
     def _apply_dicom_result(self, result: DicomLoadResult):
-        """Apply loaded DICOM data to the active viewport."""
+        """
+        Apply loaded DICOM data in two event-loop turns: the cheap panel
+        updates first, so they paint before the viewport pipeline is built.
+        """
         from .annotations import Annotation, Measure
         
         # Set pixel spacing for annotations
@@ -1469,9 +1693,17 @@ class UltrasoundViewerWindow(QMainWindow):
         Measure.set_pixel_spacing(result.pixel_spacing)
         
         # Update patient info panel
-        self.file_panel.update_patient_info(result.metadata)
+        self.file_panel.update_patient_info(result.metadata, result.filepath)
         
-        # Load into active viewport
+        # Add to file list
+        self.file_panel.add_file(result.filepath)
+        self.file_panel.select_file(result.filepath)
+        self.status_bar.showMessage(f"載入中: {os.path.basename(result.filepath)}")
+        
+        QTimer.singleShot(0, partial(self._attach_dicom_result, result))
+    
+    def _attach_dicom_result(self, result: DicomLoadResult):
+        """Load a DICOM result into the active viewport (second step of _apply_dicom_result)."""
         viewport = self.viewport_manager.get_active_viewport()
         if viewport:
             shared_thread = self.viewport_manager._shared_computation_thread
@@ -1493,21 +1725,15 @@ class UltrasoundViewerWindow(QMainWindow):
             
             # Update playback button state
             self.is_playing = True
-            self.playback.play_btn.setText("\ue131")  # pause icon
+            self._start_update_timer()
+            self.playback.set_playing(True)
             
             # Event-driven centering
-            self._center_attempts = 0
-            self._center_timer = QTimer(self)
-            self._center_timer.timeout.connect(self._check_and_center)
-            self._center_timer.start(50)
+            self._center_on_first_frame()
             
             # Set LUT overlay
             self._set_lut_overlay_enabled(self.current_colormap != ColormapType.GRAYSCALE)
         
-        # Add to file list
-        self.file_panel.add_file(result.filepath)
-        self.file_panel.select_file(result.filepath)
-        
         self.status_bar.showMessage(f"已載入: {os.path.basename(result.filepath)}")
         
         if result.pixel_spacing:
@@ -1515,38 +1741,45 @@ class UltrasoundViewerWindow(QMainWindow):
         if result.image_width and result.image_height:
             print(f"Image size: {result.image_width} x {result.image_height}")
     
-    def _load_file_sync(self, filepath):
-        """Fallback synchronous loading for non-DICOM/video files."""
-        try:
-            from .pipelines import create_playback_pipeline
-            
-            streamer = create_playback_pipeline(filepath)
-            
-            if streamer is None:
-                QMessageBox.critical(self, "Error", "Failed to load file")
-                return
-            
-            # Load into active viewport
-            viewport = self.viewport_manager.get_active_viewport()
-            if viewport:
-                shared_thread = self.viewport_manager._shared_computation_thread
-                viewport.load_streamer(streamer, filepath, shared_thread=shared_thread)
-                self.viewport_manager.ensure_computation_thread_running()
-                self._sync_viewport_references()
-                self.current_streamer = viewport.current_streamer
-                self.current_file = viewport.current_file
-                
-                self.is_playing = True
-                self.playback.play_btn.setText("\ue131")  # pause icon
-            
-            self.file_panel.add_file(filepath)
-            self.file_panel.select_file(filepath)
-            
-            self.status_bar.showMessage(f"Loaded: {os.path.basename(filepath)}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load file:\n{str(e)}")
+    def _start_pipeline_loading(self, filepath):
+        """Build the playback pipeline for other file types in the background."""
+        self.status_bar.showMessage(f"Loading: {os.path.basename(filepath)}...")
+        
+        # Viewport filters / frame tap work on grayscale frames
+        self._load_worker = PipelineLoadWorker(filepath, loop=True, force_grayscale=True, parent=self)
+        self._load_worker.finished_loading.connect(self._on_pipeline_load_complete)
+        self._load_worker.error_occurred.connect(self._on_load_error)
+        
+        self.toolbar.setEnabled(False)
+        self._load_worker.start()
+    
+    def _on_pipeline_load_complete(self, result):
+        """Attach a pipeline built by PipelineLoadWorker (runs on the GUI thread)."""
+        self.toolbar.setEnabled(True)
+        
+        if not result.success:
+            self._show_banner(result.error_message)
             self.status_bar.showMessage("Error loading file")
+            return
+        
+        # Load into active viewport (renderer / view setup must stay on this thread)
+        viewport = self.viewport_manager.get_active_viewport()
+        if viewport:
+            shared_thread = self.viewport_manager._shared_computation_thread
+            viewport.load_streamer(result.streamer, result.filepath, shared_thread=shared_thread)
+            self.viewport_manager.ensure_computation_thread_running()
+            self._sync_viewport_references()
+            self.current_streamer = viewport.current_streamer
+            self.current_file = viewport.current_file
+            
+            self.is_playing = True
+            self._start_update_timer()
+            self.playback.set_playing(True)
+        
+        self.file_panel.add_file(result.filepath)
+        self.file_panel.select_file(result.filepath)
+        
+        self.status_bar.showMessage(f"Loaded: {os.path.basename(result.filepath)}")
     
     def setup_pipeline(self):
         """Setup FAST rendering pipeline."""
@@ -1594,13 +1827,11 @@ class UltrasoundViewerWindow(QMainWindow):
             # Start computation thread
             self.computation_thread.start()
             self.is_playing = True
-            self.playback.play_btn.setText("")  # pause icon
+            self._start_update_timer()
+            self.playback.set_playing(True)
             
-            # Event-driven centering: poll until first frame is rendered
-            self._center_attempts = 0
-            self._center_timer = QTimer(self)
-            self._center_timer.timeout.connect(self._check_and_center)
-            self._center_timer.start(50)  # Check every 50ms
+            # Event-driven centering once the first frame is rendered
+            self._center_on_first_frame()
             
             self._set_lut_overlay_enabled(self.current_colormap != ColormapType.GRAYSCALE)
             print(f"Pipeline setup: Colormap={self.current_colormap.name}, Filter={self.current_filter.name}")
@@ -1868,29 +2099,59 @@ class UltrasoundViewerWindow(QMainWindow):
         if self.annotation_overlay:
             self.annotation_overlay.raise_()
     
-    def _check_and_center(self):
-        """Poll to check if first frame is rendered, then center the image."""
-        self._center_attempts += 1
+    def _center_on_first_frame(self):
+        """
+        Recenter the camera once the new stream's first frame is out.
         
-        try:
-            # Check if streamer has started producing frames
-            if self.current_streamer and hasattr(self.current_streamer, 'getCurrentFrameIndex'):
-                frame_idx = self.current_streamer.getCurrentFrameIndex()
-                if frame_idx >= 0:  # First frame has been rendered
-                    self._center_timer.stop()
-                    self.fast_view.recalculateCamera() # 重新計算相機位置，根據場景邊界框自動調整
-                    print(f"Image centered after {self._center_attempts * 50}ms")
-                    return
-        except:
-            pass
+        The frame tap reports the first frame through first_frame_ready, so
+        centering happens as soon as the frame exists; the timer only fires
+        if it never arrives. Without a frame tap, fall back to polling.
+        """
+        self._center_interval = self.CENTER_POLL_MIN_MS
+        self._center_elapsed = 0
+        tap = self.lut_overlay_processor
+        self._center_by_callback = tap is not None and hasattr(tap, 'setFirstFrameCallback')
+        if self._center_by_callback:
+            tap.setFirstFrameCallback(self.first_frame_ready.emit)
+            self._center_timer.start(self.CENTER_TIMEOUT_MS)
+        else:
+            self._center_timer.start(self._center_interval)
+    
+    def _on_first_frame_ready(self):
+        """Center the image on the first frame of the current stream."""
+        if not self._center_timer.isActive():
+            return  # Late report from a replaced pipeline, or already centered
+        self._center_timer.stop()
+        if self.fast_view:
+            self.fast_view.recalculateCamera() # 重新計算相機位置，根據場景邊界框自動調整
+        print("Image centered on first frame")
+    
+    def _check_and_center(self):
+        """Poll (with exponential backoff) for the first frame, then center the image."""
+        if not self._center_by_callback:
+            self._center_elapsed += self._center_interval
+            try:
+                # Check if streamer has started producing frames
+                if self._streamer_caps.get_frame:
+                    frame_idx = self._streamer_caps.get_frame()
+                    if frame_idx >= 0:  # First frame has been rendered
+                        self.fast_view.recalculateCamera() # 重新計算相機位置，根據場景邊界框自動調整
+                        print(f"Image centered after {self._center_elapsed}ms")
+                        return
+            except RuntimeError:
+                pass
+            
+            # Keep polling for up to 2 seconds, backing off 10, 20, 40... ms
+            remaining = self.CENTER_TIMEOUT_MS - self._center_elapsed
+            if remaining > 0:
+                self._center_interval = min(self._center_interval * 2, self.CENTER_POLL_MAX_MS, remaining)
+                self._center_timer.start(self._center_interval)
+                return
         
-        # Stop after max attempts (2 seconds)
-        if self._center_attempts >= 40:
-            self._center_timer.stop()
-            # Fallback: try to center anyway
-            if self.fast_view:
-                self.fast_view.recalculateCamera() # 重新計算相機位置，根據場景邊界框自動調整
-            print("Image centered (fallback after timeout)")
+        # Fallback: no first frame in time, try to center anyway
+        if self.fast_view:
+            self.fast_view.recalculateCamera() # 重新計算相機位置，根據場景邊界框自動調整
+        print("Image centered (fallback after timeout)")
     
     @Slot(QListWidgetItem)
     def on_file_selected(self, item):
@@ -1905,67 +2166,99 @@ class UltrasoundViewerWindow(QMainWindow):
         if self.current_streamer:
             if self.is_playing:
                 # Pause
-                if hasattr(self.current_streamer, 'setPause'):
-                    self.current_streamer.setPause(True)
-                self.playback.play_btn.setText("")  # play icon
+                if self._streamer_caps.set_pause:
+                    self._streamer_caps.set_pause(True)
+                self.playback.set_playing(False)
                 self.is_playing = False
+                self._stop_update_timer()
                 self.status_bar.showMessage("Paused")
             else:
                 # Play
-                if hasattr(self.current_streamer, 'setPause'):
-                    self.current_streamer.setPause(False)
-                self.playback.play_btn.setText("")  # pause icon
+                if self._streamer_caps.set_pause:
+                    self._streamer_caps.set_pause(False)
+                self.playback.set_playing(True)
                 self.is_playing = True
+                self._start_update_timer()
                 self.status_bar.showMessage("Playing")
     
     @Slot(int)
     def on_frame_slider_changed(self, value):
-        """Handle frame slider change."""
-        if self.current_streamer and hasattr(self.current_streamer, 'setCurrentFrameIndex'):
-            self.current_streamer.setCurrentFrameIndex(value)
+        """Handle frame slider change (debounced, see _apply_pending_seek)."""
+        if self._streamer_caps.set_frame:
+            self._pending_seek = value
+            self._seek_timer.start()
+    
+    def _apply_pending_seek(self):
+        """Seek to the slider value the last drag burst ended on."""
+        value, self._pending_seek = self._pending_seek, None
+        if value is not None and self._streamer_caps.set_frame:
+            self._seek_to(value)
     
     def on_slider_pressed(self):
         """Pause when user starts dragging slider."""
         if self.is_playing and self.current_streamer:
-            if hasattr(self.current_streamer, 'setPause'):
-                self.current_streamer.setPause(True)
+            if self._streamer_caps.set_pause:
+                self._streamer_caps.set_pause(True)
     
     def on_slider_released(self):
         """Resume if was playing when user releases slider."""
         if self.is_playing and self.current_streamer:
-            if hasattr(self.current_streamer, 'setPause'):
-                self.current_streamer.setPause(False)
+            if self._streamer_caps.set_pause:
+                self._streamer_caps.set_pause(False)
+    
+    def _seek_to(self, index):
+        """Seek the current streamer; while paused, refresh frame info once the frame is shown."""
+        self._streamer_caps.set_frame(index)
+        self.current_frame = index
+        if not self.is_playing:
+            self._frame_info_timer.start()
     
     def update_frame_info(self):
         """Update frame info and progress bar."""
-        if self.current_streamer:
-            try:
-                # Get current frame from streamer
-                if hasattr(self.current_streamer, 'getCurrentFrameIndex'):
-                    self.current_frame = self.current_streamer.getCurrentFrameIndex()
-                if hasattr(self.current_streamer, 'getNrOfFrames'):
-                    self.total_frames = self.current_streamer.getNrOfFrames()
-                
-                # Update slider (without triggering valueChanged)
-                if self.total_frames > 0:
-                    self.playback.frame_slider.blockSignals(True)
-                    self.playback.frame_slider.setMaximum(self.total_frames - 1)
-                    self.playback.frame_slider.setValue(self.current_frame)
-                    self.playback.frame_slider.blockSignals(False)
-                
-                # Update frame label
-                self.playback.frame_label.setText(f"Frame: {self.current_frame + 1} / {self.total_frames}")
-                
-                # Update time display
-                self.playback.update_time_display(self.current_frame, self.total_frames)
-                
-                # Update W/L display
-                self.playback.wl_label.setText(f"W: {self.intensity_window:.0f}  L: {self.intensity_level:.0f}")
-            except:
-                pass
+        if self.current_streamer is None:
+            return
+        
+        # Get current frame from streamer
+        caps = self._streamer_caps
+        try:
+            if caps.get_frame:
+                self.current_frame = caps.get_frame()
+            if caps.n_frames:
+                self.total_frames = caps.n_frames()
+        except RuntimeError:
+            return  # Streamer torn down under us (FAST errors surface as RuntimeError)
+        
+        # The timer ticks faster than slow streams advance: only touch
+        # the slider and labels when the frame actually changed
+        frame_key = (self.current_frame, self.total_frames)
+        if frame_key != self._last_frame_key:
+            self._last_frame_key = frame_key
+            
+            # Update slider (without triggering valueChanged)
+            if self.total_frames > 0:
+                blocker = QSignalBlocker(self.playback.frame_slider)
+                self.playback.frame_slider.setMaximum(self.total_frames - 1)
+                self.playback.frame_slider.setValue(self.current_frame)
+                blocker.unblock()
+            
+            # Update frame label
+            self.playback.frame_label.setText(f"Frame: {self.current_frame + 1} / {self.total_frames}")
+            
+            # Update time display
+            self.playback.update_time_display(self.current_frame, self.total_frames)
+        
+        # Update W/L display
+        self._update_wl_display()
     
     def set_tool(self, tool_name):
         """Set current tool and update view interaction mode."""
+        # Re-selecting the active tool (e.g. Esc with no tool) is a no-op,
+        # unless the active viewport's overlay is not set up for it yet
+        # (overlays are per viewport; another one may have been active)
+        if tool_name == self.current_tool:
+            overlay_tool = self._overlay_tool()
+            if tool_name == 'annotate' or overlay_tool == (tool_name if tool_name == 'wl' else None):
+                return
         self.current_tool = tool_name
         self.status_bar.showMessage(f"Tool: {tool_name.capitalize()}")
         
@@ -1983,7 +2276,7 @@ class UltrasoundViewerWindow(QMainWindow):
         if self.fast_view:
             if tool_name == 'wl':
                 # Enable overlay for W/L drag
-                if self.annotation_overlay:
+                if self._ensure_overlay():
                     self.annotation_overlay.setAttribute(Qt.WA_TransparentForMouseEvents, False)
                     self.annotation_overlay.set_tool('wl')
                 self.status_bar.showMessage(f"W/L: Drag to adjust | W:{self.intensity_window:.0f} L:{self.intensity_level:.0f}")
@@ -1992,13 +2285,16 @@ class UltrasoundViewerWindow(QMainWindow):
     
     def set_annotation_tool(self, tool_type):
         """Set the current annotation tool type."""
+        if ((self.current_tool, self.current_annotation_tool) == ('annotate', tool_type)
+                and self._overlay_tool() == tool_type):
+            return
         self.current_tool = 'annotate'
         self.current_annotation_tool = tool_type
         self.toolbar.annotate_button.setChecked(True)
         self.toolbar.measure_button.setChecked(False)  # Uncheck measure button
         
         # Enable annotation overlay for drawing
-        if self.annotation_overlay:
+        if self._ensure_overlay():
             self.annotation_overlay.setAttribute(Qt.WA_TransparentForMouseEvents, False)
             self.annotation_overlay.set_tool(tool_type)
         
@@ -2022,7 +2318,7 @@ class UltrasoundViewerWindow(QMainWindow):
         self.toolbar.annotate_button.setChecked(False)  # Uncheck annotate button
         
         # Enable annotation overlay for drawing measurements
-        if self.annotation_overlay:
+        if self._ensure_overlay():
             self.annotation_overlay.setAttribute(Qt.WA_TransparentForMouseEvents, False)
             self.annotation_overlay.set_tool(tool_type)
         
@@ -2044,15 +2340,24 @@ class UltrasoundViewerWindow(QMainWindow):
         else:
             self.status_bar.showMessage(f"Measure: {tool_names.get(tool_type, tool_type)} - Click and drag to measure")
     
+    def _schedule_overlay_update(self):
+        """Repaint the annotation overlay once the current burst of changes is done."""
+        if self.annotation_overlay and not self._overlay_update_timer.isActive():
+            self._overlay_update_timer.start()
+    
+    def _do_overlay_update(self):
+        """Repaint the annotation overlay (see _schedule_overlay_update)."""
+        if self.annotation_overlay:
+            self.annotation_overlay.update()
+    
     def on_measure_added(self, measure):
         """Handle new measurement from overlay."""
         # Note: FAST LineRenderer is disabled - Qt AnnotationOverlay handles all rendering
         # Add to overlay's measurement list for rendering
         if self.annotation_overlay:
-            if measure not in self.annotation_overlay.measurements:
-                self.annotation_overlay.measurements.append(measure)
+            self.annotation_overlay.measurements.setdefault(measure.id, measure)
             # Trigger repaint to draw shapes and text labels
-            self.annotation_overlay.update()
+            self._schedule_overlay_update()
         
         # Show measurement result in status bar
         measurements = measure.get_measurements()
@@ -2066,7 +2371,7 @@ class UltrasoundViewerWindow(QMainWindow):
         # Clear from annotation overlay
         if self.annotation_overlay:
             self.annotation_overlay.measurements.clear()
-            self.annotation_overlay.update()
+            self._schedule_overlay_update()
         
         self.status_bar.showMessage("All measurements cleared", 3000)
     
@@ -2078,15 +2383,13 @@ class UltrasoundViewerWindow(QMainWindow):
     
     def on_annotation_visibility_changed(self, annotation, visible):
         """Handle annotation visibility toggle from layer panel."""
-        if self.annotation_overlay:
-            self.annotation_overlay.update()  # Refresh display
+        self._schedule_overlay_update()  # Refresh display
         # Note: FAST LineRenderer is disabled - Qt AnnotationOverlay handles all rendering
     
     def on_annotation_class_changed(self, annotation, class_type):
         """Handle annotation class type change from layer panel."""
         # Note: FAST LineRenderer is disabled - Qt AnnotationOverlay handles all rendering
-        if self.annotation_overlay:
-            self.annotation_overlay.update()  # Refresh display
+        self._schedule_overlay_update()  # Refresh display
     
     def on_annotation_added(self, annotation):
         """Handle new annotation added."""
@@ -2104,31 +2407,57 @@ class UltrasoundViewerWindow(QMainWindow):
         pass
     
     def on_wl_changed(self, delta_window, delta_level):
-        """Handle Window/Level drag changes."""
+        """Handle Window/Level drag changes (coalesced, see _flush_wl)."""
+        self._pending_dw += delta_window
+        self._pending_dl += delta_level
+        if not self._wl_flush_timer.isActive():
+            self._wl_flush_timer.start()
+    
+    def _flush_wl(self):
+        """Apply the W/L drag deltas accumulated since the last flush."""
+        delta_window, delta_level = self._pending_dw, self._pending_dl
+        self._pending_dw = self._pending_dl = 0.0
+        
         # Update values (clamp to reasonable ranges)
-        self.intensity_window = max(1, min(1000, self.intensity_window + delta_window))
-        self.intensity_level = max(0, min(500, self.intensity_level + delta_level))
+        window = min(max(self.intensity_window + delta_window, self.WL_WINDOW_MIN), self.WL_WINDOW_MAX)
+        level = min(max(self.intensity_level + delta_level, self.WL_LEVEL_MIN), self.WL_LEVEL_MAX)
+        if window == self.intensity_window and level == self.intensity_level:
+            return  # Dragging past a limit, nothing to apply
+        self.intensity_window, self.intensity_level = window, level
         
         # Apply to renderer
         if self.renderer:
             try:
                 self.renderer.setIntensityWindow(self.intensity_window)
                 self.renderer.setIntensityLevel(self.intensity_level)
-            except:
-                pass
+            except RuntimeError as e:
+                print(f"Failed to apply W/L: {e}")
         
-        # Update status bar
-        self.status_bar.showMessage(f"W/L: W:{self.intensity_window:.0f} L:{self.intensity_level:.0f}")
+        # Update status bar (the W/L label too, since frame info only refreshes while playing)
+        self._update_wl_display(show_status=True)
+    
+    def _update_wl_display(self, show_status=False):
+        """Show the current W/L in the playback bar (and status bar); skipped if unchanged."""
+        wl_key = (round(self.intensity_window), round(self.intensity_level))
+        if wl_key == self._last_wl_key:
+            return
+        self._last_wl_key = wl_key
+        self.playback.wl_label.setText(f"W: {wl_key[0]}  L: {wl_key[1]}")
+        if show_status:
+            self.status_bar.showMessage(f"W/L: W:{wl_key[0]} L:{wl_key[1]}")
     
     def reset_view(self):
         """Reset view to default zoom and pan."""
         self.zoom_level = 1.0
+        tap = self.lut_overlay_processor
+        if tap is not None and hasattr(tap, 'getRotation') and tap.getRotation():
+            self._set_rotation(0)
         self.rotation_angle = 0
         
         if self.fast_view:
             try:
-                # Directly call FAST API to reset camera (fits view to content)
-                self.fast_view.setAutoUpdateCamera(True)
+                # Directly call FAST API to reset camera (fits view to content);
+                # auto camera updates are already enabled when the view is created
                 self.fast_view.recalculateCamera()
                 
                 self.status_bar.showMessage("View reset to default")
@@ -2158,6 +2487,8 @@ class UltrasoundViewerWindow(QMainWindow):
     def toggle_layers_panel(self):
         """Toggle visibility of the layers panel."""
         sizes = self.main_splitter.sizes()
+        # Syncing the button below must not re-enter this slot through toggled
+        blocker = QSignalBlocker(self.toolbar.layers_button)
         
         if sizes[2] > 0:
             # Panel is visible, hide it by saving current size and setting to 0
@@ -2173,164 +2504,172 @@ class UltrasoundViewerWindow(QMainWindow):
             self.main_splitter.setSizes(sizes)
             self.toolbar.layers_button.setChecked(True)
             self.status_bar.showMessage("Layers panel shown")
+        blocker.unblock()
     
     def rotate_image(self):
         """Rotate the image by 90 degrees."""
-        self.rotation_angle = (self.rotation_angle + 90) % 360
+        tap = self.lut_overlay_processor
+        if tap is None or not hasattr(tap, 'setRotation'):
+            self.status_bar.showMessage("Rotation not available for this image")
+            return
+        self._set_rotation((tap.getRotation() + 90) % 360)
+    
+    def _set_rotation(self, angle):
+        """Attach a precomputed rotation to the displayed frames and refit the camera."""
+        try:
+            # The frame tap sets it as the image transform; the renderer applies it
+            self.lut_overlay_processor.setRotation(angle)
+        except RuntimeError as e:
+            self.status_bar.showMessage(f"Rotation: {e}")
+            return
+        self.rotation_angle = angle
         self.status_bar.showMessage(f"Rotation: {self.rotation_angle}°")
-        
-        # Apply rotation to FAST view
-        if self.fast_view:
-            try:
-                # FAST View rotation (if supported)
-                # Note: FAST's View doesn't have direct rotation, 
-                # we'd need to apply a transform to the renderer
-                pass
-            except:
-                pass
+        # Refit once a frame with the new transform is out
+        self._center_on_first_frame()
+    
+    def _step_due(self):
+        """Rate-limit single-frame steps, so a held arrow key steps at most STEP_RATE per second."""
+        now = time.monotonic()
+        if now - self._last_step_ts < 1.0 / self.STEP_RATE:
+            return False
+        self._last_step_ts = now
+        return True
     
     def prev_frame(self):
         """Go to previous frame."""
-        if self.current_streamer and hasattr(self.current_streamer, 'setCurrentFrameIndex'):
+        if self._streamer_caps.set_frame and self._step_due():
             new_frame = max(0, self.current_frame - 1)
-            self.current_streamer.setCurrentFrameIndex(new_frame)
+            self._seek_to(new_frame)
     
     def next_frame(self):
         """Go to next frame."""
-        if self.current_streamer and hasattr(self.current_streamer, 'setCurrentFrameIndex'):
+        if self._streamer_caps.set_frame and self._step_due():
             new_frame = min(self.total_frames - 1, self.current_frame + 1)
-            self.current_streamer.setCurrentFrameIndex(new_frame)
+            self._seek_to(new_frame)
     
     def first_frame(self):
         """Go to first frame."""
-        if self.current_streamer and hasattr(self.current_streamer, 'setCurrentFrameIndex'):
-            self.current_streamer.setCurrentFrameIndex(0)
+        if self._streamer_caps.set_frame:
+            self._seek_to(0)
             self.status_bar.showMessage("Jumped to first frame")
     
     def last_frame(self):
         """Go to last frame."""
-        if self.current_streamer and hasattr(self.current_streamer, 'setCurrentFrameIndex'):
-            self.current_streamer.setCurrentFrameIndex(max(0, self.total_frames - 1))
+        if self._streamer_caps.set_frame:
+            self._seek_to(max(0, self.total_frames - 1))
             self.status_bar.showMessage("Jumped to last frame")
     
     def rewind_frames(self):
         """Rewind 5 frames."""
-        if self.current_streamer and hasattr(self.current_streamer, 'setCurrentFrameIndex'):
+        if self._streamer_caps.set_frame:
             new_frame = max(0, self.current_frame - 5)
-            self.current_streamer.setCurrentFrameIndex(new_frame)
+            self._seek_to(new_frame)
     
     def forward_frames(self):
         """Forward 5 frames."""
-        if self.current_streamer and hasattr(self.current_streamer, 'setCurrentFrameIndex'):
+        if self._streamer_caps.set_frame:
             new_frame = min(self.total_frames - 1, self.current_frame + 5)
-            self.current_streamer.setCurrentFrameIndex(new_frame)
+            self._seek_to(new_frame)
     
     def toggle_loop(self, enabled):
         """Toggle loop playback."""
-        if self.current_streamer and hasattr(self.current_streamer, 'setLooping'):
-            self.current_streamer.setLooping(enabled)
+        if self._streamer_caps.set_looping:
+            self._streamer_caps.set_looping(enabled)
         self.status_bar.showMessage(f"Loop: {'On' if enabled else 'Off'}")
     
     @Slot()
     def take_screenshot(self):
-        """Take a screenshot of the current view."""
-        if self.fast_view:
-            try:
-                filepath, _ = QFileDialog.getSaveFileName(
-                    self,
-                    "Save Screenshot",
-                    "screenshot.png",
-                    "PNG Files (*.png);;JPEG Files (*.jpg)"
-                )
-                if filepath:
-                    # Use FAST's screenshot capability
-                    self.fast_view.takeScreenshot(filepath)
-                    self.status_bar.showMessage(f"Screenshot saved: {filepath}")
-            except Exception as e:
-                QMessageBox.warning(self, "Warning", f"Could not save screenshot:\n{str(e)}")
+        """
+        Take a screenshot of the current view.
+        
+        The save dialog is opened with open() rather than a blocking
+        getSaveFileName, so playback keeps running while it is shown.
+        """
+        if not self.fast_view:
+            return
+        if self._screenshot_dialog is None:
+            dialog = QFileDialog(self, "Save Screenshot", "screenshot.png",
+                                 "PNG Files (*.png);;JPEG Files (*.jpg)")
+            dialog.setAcceptMode(QFileDialog.AcceptSave)
+            dialog.setFileMode(QFileDialog.AnyFile)
+            dialog.fileSelected.connect(self._save_screenshot)
+            self._screenshot_dialog = dialog
+        self._screenshot_dialog.open()
+    
+    def _save_screenshot(self, filepath):
+        """Write the frame currently shown to `filepath` (chosen in the save dialog)."""
+        if not filepath or not self.fast_view:
+            return
+        try:
+            # Use FAST's screenshot capability
+            self.fast_view.takeScreenshot(filepath)
+            self.status_bar.showMessage(f"Screenshot saved: {filepath}")
+        except Exception as e:
+            self._show_banner(f"Could not save screenshot: {e}", level="warning")
     
     def setup_shortcuts(self):
-        """Setup keyboard shortcuts."""
-        # Shortcuts dialog - use Shift+/ for ? key, and also F1
-        self.shortcut_help = QShortcut(QKeySequence("?"), self)
-        self.shortcut_help.activated.connect(lambda: self.show_help_dialog(1))
-        
-        # Playback shortcuts
-        self.shortcut_space = QShortcut(QKeySequence(Qt.Key_Space), self)
-        self.shortcut_space.activated.connect(self.toggle_playback)
-        
-        self.shortcut_home = QShortcut(QKeySequence(Qt.Key_Home), self)
-        self.shortcut_home.activated.connect(self.first_frame)
-        
-        self.shortcut_end = QShortcut(QKeySequence(Qt.Key_End), self)
-        self.shortcut_end.activated.connect(self.last_frame)
-        
-        self.shortcut_left = QShortcut(QKeySequence(Qt.Key_Left), self)
-        self.shortcut_left.activated.connect(self.prev_frame)
-        
-        self.shortcut_right = QShortcut(QKeySequence(Qt.Key_Right), self)
-        self.shortcut_right.activated.connect(self.next_frame)
-        
-        self.shortcut_shift_left = QShortcut(QKeySequence("Shift+Left"), self)
-        self.shortcut_shift_left.activated.connect(self.rewind_frames)
-        
-        self.shortcut_shift_right = QShortcut(QKeySequence("Shift+Right"), self)
-        self.shortcut_shift_right.activated.connect(self.forward_frames)
-        
-        self.shortcut_loop = QShortcut(QKeySequence("L"), self)
-        self.shortcut_loop.activated.connect(lambda: self.playback.loop_btn.toggle())
-        
-        # View shortcuts
-        self.shortcut_reset = QShortcut(QKeySequence("R"), self)
-        self.shortcut_reset.activated.connect(self.reset_view)
-        
-        # Tool shortcuts
-        self.shortcut_wl = QShortcut(QKeySequence("W"), self)
-        self.shortcut_wl.activated.connect(lambda: self.toolbar.wl_action.trigger())
-        
-        self.shortcut_annotate = QShortcut(QKeySequence("A"), self)
-        self.shortcut_annotate.activated.connect(lambda: self.toolbar.annotate_button.click())
-        
-        self.shortcut_line = QShortcut(QKeySequence("1"), self)
-        self.shortcut_line.activated.connect(lambda: self.set_annotation_tool('line'))
-        
-        self.shortcut_rect = QShortcut(QKeySequence("2"), self)
-        self.shortcut_rect.activated.connect(lambda: self.set_annotation_tool('rectangle'))
-        
-        self.shortcut_polygon = QShortcut(QKeySequence("3"), self)
-        self.shortcut_polygon.activated.connect(lambda: self.set_annotation_tool('polygon'))
-        
-        self.shortcut_escape = QShortcut(QKeySequence(Qt.Key_Escape), self)
-        self.shortcut_escape.activated.connect(lambda: self.set_tool('none'))
-        
-        # Panel shortcuts
-        self.shortcut_layers = QShortcut(QKeySequence("P"), self)
-        self.shortcut_layers.activated.connect(self.toggle_layers_panel)
-        
-        # Image processing shortcuts
-        self.shortcut_colormap = QShortcut(QKeySequence("C"), self)
-        self.shortcut_colormap.activated.connect(lambda: self.toolbar.colormap_button.showMenu())
-        
-        self.shortcut_filter = QShortcut(QKeySequence("F"), self)
-        self.shortcut_filter.activated.connect(lambda: self.toolbar.filter_button.showMenu())
-        
-        # Layout shortcuts (Ctrl+1/2/3/4)
-        self.shortcut_layout_1x1 = QShortcut(QKeySequence("Ctrl+1"), self)
-        self.shortcut_layout_1x1.activated.connect(lambda: self.viewport_manager.set_layout('1x1'))
-        
-        self.shortcut_layout_1x2 = QShortcut(QKeySequence("Ctrl+2"), self)
-        self.shortcut_layout_1x2.activated.connect(lambda: self.viewport_manager.set_layout('1x2'))
+        """
+        Setup keyboard shortcuts from one key -> handler table.
         
-        self.shortcut_layout_2x1 = QShortcut(QKeySequence("Ctrl+3"), self)
-        self.shortcut_layout_2x1.activated.connect(lambda: self.viewport_manager.set_layout('2x1'))
+        They stay QShortcuts: Qt resolves all of them in a single
+        shortcut-map lookup per key press, and unlike a window
+        keyPressEvent they still fire while the tree, the FAST view or
+        another child widget has focus.
+        """
+        toolbar = self.toolbar
+        layout = self.viewport_manager.set_layout
+        key_handlers = {
+            # Shortcuts dialog - use Shift+/ for ? key
+            "?": partial(self.show_help_dialog, 1),
+            
+            # Playback shortcuts
+            Qt.Key_Space: self.toggle_playback,
+            Qt.Key_Home: self.first_frame,
+            Qt.Key_End: self.last_frame,
+            Qt.Key_Left: self.prev_frame,
+            Qt.Key_Right: self.next_frame,
+            "Shift+Left": self.rewind_frames,
+            "Shift+Right": self.forward_frames,
+            "L": self.playback.loop_btn.toggle,
+            
+            # View shortcuts
+            "R": self.reset_view,
+            
+            # Tool shortcuts
+            "W": toolbar.wl_action.click,
+            "A": toolbar.annotate_button.click,
+            "1": partial(self.set_annotation_tool, 'line'),
+            "2": partial(self.set_annotation_tool, 'rectangle'),
+            "3": partial(self.set_annotation_tool, 'polygon'),
+            Qt.Key_Escape: partial(self.set_tool, 'none'),
+            
+            # Panel shortcuts
+            "P": self.toggle_layers_panel,
+            
+            # Image processing shortcuts
+            "C": toolbar.colormap_button.showMenu,
+            "F": toolbar.filter_button.showMenu,
+            
+            # Layout shortcuts (Ctrl+1/2/3/4)
+            "Ctrl+1": partial(layout, '1x1'),
+            "Ctrl+2": partial(layout, '1x2'),
+            "Ctrl+3": partial(layout, '2x1'),
+            "Ctrl+4": partial(layout, '2x2'),
+        }
         
-        self.shortcut_layout_2x2 = QShortcut(QKeySequence("Ctrl+4"), self)
-        self.shortcut_layout_2x2.activated.connect(lambda: self.viewport_manager.set_layout('2x2'))
+        self._shortcuts = []
+        for key, handler in key_handlers.items():
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(handler)
+            self._shortcuts.append(shortcut)
     
     def show_help_dialog(self, initial_tab=0):
-        """Show the Help/Shortcuts dialog."""
-        dialog = HelpDialog(self, initial_tab=initial_tab)
-        dialog.exec_()
+        """Show the Help/Shortcuts dialog (built on first use, then reused)."""
+        if self._help_dialog is None:
+            self._help_dialog = HelpDialog(self, initial_tab=initial_tab)
+        else:
+            self._help_dialog.tabs.setCurrentIndex(initial_tab)
+        self._help_dialog.exec_()
     
     # ==================== Image Processing Methods ====================
     
@@ -2410,20 +2749,66 @@ class UltrasoundViewerWindow(QMainWindow):
         if self.current_filter != FilterType.NONE:
             print(f"Image processing active: Filter={filter_name} ({int(self.filter_strength * 100)}%)")
 
+    def hideEvent(self, event):
+        """Stop the UI refresh timers while the window is hidden or minimized."""
+        self._stop_ui_timers()
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        """Restart the UI refresh timers when the window is shown again."""
+        super().showEvent(event)
+        self.lut_overlay_timer.start(33)
+        self.annotation_update_timer.start(50)
+        self._start_update_timer()
+    
+    def _start_update_timer(self):
+        """Refresh frame info periodically, only while a stream plays in a visible window."""
+        if self.current_streamer is not None and self.is_playing and self.isVisible():
+            self.update_timer.start(self.FRAME_INFO_INTERVAL_MS)
+    
+    def _stop_update_timer(self):
+        self.update_timer.stop()
+    
+    def _stop_ui_timers(self):
+        """Stop the timers that only refresh on-screen widgets."""
+        self._stop_update_timer()
+        self.lut_overlay_timer.stop()
+        self.annotation_update_timer.stop()
+    
     def closeEvent(self, event):
         """
         Handle window close with proper cleanup order.
         
-        Critical cleanup sequence to prevent mutex lock and bus errors:
-        1. Stop ViewportManager's shared ComputationThread
-        2. Clean up each Viewport's FAST resources (views, renderers)
-        3. Wait briefly for C++ layer to complete cleanup
-        4. Accept close event and let Qt destroy widgets
+        The first close only hides the window and defers the FAST cleanup
+        to the next event loop turn, so the window disappears at once
+        instead of freezing while the threads shut down:
+        1. Hide the window (stops the UI refresh timers) and ignore the event
+        2. _release_fast_resources() stops the threads and frees FAST objects
+        3. close() again, which is accepted and lets Qt destroy widgets
         
-        This ensures FAST threads are fully stopped and resources are released
-        before Qt destroys the widget hierarchy.
+        Widgets stay alive until step 3, so FAST threads are still fully
+        stopped before Qt destroys the widget hierarchy.
         """
+        if self._fast_released:
+            print("[Cleanup] Cleanup complete, accepting close event")
+            event.accept()
+            return
+        
         print("[Cleanup] Application closing...")
+        event.ignore()
+        self.hide()
+        QTimer.singleShot(0, self._release_and_close)
+    
+    def _release_and_close(self):
+        """Release FAST resources, then close the (already hidden) window for real."""
+        self._release_fast_resources()
+        self._fast_released = True
+        self.close()
+    
+    def _release_fast_resources(self):
+        """Stop FAST computation threads and clean up viewports (see closeEvent)."""
+        # Nothing on screen needs refreshing any more
+        self._stop_ui_timers()
         
         # CRITICAL: Stop ViewportManager's shared computation thread BEFORE Qt destroys widgets
         # This prevents "mutex lock failed" error caused by thread accessing destroyed View objects
@@ -2462,9 +2847,27 @@ class UltrasoundViewerWindow(QMainWindow):
                 print("[Cleanup] Legacy thread stopped")
             except Exception as e:
                 print(f"[Cleanup] Error stopping legacy thread: {e}")
-        
-        print("[Cleanup] Cleanup complete, accepting close event")
-        event.accept()
+
+
+# Lucide icon font, registered after the first paint (see run_qt_app)
+LUCIDE_FONT_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'fonts', 'lucide.ttf')
+
+
+def _load_icon_font(app, window):
+    """Register the Lucide icon font and refresh the glyphs drawn before it existed."""
+    from PySide2.QtGui import QFontDatabase
+    if not os.path.exists(LUCIDE_FONT_PATH):
+        return
+    font_id = QFontDatabase.addApplicationFont(LUCIDE_FONT_PATH)
+    if font_id >= 0:
+        print(f"Lucide icon font loaded successfully")
+        # Icons and widgets created before the font existed drew fallback glyphs
+        clear_glyph_icons()
+        window.playback.refresh_icons()
+        for widget in app.topLevelWidgets():
+            widget.update()
+    else:
+        print(f"Failed to load Lucide icon font")
 
 
 def run_qt_app(filepath=None):
@@ -2479,16 +2882,6 @@ def run_qt_app(filepath=None):
     default_font.setStyleHint(QFont.SansSerif)
     app.setFont(default_font)
     
-    # Load Lucide icon font
-    from PySide2.QtGui import QFontDatabase
-    font_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'fonts', 'lucide.ttf')
-    if os.path.exists(font_path):
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id >= 0:
-            print(f"Lucide icon font loaded successfully")
-        else:
-            print(f"Failed to load Lucide icon font")
-    
     # Create and show window
     window = UltrasoundViewerWindow()
     
@@ -2498,5 +2891,8 @@ def run_qt_app(filepath=None):
     
     window.show()
     
+    # Parse the icon font once the event loop is running, after the first paint
+    QTimer.singleShot(0, partial(_load_icon_font, app, window))
+    
     # Run event loop
     return app.exec_()
@@ -6,18 +6,46 @@ into a Patient → Study → Series hierarchy with thumbnail preview support.
 """
 
 import os
+import re
 import numpy as np
 
 from PySide2.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeView, QLabel, QPushButton,
-    QStyledItemDelegate, QAbstractItemView, QStyle
+    QStyledItemDelegate, QStyleOptionViewItem, QAbstractItemView, QStyle
 )
-from PySide2.QtCore import Qt, QSize
+from PySide2.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide2.QtGui import (
-    QFont, QColor, QImage, QPixmap, QPainter,
+    QFont, QColor, QBrush, QImage, QPixmap, QPainter,
     QStandardItemModel, QStandardItem
 )
 
+from .loaders import read_dicom_header
+from .ui_cache import glyph_icon, cached_font
+
+
+# Browser palette; the stylesheets below and the series delegate share it
+ACCENT_COLOR = "#0078d4"
+PANEL_COLOR = "#2d2d30"
+BORDER_COLOR = "#3e3e42"
+_PALETTE = {'accent': ACCENT_COLOR, 'panel': PANEL_COLOR, 'border': BORDER_COLOR}
+
+_DICOM_DATE_RE = re.compile(r'^(\d{4})(\d{2})(\d{2})$')
+
+# Patient info panel rows: (metadata key, pre-built HTML row template)
+_PATIENT_INFO_ROWS = (
+    ('PatientName', "<b>Patient:</b> {}"),
+    ('StudyDate', "<b>Date:</b> {}"),
+    ('Modality', "<b>Modality:</b> {}"),
+    ('Manufacturer', "<b>Device:</b> {}"),
+    ('InstitutionName', "<b>Institution:</b> {}"),
+    ('NumberOfFrames', "<b>Frames:</b> {}"),
+)
+
+
+def format_dicom_date(date):
+    """Format a DICOM DA value (YYYYMMDD) as YYYY/MM/DD; other values pass through."""
+    return _DICOM_DATE_RE.sub(r'\1/\2/\3', date)
+
 
 class ThumbnailCache:
     """LRU cache for series thumbnails."""
@@ -52,8 +80,11 @@ class ThumbnailCache:
         return filepath in self._cache
     
     @staticmethod
-    def generate_thumbnail(filepath, size=48):
-        """Generate thumbnail from DICOM first frame."""
+    def generate_thumbnail_image(filepath, size=48):
+        """
+        Generate a thumbnail QImage from the DICOM first frame.
+        Uses only QImage (no QPixmap), so it can run on a worker thread.
+        """
         try:
             import pydicom
             ds = pydicom.dcmread(filepath, stop_before_pixels=False)
@@ -80,24 +111,178 @@ class ThumbnailCache:
                 else:
                     img = QImage(arr.data, w, h, w * 3, QImage.Format_RGB888)
                 
-                # Scale to thumbnail size
-                pixmap = QPixmap.fromImage(img).scaled(
+                # Scale to thumbnail size (the scaled image owns its pixels)
+                return img.scaled(
                     size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation
                 )
-                return pixmap
         except Exception as e:
             print(f"Thumbnail generation failed for {filepath}: {e}")
         
         return None
+    
+    @staticmethod
+    def generate_thumbnail(filepath, size=48):
+        """Generate thumbnail from DICOM first frame (GUI thread only)."""
+        img = ThumbnailCache.generate_thumbnail_image(filepath, size)
+        return QPixmap.fromImage(img) if img is not None else None
+
+
+def read_study_metadata(filepath):
+    """
+    Read the study tree metadata of a DICOM file (no pixel data).
+    Goes through the loader's header cache, so the DicomLoadWorker that
+    later opens the file does not parse the header again.
+    """
+    ds = read_dicom_header(filepath)
+    return {
+        'PatientName': str(getattr(ds, 'PatientName', 'Unknown')),
+        'PatientID': str(getattr(ds, 'PatientID', '')),
+        'StudyDate': str(getattr(ds, 'StudyDate', '')),
+        'StudyDescription': str(getattr(ds, 'StudyDescription', '')),
+        'SeriesNumber': str(getattr(ds, 'SeriesNumber', '1')),
+        'SeriesDescription': str(getattr(ds, 'SeriesDescription', '')),
+        'NumberOfFrames': getattr(ds, 'NumberOfFrames', 1),
+        'Modality': str(getattr(ds, 'Modality', '')),
+        'Manufacturer': str(getattr(ds, 'Manufacturer', '')),
+        'InstitutionName': str(getattr(ds, 'InstitutionName', '')),
+    }
+
+
+class _HeaderSignals(QObject):
+    """Signals for DicomHeaderWorker (QRunnable is not a QObject)."""
+    header_ready = Signal(str, object)  # filepath, metadata dict or None
+
+
+class DicomHeaderWorker(QRunnable):
+    """Reads a DICOM header on the global thread pool."""
+    
+    def __init__(self, filepath):
+        super().__init__()
+        self.filepath = filepath
+        self.signals = _HeaderSignals()
+        # Kept alive by FileListWidget until the result is delivered
+        self.setAutoDelete(False)
+    
+    def run(self):
+        try:
+            metadata = read_study_metadata(self.filepath)
+        except Exception as e:
+            print(f"Failed to parse DICOM hierarchy: {e}")
+            metadata = None
+        self.signals.header_ready.emit(self.filepath, metadata)
+
+
+class _ThumbnailSignals(QObject):
+    """Signals for ThumbnailWorker."""
+    thumbnail_ready = Signal(str, object)  # filepath, QImage or None
+
+
+class ThumbnailWorker(QRunnable):
+    """
+    Decodes the first frame of a DICOM file into a thumbnail QImage on
+    the global thread pool; the QPixmap is made on the GUI thread.
+    """
+    
+    def __init__(self, filepath, size=48):
+        super().__init__()
+        self.filepath = filepath
+        self.size = size
+        self.signals = _ThumbnailSignals()
+        # Kept alive by FileListWidget until the result is delivered
+        self.setAutoDelete(False)
+    
+    def run(self):
+        image = ThumbnailCache.generate_thumbnail_image(self.filepath, self.size)
+        self.signals.thumbnail_ready.emit(self.filepath, image)
+
+
+class _ScanSignals(QObject):
+    """Signals for DicomScanWorker."""
+    files_found = Signal(list)  # batch of DICOM file paths
+    finished = Signal(int)      # total number of files found
+
+
+class DicomScanWorker(QRunnable):
+    """
+    Recursively finds *.dcm files under a folder on the global thread pool.
+    
+    Paths are emitted in batches while the walk is in progress, so the
+    study browser fills progressively. Uses os.scandir, whose directory
+    entries carry the file type, so no per-entry stat is needed.
+    """
+    
+    BATCH_SIZE = 64
+    
+    def __init__(self, folder_path):
+        super().__init__()
+        self.folder_path = folder_path
+        self.signals = _ScanSignals()
+        self._cancelled = False
+        # Kept alive by the owner until finished is delivered
+        self.setAutoDelete(False)
+    
+    def cancel(self):
+        """Stop the walk; no further batches are emitted."""
+        self._cancelled = True
+    
+    def run(self):
+        total = 0
+        batch = []
+        stack = [self.folder_path]
+        while stack and not self._cancelled:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                print(f"Cannot scan {directory}: {e}")
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+                    elif entry.name.lower().endswith('.dcm'):
+                        batch.append(entry.path)
+                except OSError:
+                    continue
+                
+                if len(batch) >= self.BATCH_SIZE:
+                    total += len(batch)
+                    self.signals.files_found.emit(batch)
+                    batch = []
+            # Depth-first, in name order
+            stack.extend(reversed(subdirs))
+        
+        if batch and not self._cancelled:
+            total += len(batch)
+            self.signals.files_found.emit(batch)
+        self.signals.finished.emit(total)
 
 
 class SeriesItemDelegate(QStyledItemDelegate):
-    """Custom delegate for rendering Series items with thumbnails."""
+    """
+    Custom delegate for the study tree: Series items get thumbnails.
+    
+    Row backgrounds (selected / hover) and separators are filled here with
+    shared brushes for every row, instead of through ::item stylesheet
+    rules, which Qt resolves per row on every repaint.
+    """
     
     THUMBNAIL_SIZE = 48
     ITEM_HEIGHT = 56
     PADDING = 4
     
+    # Paint colors, shared instead of rebuilt on every paint call
+    SELECTED_COLOR = QColor(ACCENT_COLOR)
+    HOVER_COLOR = QColor(BORDER_COLOR)
+    SELECTED_BRUSH = QBrush(SELECTED_COLOR)
+    HOVER_BRUSH = QBrush(HOVER_COLOR)
+    THUMB_BORDER_COLOR = QColor("#555555")
+    TEXT_COLOR = QColor("#ffffff")
+    DETAIL_COLOR = QColor("#888888")
+    
     def __init__(self, thumbnail_cache, parent=None):
         super().__init__(parent)
         self.thumbnail_cache = thumbnail_cache
@@ -106,30 +291,41 @@ class SeriesItemDelegate(QStyledItemDelegate):
     def _create_placeholder(self):
         """Create placeholder pixmap for loading thumbnails."""
         pixmap = QPixmap(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE)
-        pixmap.fill(QColor("#3e3e42"))
+        pixmap.fill(self.HOVER_COLOR)
         painter = QPainter(pixmap)
-        painter.setPen(QColor("#888888"))
+        painter.setPen(self.DETAIL_COLOR)
         painter.drawText(pixmap.rect(), Qt.AlignCenter, "...")
         painter.end()
         return pixmap
     
+    def _paint_background(self, painter, option):
+        """Fill the selected / hover background of a row."""
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, self.SELECTED_BRUSH)
+        elif option.state & QStyle.State_MouseOver:
+            painter.fillRect(option.rect, self.HOVER_BRUSH)
+    
     def paint(self, painter, option, index):
         """Custom paint for Series items."""
         # Check if this is a Series item
         item_type = index.data(Qt.UserRole + 2)
         
         if item_type != 'series':
-            # Use default painting for Patient/Study/Other items
-            super().paint(painter, option, index)
+            # Patient/Study/Other items: own background and separator, then
+            # default text/icon painting without the style's highlight
+            self._paint_background(painter, option)
+            painter.setPen(self.HOVER_COLOR)
+            painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+            opt = QStyleOptionViewItem(option)
+            opt.state &= ~(QStyle.State_Selected | QStyle.State_MouseOver)
+            opt.rect = option.rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+            super().paint(painter, opt, index)
             return
         
         filepath = index.data(Qt.UserRole)
         
         # Draw selection background
-        if option.state & QStyle.State_Selected:
-            painter.fillRect(option.rect, QColor("#0078d4"))
-        elif option.state & QStyle.State_MouseOver:
-            painter.fillRect(option.rect, QColor("#3e3e42"))
+        self._paint_background(painter, option)
         
         # Get thumbnail
         thumbnail = self.thumbnail_cache.get(filepath) if filepath else None
@@ -148,7 +344,7 @@ class SeriesItemDelegate(QStyledItemDelegate):
         painter.drawPixmap(thumb_rect, thumbnail)
         
         # Draw border around thumbnail
-        painter.setPen(QColor("#555555"))
+        painter.setPen(self.THUMB_BORDER_COLOR)
         painter.drawRect(thumb_rect)
         
         # Draw text (Series name and frame count)
@@ -160,16 +356,16 @@ class SeriesItemDelegate(QStyledItemDelegate):
         display_text = index.data(Qt.DisplayRole) or ""
         frame_info = index.data(Qt.UserRole + 3) or ""
         
-        painter.setPen(QColor("#ffffff"))
-        painter.setFont(QFont("Segoe UI", 10))
+        painter.setPen(self.TEXT_COLOR)
+        painter.setFont(cached_font("Segoe UI", 10))
         
         # Draw series name
         painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop, display_text)
         
         # Draw frame info in gray
         if frame_info:
-            painter.setPen(QColor("#888888"))
-            painter.setFont(QFont("Segoe UI", 9))
+            painter.setPen(self.DETAIL_COLOR)
+            painter.setFont(cached_font("Segoe UI", 9))
             frame_rect = text_rect.adjusted(0, 18, 0, 0)
             painter.drawText(frame_rect, Qt.AlignLeft | Qt.AlignTop, frame_info)
     
@@ -178,7 +374,89 @@ class SeriesItemDelegate(QStyledItemDelegate):
         item_type = index.data(Qt.UserRole + 2)
         if item_type == 'series':
             return QSize(option.rect.width(), self.ITEM_HEIGHT)
-        return super().sizeHint(option, index)
+        size = super().sizeHint(option, index)
+        return size + QSize(self.PADDING * 2, self.PADDING * 2)
+
+
+class StudyTreeModel(QStandardItemModel):
+    """
+    Item model for the study tree.
+    
+    File items only store their path, type and metadata; tooltips and the
+    frame count line are derived in data() when the view asks for them,
+    which it only does for rows that are actually shown.
+    """
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.ToolTipRole, FileListWidget.ROLE_FRAME_INFO):
+            item_type = super().data(index, FileListWidget.ROLE_ITEM_TYPE)
+            if item_type == 'series':
+                metadata = super().data(index, FileListWidget.ROLE_METADATA) or {}
+                num_frames = metadata.get('NumberOfFrames', 1)
+                if role == FileListWidget.ROLE_FRAME_INFO:
+                    return f"{num_frames} 幀"
+                filepath = super().data(index, FileListWidget.ROLE_FILEPATH)
+                return f"{filepath}\n{num_frames} frames"
+            if item_type == 'other_file' and role == Qt.ToolTipRole:
+                info = super().data(index, FileListWidget.ROLE_METADATA)
+                if info:
+                    filepath = super().data(index, FileListWidget.ROLE_FILEPATH)
+                    return f"{filepath}\n{info}"
+        return super().data(index, role)
+
+
+# File panel stylesheet. Selectors are scoped by object name so the main
+# window can fold it into its single application-wide stylesheet.
+FILE_PANEL_QSS = """
+    QLabel#panelHeader {
+        color: #ffffff;
+        padding: 5px;
+    }
+    QLabel#sectionHeader {
+        color: #ffffff;
+        padding: 5px 5px 0px 5px;
+        margin-top: 8px;
+    }
+    QLabel#panelInfo {
+        color: #888888;
+        font-size: 11px;
+    }
+    QPushButton#iconBtn {
+        background-color: transparent;
+        border: 1px solid %(border)s;
+        border-radius: 4px;
+        font-family: 'lucide';
+        font-size: 14px;
+        color: #ffffff;
+    }
+    QPushButton#iconBtn:hover {
+        background-color: %(accent)s;
+        border-color: %(accent)s;
+    }
+    #filePanel QTreeView {
+        background-color: %(panel)s;
+        color: #ffffff;
+        border: 1px solid %(border)s;
+        border-radius: 4px;
+        outline: none;
+    }
+    #filePanel QTreeView::branch:has-children:closed {
+        image: url(none);
+        border-image: none;
+    }
+    #filePanel QTreeView::branch:has-children:open {
+        image: url(none);
+        border-image: none;
+    }
+    QLabel#patientInfo {
+        color: #aaaaaa;
+        font-size: 11px;
+        padding: 5px;
+        background-color: %(panel)s;
+        border: 1px solid %(border)s;
+        border-radius: 4px;
+    }
+""" % _PALETTE
 
 
 class FileListWidget(QWidget):
@@ -195,10 +473,25 @@ class FileListWidget(QWidget):
         super().__init__(parent)
         self.thumbnail_cache = ThumbnailCache(max_size=50)
         self._patients = {}  # patient_key -> patient_item
+        self._studies = {}  # (patient_key, study_key) -> study_item
         self._other_files_item = None
+        self._path_to_item = {}  # filepath -> series / other-file item
+        self._pending_headers = {}  # filepath -> (DicomHeaderWorker, info)
+        self._pending_selection = None  # filepath to select once its header arrives
+        self._ready_headers = []  # (filepath, metadata) delivered since the last flush
+        self._pending_thumbnails = {}  # filepath -> ThumbnailWorker
+        self._patient_info_cache = {}  # filepath -> patient info HTML
         self.setup_ui()
         
+        # Headers arriving in a burst are inserted together in one pass
+        self._header_flush_timer = QTimer(self)
+        self._header_flush_timer.setSingleShot(True)
+        self._header_flush_timer.setInterval(0)
+        self._header_flush_timer.timeout.connect(self._flush_ready_headers)
+        
     def setup_ui(self):
+        # Styled by FILE_PANEL_QSS through the object names below
+        self.setObjectName("filePanel")
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
@@ -210,46 +503,30 @@ class FileListWidget(QWidget):
         header_layout.setSpacing(5)
         
         header = QLabel(" Studies")
-        header.setFont(QFont("lucide", 12, QFont.Bold))
-        header.setStyleSheet("color: #ffffff; padding: 5px;")
+        header.setFont(cached_font("lucide", 12, QFont.Bold))
+        header.setObjectName("panelHeader")
         header_layout.addWidget(header)
         
         header_layout.addStretch()
         
-        # Icon button style
-        icon_btn_style = """
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                font-family: 'lucide';
-                font-size: 14px;
-                color: #ffffff;
-            }
-            QPushButton:hover {
-                background-color: #0078d4;
-                border-color: #0078d4;
-            }
-        """
-        
         # Open File button (icon only)
         self.open_file_btn = QPushButton("\ue0cd")  # file-plus
         self.open_file_btn.setFixedSize(28, 28)
         self.open_file_btn.setToolTip("Open File")
-        self.open_file_btn.setStyleSheet(icon_btn_style)
+        self.open_file_btn.setObjectName("iconBtn")
         header_layout.addWidget(self.open_file_btn)
         
         # Open Folder button (icon only)
         self.open_folder_btn = QPushButton("\ue246")  # folder-open
         self.open_folder_btn.setFixedSize(28, 28)
         self.open_folder_btn.setToolTip("Open Folder")
-        self.open_folder_btn.setStyleSheet(icon_btn_style)
+        self.open_folder_btn.setObjectName("iconBtn")
         header_layout.addWidget(self.open_folder_btn)
         
         layout.addWidget(header_row)
         
         # Tree view for hierarchical display
-        self.model = QStandardItemModel()
+        self.model = StudyTreeModel()
         self.model.setHorizontalHeaderLabels([""])
         
         self.tree_view = QTreeView()
@@ -264,33 +541,6 @@ class FileListWidget(QWidget):
         self.delegate = SeriesItemDelegate(self.thumbnail_cache, self)
         self.tree_view.setItemDelegate(self.delegate)
         
-        self.tree_view.setStyleSheet("""
-            QTreeView {
-                background-color: #2d2d30;
-                color: #ffffff;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                outline: none;
-            }
-            QTreeView::item {
-                padding: 4px;
-                border-bottom: 1px solid #3e3e42;
-            }
-            QTreeView::item:selected {
-                background-color: #0078d4;
-            }
-            QTreeView::item:hover {
-                background-color: #3e3e42;
-            }
-            QTreeView::branch:has-children:closed {
-                image: url(none);
-                border-image: none;
-            }
-            QTreeView::branch:has-children:open {
-                image: url(none);
-                border-image: none;
-            }
-        """)
         layout.addWidget(self.tree_view)
         
         # Backward compatibility adapter
@@ -298,28 +548,19 @@ class FileListWidget(QWidget):
         
         # Patient Info Section
         patient_header = QLabel(" Patient Info")
-        patient_header.setFont(QFont("lucide", 11, QFont.Bold))
-        patient_header.setStyleSheet("color: #ffffff; padding: 5px 5px 0px 5px; margin-top: 8px;")
+        patient_header.setFont(cached_font("lucide", 11, QFont.Bold))
+        patient_header.setObjectName("sectionHeader")
         layout.addWidget(patient_header)
         
         # Patient info container
         self.patient_info = QLabel("No file loaded")
-        self.patient_info.setStyleSheet("""
-            QLabel {
-                color: #aaaaaa;
-                font-size: 11px;
-                padding: 5px;
-                background-color: #2d2d30;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-            }
-        """)
+        self.patient_info.setObjectName("patientInfo")
         self.patient_info.setWordWrap(True)
         layout.addWidget(self.patient_info)
         
         # Info label
         self.info_label = QLabel("No files loaded")
-        self.info_label.setStyleSheet("color: #888888; font-size: 11px;")
+        self.info_label.setObjectName("panelInfo")
         self.info_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.info_label)
     
@@ -329,11 +570,11 @@ class FileListWidget(QWidget):
             return self._patients[patient_key]
         
         # Create new patient item
-        display_name = f"👤 {patient_name}" if patient_name else "👤 Unknown"
+        display_name = patient_name if patient_name else "Unknown"
         if patient_id:
             display_name += f" ({patient_id})"
         
-        item = QStandardItem(display_name)
+        item = QStandardItem(glyph_icon("👤"), display_name)
         item.setData('patient', self.ROLE_ITEM_TYPE)
         item.setEditable(False)
         
@@ -344,47 +585,74 @@ class FileListWidget(QWidget):
         
         self.model.appendRow(item)
         self._patients[patient_key] = item
+        self.tree_view.expand(self.model.indexFromItem(item))
         return item
     
-    def _get_or_create_study_item(self, patient_item, study_key, study_date, study_desc):
+    def _get_or_create_study_item(self, patient_key, patient_item, study_key, study_date, study_desc):
         """Get or create a study item under a patient."""
-        # Check if study already exists
-        for i in range(patient_item.rowCount()):
-            child = patient_item.child(i)
-            if child and child.data(self.ROLE_STUDY_KEY) == study_key:
-                return child
+        key = (patient_key, study_key)
+        if key in self._studies:
+            return self._studies[key]
         
         # Format date
-        date_str = study_date or "Unknown Date"
-        if len(date_str) == 8:
-            date_str = f"{date_str[:4]}/{date_str[4:6]}/{date_str[6:]}"
+        date_str = format_dicom_date(study_date) if study_date else "Unknown Date"
         
-        display_name = f"📋 {date_str}"
+        display_name = date_str
         if study_desc:
             display_name += f" - {study_desc}"
         
-        item = QStandardItem(display_name)
+        item = QStandardItem(glyph_icon("📋"), display_name)
         item.setData('study', self.ROLE_ITEM_TYPE)
         item.setData(study_key, self.ROLE_STUDY_KEY)
         item.setEditable(False)
         
         patient_item.appendRow(item)
+        self._studies[key] = item
+        self.tree_view.expand(self.model.indexFromItem(item))
         return item
     
     def _get_or_create_other_files_item(self):
         """Get or create the 'Other Files' container."""
         if self._other_files_item is None:
-            item = QStandardItem("📁 其他檔案")
+            item = QStandardItem(glyph_icon("📁"), "其他檔案")
             item.setData('other', self.ROLE_ITEM_TYPE)
             item.setEditable(False)
             self.model.appendRow(item)
             self._other_files_item = item
+            self.tree_view.expand(self.model.indexFromItem(item))
         return self._other_files_item
     
     def add_file(self, filepath, info=None):
         """Add a file to the hierarchical list."""
+        if self._add_file_item(filepath, info):
+            self.update_info()
+    
+    def add_files(self, filepaths, infos=None):
+        """
+        Add many files at once (e.g. a folder scan).
+        
+        The tree is relaid out and repainted, and the info label updated,
+        once for the whole batch instead of once per file.
+        
+        Args:
+            filepaths: Iterable of file paths
+            infos: Optional dict of filepath -> info text
+        """
+        infos = infos or {}
+        added = False
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            for filepath in filepaths:
+                added |= self._add_file_item(filepath, infos.get(filepath))
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
+        if added:
+            self.update_info()
+    
+    def _add_file_item(self, filepath, info=None):
+        """Add one file without refreshing the info label. Returns False if already listed."""
         if self.has_file(filepath):
-            return
+            return False
         
         is_dicom = filepath.lower().endswith('.dcm')
         
@@ -392,23 +660,50 @@ class FileListWidget(QWidget):
             self._add_dicom_file(filepath, info)
         else:
             self._add_other_file(filepath, info)
-        
-        self.update_info()
+        return True
     
     def _add_dicom_file(self, filepath, info=None):
+        """Queue the header read off the GUI thread; the item is added when it arrives."""
+        worker = DicomHeaderWorker(filepath)
+        worker.signals.header_ready.connect(self._on_header_ready)
+        self._pending_headers[filepath] = (worker, info)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_header_ready(self, filepath, metadata):
+        """Queue a read header; queued headers are inserted on the next event loop pass."""
+        self._ready_headers.append((filepath, metadata))
+        if not self._header_flush_timer.isActive():
+            self._header_flush_timer.start()
+    
+    def _flush_ready_headers(self):
+        """Insert all DICOM files whose headers have arrived, in one tree update."""
+        ready, self._ready_headers = self._ready_headers, []
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            for filepath, metadata in ready:
+                _, info = self._pending_headers.pop(filepath, (None, None))
+                if metadata is None:
+                    self._add_other_file(filepath, info)
+                else:
+                    self._insert_dicom_item(filepath, metadata)
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
+        self.update_info()
+        
+        selection = self._pending_selection
+        if selection is not None and selection not in self._pending_headers:
+            self._pending_selection = None
+            self.select_file(selection)
+    
+    def _insert_dicom_item(self, filepath, metadata):
         """Add a DICOM file with hierarchy extraction."""
         try:
-            import pydicom
-            ds = pydicom.dcmread(filepath, stop_before_pixels=True)
-            
-            # Extract DICOM hierarchy info
-            patient_name = str(getattr(ds, 'PatientName', 'Unknown'))
-            patient_id = str(getattr(ds, 'PatientID', ''))
-            study_date = str(getattr(ds, 'StudyDate', ''))
-            study_desc = str(getattr(ds, 'StudyDescription', ''))
-            series_num = str(getattr(ds, 'SeriesNumber', '1'))
-            series_desc = str(getattr(ds, 'SeriesDescription', ''))
-            num_frames = getattr(ds, 'NumberOfFrames', 1)
+            patient_name = metadata['PatientName']
+            patient_id = metadata['PatientID']
+            study_date = metadata['StudyDate']
+            study_desc = metadata['StudyDescription']
+            series_num = metadata['SeriesNumber']
+            series_desc = metadata['SeriesDescription']
             
             # Create hierarchy keys
             patient_key = f"{patient_name}_{patient_id}"
@@ -416,124 +711,99 @@ class FileListWidget(QWidget):
             
             # Get or create hierarchy items
             patient_item = self._get_or_create_patient_item(patient_key, patient_name, patient_id)
-            study_item = self._get_or_create_study_item(patient_item, study_key, study_date, study_desc)
+            study_item = self._get_or_create_study_item(patient_key, patient_item, study_key, study_date, study_desc)
             
             # Create series item
             series_name = series_desc if series_desc else f"Series {series_num}"
             item = QStandardItem(series_name)
             item.setData(filepath, self.ROLE_FILEPATH)
             item.setData('series', self.ROLE_ITEM_TYPE)
-            item.setData(f"{num_frames} 幀", self.ROLE_FRAME_INFO)
             item.setEditable(False)
             
             # Store metadata
-            metadata = {
-                'PatientName': patient_name,
-                'PatientID': patient_id,
-                'StudyDate': study_date,
-                'StudyDescription': study_desc,
-                'SeriesNumber': series_num,
-                'SeriesDescription': series_desc,
-                'NumberOfFrames': num_frames,
-                'Modality': str(getattr(ds, 'Modality', '')),
-                'Manufacturer': str(getattr(ds, 'Manufacturer', '')),
-                'InstitutionName': str(getattr(ds, 'InstitutionName', '')),
-            }
             item.setData(metadata, self.ROLE_METADATA)
-            item.setToolTip(f"{filepath}\n{num_frames} frames")
             
             study_item.appendRow(item)
-            
-            # Expand hierarchy
-            self.tree_view.expand(self.model.indexFromItem(patient_item))
-            self.tree_view.expand(self.model.indexFromItem(study_item))
+            self._path_to_item[filepath] = item
             
             # Generate thumbnail
             self._generate_thumbnail_async(filepath)
             
         except Exception as e:
-            print(f"Failed to parse DICOM hierarchy: {e}")
-            self._add_other_file(filepath, info)
+            print(f"Failed to add DICOM to hierarchy: {e}")
+            self._add_other_file(filepath)
     
     def _add_other_file(self, filepath, info=None):
         """Add a non-DICOM file."""
         other_item = self._get_or_create_other_files_item()
         
         filename = os.path.basename(filepath)
-        item = QStandardItem(f"📄 {filename}")
+        item = QStandardItem(glyph_icon("📄"), filename)
         item.setData(filepath, self.ROLE_FILEPATH)
         item.setData('other_file', self.ROLE_ITEM_TYPE)
         item.setEditable(False)
         
         if info:
-            item.setToolTip(f"{filepath}\n{info}")
             item.setData(info, self.ROLE_METADATA)
         
         other_item.appendRow(item)
-        self.tree_view.expand(self.model.indexFromItem(other_item))
+        self._path_to_item[filepath] = item
     
     def _generate_thumbnail_async(self, filepath):
-        """Generate thumbnail (sync for now)."""
-        if not self.thumbnail_cache.has(filepath):
-            pixmap = ThumbnailCache.generate_thumbnail(filepath, 48)
-            if pixmap:
-                self.thumbnail_cache.put(filepath, pixmap)
-                self.tree_view.viewport().update()
+        """Decode the thumbnail on the thread pool; it is cached when it arrives."""
+        if self.thumbnail_cache.has(filepath) or filepath in self._pending_thumbnails:
+            return
+        worker = ThumbnailWorker(filepath, SeriesItemDelegate.THUMBNAIL_SIZE)
+        worker.signals.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._pending_thumbnails[filepath] = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_thumbnail_ready(self, filepath, image):
+        """Cache a decoded thumbnail and repaint the tree."""
+        self._pending_thumbnails.pop(filepath, None)
+        if image is not None:
+            self.thumbnail_cache.put(filepath, QPixmap.fromImage(image))
+            self.tree_view.viewport().update()
     
     def has_file(self, filepath):
-        """Check if file is already in the list."""
-        return self._find_item_by_filepath(filepath) is not None
-    
-    def _find_item_by_filepath(self, filepath, parent=None):
-        """Recursively find item by filepath."""
-        if parent is None:
-            parent = self.model.invisibleRootItem()
-        
-        for i in range(parent.rowCount()):
-            child = parent.child(i)
-            if child:
-                if child.data(self.ROLE_FILEPATH) == filepath:
-                    return child
-                found = self._find_item_by_filepath(filepath, child)
-                if found:
-                    return found
-        return None
+        """Check if file is already in the list (or waiting for its header)."""
+        return filepath in self._path_to_item or filepath in self._pending_headers
+    
+    def _find_item_by_filepath(self, filepath):
+        """Find the item of a file by filepath."""
+        return self._path_to_item.get(filepath)
     
     def select_file(self, filepath):
         """Select a file in the tree by filepath."""
+        if filepath in self._pending_headers:
+            self._pending_selection = filepath
+            return
         item = self._find_item_by_filepath(filepath)
         if item:
             index = self.model.indexFromItem(item)
             self.tree_view.setCurrentIndex(index)
             self.tree_view.scrollTo(index)
     
-    def update_patient_info(self, metadata):
-        """Update patient info panel with DICOM metadata."""
-        if not metadata:
-            self.patient_info.setText("No metadata available")
-            return
+    def update_patient_info(self, metadata, filepath=None):
+        """
+        Update patient info panel with DICOM metadata.
         
-        lines = []
-        if 'PatientName' in metadata:
-            lines.append(f"<b>Patient:</b> {metadata['PatientName']}")
-        if 'StudyDate' in metadata:
-            date = metadata['StudyDate']
-            if len(date) == 8:
-                date = f"{date[:4]}/{date[4:6]}/{date[6:]}"
-            lines.append(f"<b>Date:</b> {date}")
-        if 'Modality' in metadata:
-            lines.append(f"<b>Modality:</b> {metadata['Modality']}")
-        if 'Manufacturer' in metadata:
-            lines.append(f"<b>Device:</b> {metadata['Manufacturer']}")
-        if 'InstitutionName' in metadata:
-            lines.append(f"<b>Institution:</b> {metadata['InstitutionName']}")
-        if 'NumberOfFrames' in metadata:
-            lines.append(f"<b>Frames:</b> {metadata['NumberOfFrames']}")
-        
-        if lines:
-            self.patient_info.setText("<br>".join(lines))
-        else:
-            self.patient_info.setText("No metadata available")
+        With a filepath the built HTML is kept, so re-selecting the file
+        only sets the text again.
+        """
+        html = self._patient_info_cache.get(filepath) if filepath else None
+        if html is None:
+            lines = []
+            for key, row in _PATIENT_INFO_ROWS:
+                value = metadata.get(key) if metadata else None
+                if value is not None:
+                    if key == 'StudyDate':
+                        value = format_dicom_date(value)
+                    lines.append(row.format(value))
+            html = "<br>".join(lines) if lines else "No metadata available"
+            if filepath and metadata:
+                self._patient_info_cache[filepath] = html
+        self.patient_info.setText(html)
     
     def update_info(self):
         """Update the info label."""
@@ -547,19 +817,7 @@ class FileListWidget(QWidget):
     
     def _count_series(self):
         """Count total series items."""
-        count = 0
-        
-        def count_recursive(parent):
-            nonlocal count
-            for i in range(parent.rowCount()):
-                child = parent.child(i)
-                if child:
-                    if child.data(self.ROLE_ITEM_TYPE) in ('series', 'other_file'):
-                        count += 1
-                    count_recursive(child)
-        
-        count_recursive(self.model.invisibleRootItem())
-        return count
+        return len(self._path_to_item)
 
 
 class _TreeViewListAdapter:
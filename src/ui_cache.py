@@ -0,0 +1,66 @@
+"""
+Shared UI caches: fonts and rendered glyph icons.
+
+Only depends on Qt, so any widget module can use it without pulling in
+the loaders or FAST.
+"""
+
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QFont, QColor, QIcon, QPixmap, QPainter
+
+
+_glyph_icons = {}  # (glyph, size, family, color, checked_color) -> QIcon
+_fonts = {}  # (family, point size, weight) -> QFont
+
+
+def glyph_icon(glyph, size=16, family=None, color=None, checked_color=None):
+    """
+    Render a text glyph (e.g. an emoji or icon-font glyph) into a QIcon.
+    
+    Rendered once per glyph/size/font/colors and shared afterwards, so
+    buttons and item views draw a cached pixmap instead of shaping the
+    glyph on every paint. `checked_color` adds the pixmap used while a
+    checkable button is on. Needs a running QApplication.
+    """
+    key = (glyph, size, family, color, checked_color)
+    icon = _glyph_icons.get(key)
+    if icon is None:
+        icon = QIcon(_glyph_pixmap(glyph, size, family, color))
+        if checked_color is not None:
+            icon.addPixmap(_glyph_pixmap(glyph, size, family, checked_color), QIcon.Normal, QIcon.On)
+        _glyph_icons[key] = icon
+    return icon
+
+
+def _glyph_pixmap(glyph, size, family, color):
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    font = QFont(family) if family else QFont()
+    font.setPixelSize(size - 2)
+    painter.setFont(font)
+    if color is not None:
+        painter.setPen(QColor(color))
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, glyph)
+    painter.end()
+    return pixmap
+
+
+def clear_glyph_icons():
+    """Drop the rendered glyph icons (e.g. after an icon font was registered)."""
+    _glyph_icons.clear()
+
+
+def cached_font(family, point_size, weight=QFont.Normal):
+    """
+    Return a shared QFont for family/size/weight.
+    
+    Built on first use (after the QApplication exists) and reused by
+    every widget and paint call that asks for the same font.
+    """
+    key = (family, point_size, weight)
+    font = _fonts.get(key)
+    if font is None:
+        font = QFont(family, point_size, weight)
+        _fonts[key] = font
+    return font
@@ -13,9 +13,9 @@ import numpy as np
 from PySide2.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
     QPushButton, QFrame, QSizePolicy, QGraphicsOpacityEffect,
-    QButtonGroup, QApplication
+    QButtonGroup
 )
-from PySide2.QtCore import Qt, Signal, QTimer, QSize, QPropertyAnimation, QEasingCurve, QObject, QEvent
+from PySide2.QtCore import Qt, Signal, QTimer, QSize, QPropertyAnimation, QEasingCurve, QEvent
 from PySide2.QtGui import QFont, QColor, QPainter, QPen, QBrush
 from PySide2.QtOpenGL import QGLWidget
 from shiboken2 import wrapInstance
@@ -30,75 +30,48 @@ from .image_processing import (
 )
 
 
-class ViewportEventFilter(QObject):
-    """
-    Application-level event filter to detect viewport clicks.
-    
-    This filter intercepts mouse events at the QApplication level,
-    allowing us to detect clicks on FAST's QGLWidget without
-    interfering with its internal event handling.
-    """
-    
-    def __init__(self, viewport_manager):
-        super().__init__()
-        self.viewport_manager = viewport_manager
-    
-    def eventFilter(self, obj, event):
-        """Filter events to detect viewport clicks."""
-        if event.type() == QEvent.MouseButtonPress:
-            try:
-                # Find which viewport contains the clicked widget
-                viewport = self._find_parent_viewport(obj)
-                if viewport is not None:
-                    if viewport != self.viewport_manager.active_viewport:
-                        self.viewport_manager.set_active_viewport(viewport)
-            except RuntimeError:
-                # Qt object may have been deleted - ignore safely
-                pass
-        
-        # Never block the event - just observe
-        return False
-    
-    def _find_parent_viewport(self, widget):
-        """
-        Find the Viewport that contains the given widget.
-        
-        Traverses the parent chain to find a Viewport ancestor,
-        or checks if the widget belongs to any viewport's container.
-        """
-        from shiboken2 import isValid
-        
-        if widget is None or not isValid(widget):
-            return None
-        
-        # Direct check: is widget a Viewport?
-        if isinstance(widget, Viewport):
-            return widget
-        
-        # Check if widget is inside any viewport's widget tree
-        for vp in self.viewport_manager.viewports:
-            # Check if widget is part of this viewport
-            if self._is_child_of(widget, vp):
-                return vp
-        
-        return None
-    
-    def _is_child_of(self, widget, parent):
-        """
-        Check if widget is a child (direct or indirect) of parent.
-        """
-        from shiboken2 import isValid
-        
-        current = widget
-        while current is not None and isValid(current):
-            if current == parent:
-                return True
-            try:
-                current = current.parent() if hasattr(current, 'parent') else None
-            except RuntimeError:
-                # C++ object deleted
-                return False
-        return False
+# Viewport styles, applied once through the application stylesheet (see
+# qt_gui._GLOBAL_QSS); widgets opt in through their object names
+VIEWPORT_QSS = """
+    #viewportGrid {
+        background-color: #1e1e1e;
+    }
+    QFrame#viewportFrame {
+        background-color: #1e1e1e;
+        border: 2px solid #3e3e42;
+    }
+    QFrame#viewportFrame[active="true"] {
+        border-color: #0078d4;
+    }
+    QLabel#lutOverlay {
+        background: transparent;
+    }
+    QLabel#viewportPlaceholder {
+        color: #888888;
+        font-size: 12px;
+    }
+    #layoutButtons,
+    #layoutButtons QWidget {
+        background-color: rgba(30, 30, 30, 180);
+        border-radius: 4px;
+    }
+    #layoutButtons QPushButton {
+        background-color: transparent;
+        border: 1px solid #555;
+        border-radius: 3px;
+        padding: 2px;
+        min-width: 24px;
+        min-height: 20px;
+    }
+    #layoutButtons QPushButton:hover {
+        background-color: #3e3e42;
+        border-color: #777;
+    }
+    #layoutButtons QPushButton:checked {
+        background-color: #0078d4;
+        border-color: #0078d4;
+    }
+"""
 
 
 class Viewport(QWidget):
@@ -161,6 +134,13 @@ class Viewport(QWidget):
         self.image_height = 0
         self.pixel_spacing = None
         
+        # Camera refit is expensive, so resize bursts (splitter drags,
+        # layout switches) are coalesced into one recalculateCamera call
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._do_recalc_camera)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -171,7 +151,7 @@ class Viewport(QWidget):
         
         # Container for FAST widget
         self.container = QFrame()
-        self.container.setStyleSheet("background-color: #1e1e1e; border: 2px solid #3e3e42;")
+        self.container.setObjectName("viewportFrame")
         self.container.setFrameShape(QFrame.Box)
         container_layout = QVBoxLayout(self.container)
         container_layout.setContentsMargins(0, 0, 0, 0)
@@ -186,20 +166,13 @@ class Viewport(QWidget):
             self.lut_overlay_label = QLabel(self.fast_widget)
             self.lut_overlay_label.setAlignment(Qt.AlignCenter)
             self.lut_overlay_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-            self.lut_overlay_label.setStyleSheet("background: transparent;")
+            self.lut_overlay_label.setObjectName("lutOverlay")
             self.lut_overlay_effect = QGraphicsOpacityEffect(self.lut_overlay_label)
             self.lut_overlay_effect.setOpacity(0.85)
             self.lut_overlay_label.setGraphicsEffect(self.lut_overlay_effect)
             self.lut_overlay_label.hide()
             
-            # Annotation overlay
-            self.annotation_overlay = AnnotationOverlay(self.fast_widget)
-            self.annotation_overlay.raise_()
-            
-            if self.fast_annotation_manager:
-                self.annotation_overlay.set_coord_converter(
-                    self.fast_annotation_manager.coord_converter
-                )
+            # Annotation overlay is built on first use (ensure_annotation_overlay)
             
             # Install event filter to capture clicks on fast_widget
             self.fast_widget.installEventFilter(self)
@@ -207,7 +180,7 @@ class Viewport(QWidget):
             # Placeholder with click support
             self.placeholder = QLabel("點擊此處後載入檔案")
             self.placeholder.setAlignment(Qt.AlignCenter)
-            self.placeholder.setStyleSheet("color: #888888; font-size: 12px;")
+            self.placeholder.setObjectName("viewportPlaceholder")
             container_layout.addWidget(self.placeholder)
         
         layout.addWidget(self.container)
@@ -242,8 +215,37 @@ class Viewport(QWidget):
             self.fast_widget = None
             self.fast_annotation_manager = None
     
+    def ensure_annotation_overlay(self):
+        """
+        Return the annotation overlay, creating it on first use.
+        
+        Most sessions never annotate, so the overlay is only built once a
+        drawing or W/L tool needs it. Returns None without a FAST widget.
+        """
+        if self.annotation_overlay is None and self.fast_widget:
+            self.annotation_overlay = AnnotationOverlay(self.fast_widget)
+            
+            if self.fast_annotation_manager:
+                self.annotation_overlay.set_coord_converter(
+                    self.fast_annotation_manager.coord_converter
+                )
+            
+            # The overlay sits above fast_widget, so clicks in drawing tools
+            # must activate the viewport too
+            self.annotation_overlay.installEventFilter(self)
+            self.annotation_overlay.setGeometry(0, 0, self.fast_widget.width(), self.fast_widget.height())
+            self.annotation_overlay.show()
+            self.annotation_overlay.raise_()
+        return self.annotation_overlay
+    
     def _on_resize(self, event):
-        """Handle container resize."""
+        """
+        Handle container resize.
+        
+        Only the cheap geometry updates run per event; the camera refit
+        (and with it the LUT overlay redraw, which follows view changes)
+        runs once the burst settles, see _do_recalc_camera.
+        """
         if self.fast_widget:
             w, h = self.fast_widget.width(), self.fast_widget.height()
             
@@ -252,16 +254,19 @@ class Viewport(QWidget):
             
             if self.lut_overlay_label:
                 self.lut_overlay_label.setGeometry(0, 0, w, h)
-                self._lut_last_frame_id = -1
             
             if self.fast_annotation_manager:
                 self.fast_annotation_manager.coord_converter.set_widget_size(w, h)
             
-            if self.fast_view and self.current_streamer:
-                try:
-                    self.fast_view.recalculateCamera()
-                except:
-                    pass
+            self._resize_timer.start()
+    
+    def _do_recalc_camera(self):
+        """Refit the FAST camera once the resize burst has settled."""
+        if self.fast_view and self.current_streamer:
+            try:
+                self.fast_view.recalculateCamera()
+            except RuntimeError:
+                pass
     
     def _on_click(self, event):
         """Handle click to activate viewport."""
@@ -270,7 +275,6 @@ class Viewport(QWidget):
     
     def eventFilter(self, obj, event):
         """Event filter to capture mouse clicks on child widgets."""
-        from PySide2.QtCore import QEvent
         if event.type() == QEvent.MouseButtonPress:
             self.activated.emit(self)
         return False  # Don't block the event
@@ -278,10 +282,10 @@ class Viewport(QWidget):
     def set_active(self, active: bool):
         """Set viewport active state."""
         self.is_active = active
-        if active:
-            self.container.setStyleSheet("background-color: #1e1e1e; border: 2px solid #0078d4;")
-        else:
-            self.container.setStyleSheet("background-color: #1e1e1e; border: 2px solid #3e3e42;")
+        # Re-polish so the [active=...] stylesheet rule is picked up
+        self.container.setProperty("active", active)
+        self.container.style().unpolish(self.container)
+        self.container.style().polish(self.container)
     
     def load_streamer(self, streamer, filepath: str, metadata: dict = None,
                       pixel_spacing: float = None, image_width: int = 0, image_height: int = 0,
@@ -320,10 +324,6 @@ class Viewport(QWidget):
         if not self.current_streamer or not self.fast_view:
             return
         
-        # Stop any existing rendering
-        if self.renderer:
-            self.fast_view.removeAllRenderers()
-        
         try:
             # Filter processor
             FilterProcessorClass = create_filter_processor()
@@ -338,16 +338,16 @@ class Viewport(QWidget):
             self.lut_overlay_processor = self.pipeline_frame_tap_processor
             self._lut_last_frame_id = -1
             
-            # Renderer
-            self.renderer = fast.ImageRenderer.create()
+            # Renderer: created and added to the view once, then reconnected
+            # to each new stream so switching files keeps its GPU resources
+            if self.renderer is None:
+                self.renderer = fast.ImageRenderer.create()
+                self.fast_view.removeAllRenderers()
+                self.fast_view.addRenderer(self.renderer)
             self.renderer.connect(self.pipeline_frame_tap_processor)
             self.renderer.setIntensityLevel(self.intensity_level)
             self.renderer.setIntensityWindow(self.intensity_window)
             
-            # Setup view
-            self.fast_view.removeAllRenderers()
-            self.fast_view.addRenderer(self.renderer)
-            
             # Note: FAST LineRenderer is disabled - Qt AnnotationOverlay handles all rendering
             
             # Use shared thread if provided, otherwise create own (legacy mode)
@@ -370,7 +370,7 @@ class Viewport(QWidget):
         if self.computation_thread:
             try:
                 self.computation_thread.stop()
-            except:
+            except RuntimeError:
                 pass
             self.computation_thread = None
         self.is_playing = False
@@ -427,6 +427,7 @@ class Viewport(QWidget):
         self.stop_pipeline()
         self.current_streamer = None
         self.current_file = None
+        self.renderer = None  # Removed from the view below, recreated on next load
         if self.fast_view:
             self.fast_view.removeAllRenderers()
 
@@ -465,40 +466,15 @@ class LayoutButtonWidget(QWidget):
         layout.setSpacing(2)
         
         self.setFixedHeight(32)
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(30, 30, 30, 180);
-                border-radius: 4px;
-            }
-        """)
+        self.setObjectName("layoutButtons")
         
         self.button_group = QButtonGroup(self)
         self.button_group.setExclusive(True)
         self.buttons = {}
         
-        btn_style = """
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #555;
-                border-radius: 3px;
-                padding: 2px;
-                min-width: 24px;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #3e3e42;
-                border-color: #777;
-            }
-            QPushButton:checked {
-                background-color: #0078d4;
-                border-color: #0078d4;
-            }
-        """
-        
         for layout_name in ['1x1', '1x2', '2x1', '2x2']:
             btn = QPushButton()
             btn.setCheckable(True)
-            btn.setStyleSheet(btn_style)
             btn.setToolTip(self._get_tooltip(layout_name))
             btn.clicked.connect(lambda checked=False, name=layout_name: self._on_layout_clicked(name))
             
@@ -630,16 +606,10 @@ class ViewportManager(QWidget):
         self._shared_computation_thread = None
         self._thread_started = False
         
-        # Application-level event filter for viewport activation
-        self._event_filter = None
-        
         self._setup_ui()
         self._create_viewports()
         self._apply_layout('1x1')
         
-        # Install application-level event filter
-        self._install_event_filter()
-        
         # Timer for updating annotation overlays (syncs with FAST view matrix)
         self._annotation_update_timer = QTimer(self)
         self._annotation_update_timer.timeout.connect(self._update_annotation_overlays)
@@ -653,7 +623,7 @@ class ViewportManager(QWidget):
         
         # Container for viewports
         self.viewport_container = QWidget()
-        self.viewport_container.setStyleSheet("background-color: #1e1e1e;")
+        self.viewport_container.setObjectName("viewportGrid")
         self.grid_layout = QGridLayout(self.viewport_container)
         self.grid_layout.setContentsMargins(2, 2, 2, 2)
         self.grid_layout.setSpacing(2)
@@ -715,8 +685,9 @@ class ViewportManager(QWidget):
             self.set_active_viewport(self.viewports[0])
     
     def _on_viewport_activated(self, viewport: Viewport):
-        """Handle viewport activation."""
-        self.set_active_viewport(viewport)
+        """Handle viewport activation (clicks inside a viewport)."""
+        if viewport is not self.active_viewport:
+            self.set_active_viewport(viewport)
     
     def set_layout(self, layout_name: str):
         """Set the current layout."""
@@ -758,20 +729,15 @@ class ViewportManager(QWidget):
         )
         self.layout_buttons.raise_()
     
-    def _install_event_filter(self):
-        """Install application-level event filter for viewport activation."""
-        app = QApplication.instance()
-        if app:
-            self._event_filter = ViewportEventFilter(self)
-            app.installEventFilter(self._event_filter)
-    
-    def _remove_event_filter(self):
-        """Remove event filter (call on cleanup)."""
-        if self._event_filter:
-            app = QApplication.instance()
-            if app:
-                app.removeEventFilter(self._event_filter)
-            self._event_filter = None
+    def hideEvent(self, event):
+        """Pause overlay syncing while hidden (e.g. window minimized)."""
+        self._annotation_update_timer.stop()
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        """Resume overlay syncing when shown again."""
+        super().showEvent(event)
+        self._annotation_update_timer.start(50)
     
     def _update_annotation_overlays(self):
         """
@@ -824,13 +790,12 @@ class ViewportManager(QWidget):
         if self._shared_computation_thread and self._thread_started:
             try:
                 self._shared_computation_thread.stop()
-            except:
+            except RuntimeError:
                 pass
             self._thread_started = False
     
     def cleanup(self):
         """Cleanup resources."""
-        self._remove_event_filter()
         self.stop_computation_thread()
         
         # Cleanup viewports